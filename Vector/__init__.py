@@ -1,4 +1,15 @@
-from Vector.vector import Vector2, Vector3, Vector4
+from Vector.vector import Vector2, Vector3, Vector4, VectorN, FrozenVector2, FrozenVector3, FrozenVector4
+from Vector.batch import Vector2Array, Vector3Array, Vector4Array, VectorNArray
+from Vector.rotation import Rotation2D, Rotation3D
+from Vector.quaternion import Quaternion, FrozenQuaternion
+from Vector.matrix import Matrix2, Matrix3, Matrix4
+from Vector.store import VectorStore
+from Vector.serialize import VectorReader, VectorWriter
+from Vector.spatial import KDTree, UniformGrid
+from Vector.cache import CachedVector2, CachedVector3, LRUCache, cache_stats
+from Vector.expression import Expression, lazy
+from Vector.stream import Stream
+from Vector.stats import Statistics
 
 VERSION = 1.0
 IS_STABLE = False
\ No newline at end of file
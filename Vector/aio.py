@@ -0,0 +1,165 @@
+"""이벤트 루프를 막지 않고 벡터 배열의 연산을 실행하기 위한 asyncio 모듈
+
+배열을 청크로 나누어 각 청크를 실행기(기본값은 이벤트 루프의 스레드 풀)에서 계산하고,
+청크 사이마다 이벤트 루프에 제어를 돌려주므로 큰 배열을 처리하는 동안에도 다른 코루틴이 실행됨.
+
+    normalized = await transform(Vector3Array.normalize, batch)
+    await apply(methodcaller("rotate", Vector3(roll, pitch, yaw)), batch)
+
+    async for chunk in transform_stream(Vector3Array.normalize, samples_from_socket(), max_pending=4):
+        ...
+
+transform_stream은 비동기 반복자로 받은 벡터들을 chunk_size개씩 묶어 처리하며, 처리되지 않은 청크가
+max_pending개 쌓이면 입력을 더 읽지 않으므로(backpressure) 메모리가 일정하게 유지됨.
+실행기로 ProcessPoolExecutor를 사용하는 경우 함수는 피클링이 가능해야 함.
+"""
+
+from __future__ import annotations
+import asyncio
+from array import array
+from concurrent.futures import Executor
+from contextlib import suppress
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from Vector.batch import VectorArray
+from Vector.parallel import BatchExecutor, ChunkFunction, _apply_chunk, _as_batch
+from Vector.vector import Vector
+
+_END = object()
+
+
+def _bounds(batch: VectorArray, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """각 청크의 버퍼상 [시작, 끝) 위치를 순서대로 반환함.
+
+    Raises:
+        ValueError: 청크의 크기가 1보다 작을 때 발생하는 에러.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be positive.")
+    demention = batch.demention
+    count = len(batch)
+    for start in range(0, count, chunk_size):
+        yield start * demention, min(start + chunk_size, count) * demention
+
+
+def _transform_chunk(function: ChunkFunction, chunk: VectorArray) -> VectorArray:
+    """청크에 함수를 적용한 결과를 반환함. 함수가 None을 반환하면 청크가 직접 수정된 것으로 봄."""
+    result = function(chunk)
+    return chunk if result is None else result
+
+
+async def transform(
+    function: ChunkFunction,
+    vectors: VectorArray | Iterable[Vector],
+    chunk_size: int = 65536,
+    executor: Executor | None = None,
+) -> VectorArray:
+    """벡터들을 청크로 나누어 실행기에서 함수를 적용한 결과를 새로운 벡터 배열로 반환함. 주어진 벡터들은 바뀌지 않음.
+
+    Args:
+        function (ChunkFunction): 벡터 배열을 받아 같은 길이의 벡터 배열을 반환하거나,
+            받은 배열을 직접 수정하고 None을 반환하는 함수.
+        vectors (VectorArray | Iterable[Vector]): 처리할 벡터 배열, 혹은 같은 차원의 벡터들.
+        chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 65536.
+        executor (Executor | None, optional): 청크를 실행할 실행기. None일 시 이벤트 루프의 기본 실행기. Defaults to None.
+
+    Raises:
+        ValueError: 청크의 크기가 1보다 작거나, 함수의 결과의 길이가 청크와 다를 때 발생하는 에러.
+
+    Returns:
+        VectorArray: 결과 벡터 배열.
+    """
+    batch = _as_batch(vectors)
+    loop = asyncio.get_running_loop()
+    result = array(batch._typecode)
+    for start, stop in _bounds(batch, chunk_size):
+        chunk = BatchExecutor._chunk(batch, start, stop)
+        result.extend(await loop.run_in_executor(executor, _apply_chunk, function, chunk))
+    return batch._wrap(result)
+
+
+async def apply(
+    function: ChunkFunction,
+    batch: VectorArray,
+    chunk_size: int = 65536,
+    executor: Executor | None = None,
+) -> None:
+    """벡터 배열을 청크로 나누어 실행기에서 함수를 적용하고, 청크마다 결과를 같은 배열에 씀.
+
+    처리 중에도 다른 코루틴이 실행되므로, 끝날 때까지 배열의 길이를 바꾸지 않아야 함.
+
+    Args:
+        function (ChunkFunction): 벡터 배열을 받아 같은 길이의 벡터 배열을 반환하거나,
+            받은 배열을 직접 수정하고 None을 반환하는 함수.
+        batch (VectorArray): 처리할 벡터 배열.
+        chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 65536.
+        executor (Executor | None, optional): 청크를 실행할 실행기. None일 시 이벤트 루프의 기본 실행기. Defaults to None.
+
+    Raises:
+        ValueError: 청크의 크기가 1보다 작거나, 함수의 결과의 길이가 청크와 다를 때 발생하는 에러.
+    """
+    loop = asyncio.get_running_loop()
+    for start, stop in _bounds(batch, chunk_size):
+        chunk = BatchExecutor._chunk(batch, start, stop)
+        batch.data[start:stop] = await loop.run_in_executor(executor, _apply_chunk, function, chunk)
+
+
+async def _produce(source: AsyncIterable[Vector], queue: asyncio.Queue[Any], chunk_size: int) -> None:
+    """비동기 반복자의 벡터들을 chunk_size개씩 벡터 배열로 묶어 큐에 넣음. 큐가 가득 차면 읽기를 멈춤.
+
+    입력이 끝나면 _END를, 에러가 발생하면 에러를 큐에 넣어 소비하는 쪽에 알림.
+    """
+    try:
+        vectors: list[Vector] = []
+        async for vector in source:
+            vectors.append(vector)
+            if len(vectors) == chunk_size:
+                await queue.put(_as_batch(vectors))
+                vectors = []
+        if vectors:
+            await queue.put(_as_batch(vectors))
+    except Exception as error:
+        await queue.put(error)
+    else:
+        await queue.put(_END)
+
+
+async def transform_stream(
+    function: ChunkFunction,
+    source: AsyncIterable[Vector],
+    chunk_size: int = 4096,
+    max_pending: int = 4,
+    executor: Executor | None = None,
+) -> AsyncIterator[VectorArray]:
+    """비동기 반복자로 들어오는 벡터들을 청크로 묶어 실행기에서 함수를 적용하고, 결과를 순서대로 반환함.
+
+    입력은 별도의 태스크에서 읽으며, 처리를 기다리는 청크가 max_pending개가 되면 입력을 더 읽지 않음.
+
+    Args:
+        function (ChunkFunction): 벡터 배열을 받아 벡터 배열을 반환하거나, 받은 배열을 직접 수정하고 None을
+            반환하는 함수. 결과의 길이와 차원은 청크와 달라도 됨.
+        source (AsyncIterable[Vector]): 같은 차원의 벡터들을 반환하는 비동기 반복자.
+        chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 4096.
+        max_pending (int, optional): 처리를 기다리며 쌓아둘 수 있는 청크의 최대 개수. Defaults to 4.
+        executor (Executor | None, optional): 청크를 실행할 실행기. None일 시 이벤트 루프의 기본 실행기. Defaults to None.
+
+    Raises:
+        ValueError: 청크의 크기, 혹은 쌓아둘 청크의 개수가 1보다 작을 때 발생하는 에러.
+
+    Yields:
+        AsyncIterator[VectorArray]: 각 청크에 함수를 적용한 결과.
+    """
+    if chunk_size < 1 or max_pending < 1:
+        raise ValueError("The chunk size and the number of pending chunks must be positive.")
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue(max_pending)
+    producer = asyncio.create_task(_produce(source, queue, chunk_size))
+    try:
+        while (chunk := await queue.get()) is not _END:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield await loop.run_in_executor(executor, _transform_chunk, function, chunk)
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
@@ -0,0 +1,992 @@
+"""여러 개의 벡터를 하나의 연속된 버퍼에 저장하고 일괄 연산하기 위한 모듈"""
+
+from __future__ import annotations
+from array import array
+from itertools import chain, cycle, repeat
+from math import asin, atan2, cos, hypot, sin
+from operator import add, floordiv, ge, getitem, mod, mul, neg, sub, truediv
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.vector import Vector, Vector2, Vector3, Vector4, VectorN, _import_numpy, _is_real_num
+
+
+def _defers_to_numpy(other: Any) -> bool:
+    """연산의 우항이 NumPy 배열처럼 __array_ufunc__를 구현한 객체인지 확인함. 실수는 스칼라로 연산함."""
+    return hasattr(other, "__array_ufunc__") and not isinstance(other, VectorArray) and not _is_real_num(other)
+
+
+# 연산자와 같은 의미로 처리할 NumPy ufunc의 이름
+_UFUNC_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "add": add,
+    "subtract": sub,
+    "multiply": mul,
+    "divide": truediv,
+    "true_divide": truediv,
+    "floor_divide": floordiv,
+    "remainder": mod,
+}
+
+
+def _as_ndarray(value: Any) -> Any:
+    """벡터 배열이면 내부 버퍼를 공유하는 NumPy 배열로, 아니면 그대로 반환함."""
+    return value.__array__() if isinstance(value, VectorArray) else value
+
+
+def _optional_numpy() -> Any:
+    """NumPy가 설치되어 있으면 numpy 모듈을, 아니면 None을 반환함."""
+    try:
+        return _import_numpy()
+    except ImportError:
+        return None
+
+
+# 저장 정밀도별 array의 자료형 코드
+_TYPECODES: dict[str, str] = {"float32": "f", "float64": "d"}
+_DTYPES: dict[str, str] = {typecode: dtype for dtype, typecode in _TYPECODES.items()}
+
+
+def _typecode_of(dtype: str) -> str:
+    """정밀도의 이름을 array의 자료형 코드로 변환함.
+
+    Raises:
+        ValueError: "float32", "float64"가 아닌 이름이 주어졌을 때 발생하는 에러.
+    """
+    try:
+        return _TYPECODES[dtype]
+    except KeyError:
+        raise ValueError("The dtype must be 'float32' or 'float64'.") from None
+
+
+def _select(mask: Iterable[bool], if_true: Iterable[float], if_false: Iterable[float]) -> Iterator[float]:
+    """mask가 True인 위치는 if_true에서, False인 위치는 if_false에서 값을 고름. 두 값은 모두 계산됨."""
+    return map(getitem, zip(if_false, if_true), mask)
+
+
+class VectorArray:
+    """같은 차원의 벡터 여러 개를 하나의 실수 버퍼에 저장하기 위한 클래스.
+
+    각 벡터의 성분은 [x0, y0, x1, y1, ...] 처럼 하나의 ``array('d')`` 에 연속으로 저장되며,
+    모든 연산은 버퍼 전체에 대해 한 번에 수행됨.
+
+    dtype="float32"로 생성하면 ``array('f')`` 에 저장되어 메모리를 절반만 사용함. 연산 결과도 같은
+    정밀도로 저장되며, 정밀도가 다른 배열끼리의 연산은 astype으로 명시적으로 변환해야 함.
+    """
+
+    __slots__ = ("_data",)
+
+    _DEMENTION: int = 0
+    _VECTOR_TYPE: type[Vector] = Vector
+
+    def __init__(self, vectors: Iterable[Vector] = (), dtype: str = "float64") -> None:
+        """벡터들을 하나의 버퍼로 묶음.
+
+        Args:
+            vectors (Iterable[Vector], optional): 저장할 벡터들. Defaults to ().
+            dtype (str, optional): 저장 정밀도. "float32" 또는 "float64". Defaults to "float64".
+
+        Raises:
+            TypeError: 해당 배열의 차원과 다른 벡터가 주어졌을 때 발생하는 에러.
+            ValueError: 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+        """
+        data = array(_typecode_of(dtype))
+        for vector in vectors:
+            if not isinstance(vector, self._VECTOR_TYPE):
+                raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+            data.extend(vector)
+        self._data = data
+
+    @classmethod
+    def from_components(cls, *components: Iterable[float], dtype: str = "float64") -> VectorArray:
+        """각 축의 성분 시퀀스로부터 벡터 배열을 생성함.
+
+        Args:
+            *components (Iterable[float]): 각 축의 성분. 차원의 수만큼 주어져야 함.
+            dtype (str, optional): 저장 정밀도. "float32" 또는 "float64". Defaults to "float64".
+
+        Raises:
+            ValueError: 성분 시퀀스의 수가 차원과 다르거나 길이가 서로 다를 때,
+                    혹은 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 생성된 벡터 배열.
+        """
+        typecode = _typecode_of(dtype)
+        if len(components) != cls._DEMENTION:
+            raise ValueError("The number of component sequences must match the demention.")
+        columns = [array(typecode, component) for component in components]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All component sequences must have the same length.")
+        return cls._wrap(array(typecode, chain.from_iterable(zip(*columns))))
+
+    @classmethod
+    def zeros(cls, count: int, dtype: str = "float64") -> VectorArray:
+        """모든 성분이 0.0인 벡터 배열을 생성함.
+
+        Args:
+            count (int): 벡터의 개수.
+            dtype (str, optional): 저장 정밀도. "float32" 또는 "float64". Defaults to "float64".
+
+        Raises:
+            ValueError: 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 생성된 벡터 배열.
+        """
+        return cls._wrap(array(_typecode_of(dtype), [0.0]) * (cls._DEMENTION * count))
+
+    @classmethod
+    def from_numpy(cls, values: Any) -> VectorArray:
+        """(N, 차원) 형태의 float32, 혹은 float64 NumPy 배열을 복사하지 않고 벡터 배열로 감쌈.
+
+        반환된 배열은 주어진 NumPy 배열과 메모리와 정밀도를 공유하며, 크기를 바꿀 수 없음.
+
+        Args:
+            values (Any): (N, 차원) 형태의 C-연속 float32, 혹은 float64 NumPy 배열.
+
+        Raises:
+            TypeError: float32, float64가 아닌 배열이 주어졌을 때 발생하는 에러.
+            ValueError: 배열의 형태가 (N, 차원)이 아니거나 C-연속이 아닐 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 생성된 벡터 배열.
+        """
+        numpy = _import_numpy()
+        if (
+            not isinstance(values, numpy.ndarray)
+            or values.ndim != 2
+            or values.shape[1] != cls._DEMENTION
+        ):
+            raise ValueError(f"Expected an array of shape (N, {cls._DEMENTION}).")
+        if values.dtype.name not in _TYPECODES:
+            raise TypeError("Only float32 and float64 arrays can be wrapped without copying.")
+        if not values.flags.c_contiguous:
+            raise ValueError("Only C-contiguous arrays can be wrapped without copying.")
+        return cls._wrap(memoryview(values).cast("B").cast(_TYPECODES[values.dtype.name]))
+
+    @classmethod
+    def _from_ndarray(cls, values: Any, typecode: str = "d") -> VectorArray:
+        """NumPy 연산 결과를 주어진 정밀도로 복사하여 크기를 바꿀 수 있는 벡터 배열로 만듦."""
+        data = array(typecode)
+        data.frombytes(values.astype(data.typecode, copy=False).tobytes())
+        return cls._wrap(data)
+
+    @classmethod
+    def _wrap(cls, data: Any) -> VectorArray:
+        """주어진 버퍼를 복사하지 않고 벡터 배열로 감쌈."""
+        batch = cls.__new__(cls)
+        batch._data = data
+        return batch
+
+    @property
+    def demention(self) -> int:
+        """해당 배열에 저장된 벡터의 차원을 반환합니다.
+
+        Returns:
+            int: 차원
+        """
+        return self._DEMENTION
+
+    @property
+    def data(self) -> Any:
+        """성분이 연속으로 저장된 내부 버퍼를 반환함.
+
+        Returns:
+            Any: [x0, y0, ..., x1, y1, ...] 형태의 버퍼.
+        """
+        return self._data
+
+    @property
+    def _typecode(self) -> str:
+        """내부 버퍼의 자료형 코드. ("f" 또는 "d")"""
+        data = self._data
+        return data.typecode if isinstance(data, array) else data.format
+
+    @property
+    def dtype(self) -> str:
+        """성분의 저장 정밀도를 반환함.
+
+        Returns:
+            str: "float32" 또는 "float64".
+        """
+        return _DTYPES[self._typecode]
+
+    def astype(self, dtype: str) -> VectorArray:
+        """주어진 정밀도로 변환한 복사본을 반환함. float64에서 float32로 변환할 시 가장 가까운 값으로 반올림됨.
+
+        Args:
+            dtype (str): 변환할 정밀도. "float32" 또는 "float64".
+
+        Raises:
+            ValueError: 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 변환된 벡터 배열.
+        """
+        return self._wrap(array(_typecode_of(dtype), self._data))
+
+    def component(self, index: int) -> array:
+        """모든 벡터의 특정 축 성분을 모아 반환함.
+
+        Args:
+            index (int): 축의 번호. (X: 0, Y: 1, ...)
+
+        Raises:
+            IndexError: 차원을 벗어난 축 번호가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            array: 해당 축의 성분들.
+        """
+        if not -self._DEMENTION <= index < self._DEMENTION:
+            raise IndexError
+        return array(self._typecode, self._data[index % self._DEMENTION :: self._DEMENTION])
+
+    def append(self, vector: Vector) -> None:
+        """배열의 끝에 벡터를 추가함.
+
+        Args:
+            vector (Vector): 추가할 벡터.
+
+        Raises:
+            TypeError: 해당 배열의 차원과 다른 벡터가 주어졌거나, 외부 버퍼를 감싼 배열일 때 발생하는 에러.
+        """
+        if not isinstance(vector, self._VECTOR_TYPE):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        self._check_resizable()
+        self._data.extend(vector)
+
+    def extend(self, vectors: Iterable[Vector]) -> None:
+        """배열의 끝에 여러 벡터를 추가함.
+
+        Args:
+            vectors (Iterable[Vector]): 추가할 벡터들.
+        """
+        self._check_resizable()
+        if isinstance(vectors, type(self)):
+            self._data.extend(vectors._data)
+            return
+        for vector in vectors:
+            self.append(vector)
+
+    def _check_resizable(self) -> None:
+        """내부 버퍼의 크기를 바꿀 수 있는지 확인함.
+
+        Raises:
+            TypeError: from_numpy 등으로 외부 버퍼를 감싼 배열일 때 발생하는 에러.
+        """
+        if not isinstance(self._data, array):
+            raise TypeError("Batches wrapping an external buffer cannot be resized.")
+
+    def norm(self) -> array:
+        """각 벡터의 크기를 구함.
+
+        Returns:
+            array: 각 벡터의 크기.
+        """
+        values = iter(self._data)
+        return array(self._typecode, map(hypot, *[values] * self._DEMENTION))
+
+    def norm_squared(self) -> array:
+        """각 벡터의 크기의 제곱을 구함.
+
+        Returns:
+            array: 각 벡터의 크기의 제곱.
+        """
+        return self * self
+
+    def dot(self, other: VectorArray | Vector) -> array:
+        """각 벡터의 내적을 계산함.
+
+        Args:
+            other (VectorArray | Vector): 내적할 벡터 배열, 혹은 벡터.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            array: 각 벡터의 연산 결과. (스칼라)
+        """
+        if not isinstance(other, (type(self), self._VECTOR_TYPE)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        return self * other
+
+    def distance(self, other: VectorArray | Vector) -> array:
+        """각 벡터 사이의 거리를 구함. 중간 벡터 배열을 생성하지 않음.
+
+        Args:
+            other (VectorArray | Vector): 거리를 구할 벡터 배열, 혹은 벡터.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            array: 각 벡터 사이의 거리.
+        """
+        if not isinstance(other, (type(self), self._VECTOR_TYPE)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        differences = map(sub, self._data, self._operand(other))
+        return array(self._typecode, map(hypot, *[differences] * self._DEMENTION))
+
+    def distance_squared(self, other: VectorArray | Vector) -> array:
+        """각 벡터 사이의 거리의 제곱을 구함. 중간 벡터 배열을 생성하지 않음.
+
+        Args:
+            other (VectorArray | Vector): 거리를 구할 벡터 배열, 혹은 벡터.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            array: 각 벡터 사이의 거리의 제곱.
+        """
+        if not isinstance(other, (type(self), self._VECTOR_TYPE)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        typecode = self._typecode
+        differences = array(typecode, map(sub, self._data, self._operand(other)))
+        squares = map(mul, differences, differences)
+        return array(typecode, map(sum, zip(*[squares] * self._DEMENTION)))
+
+    def pairwise_distance(
+        self, other: VectorArray | None = None, squared: bool = False
+    ) -> list[array]:
+        """두 벡터 배열의 모든 벡터 쌍 사이의 거리 행렬을 구함.
+
+        Args:
+            other (VectorArray | None, optional): 거리를 구할 벡터 배열. None일 시 해당 배열 자신과 비교함.
+                Defaults to None.
+            squared (bool, optional): True일 시 거리의 제곱을 구함. Defaults to False.
+
+        Raises:
+            TypeError: 타 차원의 벡터 배열과 연산하는 경우 발생하는 에러.
+
+        Returns:
+            list[array]: i번째 행의 j번째 값이 self[i]와 other[j] 사이의 거리인 행렬.
+        """
+        if other is None:
+            other = self
+        if not isinstance(other, type(self)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        self._operand(other)
+        typecode = self._typecode
+        columns = [other.component(i) for i in range(self._DEMENTION)]
+        values = iter(self._data)
+        rows = []
+        for point in zip(*[values] * self._DEMENTION):
+            differences = [map(sub, column, repeat(value)) for column, value in zip(columns, point)]
+            if squared:
+                differences = [array(typecode, difference) for difference in differences]
+                squares = [map(mul, difference, difference) for difference in differences]
+                rows.append(array(typecode, map(sum, zip(*squares))))
+            else:
+                rows.append(array(typecode, map(hypot, *differences)))
+        return rows
+
+    def normalize(self) -> None:
+        """배열의 모든 벡터를 단위 벡터로 변환함."""
+        self._data[:] = array(
+            self._typecode, map(truediv, self._data, self._repeat_each(self.norm()))
+        )
+
+    def _repeat_each(self, values: Iterable[float]) -> Iterator[float]:
+        """각 벡터마다 하나씩 주어진 값을 성분 수만큼 반복함."""
+        return chain.from_iterable(map(repeat, values, repeat(self._DEMENTION)))
+
+    def _operand(self, other: Any) -> Iterable[float]:
+        """연산의 우항을 버퍼와 같은 길이의 실수열로 변환함.
+
+        벡터, 벡터 배열, 스칼라가 아닌 자료형(지연 계산 식 등)은 NotImplemented를 반환하여
+        상대 피연산자의 반사 연산자로 넘김.
+
+        Raises:
+            TypeError: 타 차원의 벡터, 혹은 정밀도가 다른 배열과 연산하는 경우 발생하는 에러.
+            ValueError: 길이가 다른 배열과 연산하는 경우 발생하는 에러.
+        """
+        if isinstance(other, type(self)):
+            if other._typecode != self._typecode:
+                raise TypeError(
+                    "Operations cannot be performed with batches of different precision. "
+                    "Use astype() to convert explicitly."
+                )
+            if len(other._data) != len(self._data):
+                raise ValueError("Operations cannot be performed with batches of different length.")
+            return other._data
+        if isinstance(other, self._VECTOR_TYPE):
+            return cycle(tuple(other))
+        if _is_real_num(other):
+            return repeat(float(other))
+        if isinstance(other, (Vector, VectorArray)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        return NotImplemented
+
+    def _elementwise(self, operator: Callable[[float, float], float], other: Any) -> VectorArray:
+        """버퍼 전체에 대해 성분별 연산을 수행함.
+
+        NumPy 배열과의 연산은 NotImplemented를 반환하여 NumPy의 ufunc 연산(__array_ufunc__)으로 넘기며,
+        지연 계산 식 등 알 수 없는 자료형과의 연산도 NotImplemented를 반환함.
+        """
+        if _defers_to_numpy(other):
+            return NotImplemented
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        return self._wrap(array(self._typecode, map(operator, self._data, operand)))
+
+    def __add__(self, other: VectorArray | Vector | int | float) -> VectorArray:
+        """각 벡터의 합을 계산함.
+
+        Args:
+            other (VectorArray | Vector | int | float): 더해질 벡터 배열, 벡터, 혹은 스칼라.
+
+        Returns:
+            VectorArray: 연산 결과.
+        """
+        return self._elementwise(add, other)
+
+    def __sub__(self, other: VectorArray | Vector | int | float) -> VectorArray:
+        """각 벡터의 차를 계산함.
+
+        Args:
+            other (VectorArray | Vector | int | float): 빠질 벡터 배열, 벡터, 혹은 스칼라.
+
+        Returns:
+            VectorArray: 연산 결과.
+        """
+        return self._elementwise(sub, other)
+
+    def __mul__(self, other: VectorArray | Vector | int | float) -> array:
+        """각 벡터의 내적을 계산함.
+
+        Args:
+            other (VectorArray | Vector | int | float): 내적할 벡터 배열, 벡터, 혹은 스칼라.
+
+        Returns:
+            array: 각 벡터의 연산 결과. (스칼라)
+        """
+        if _defers_to_numpy(other):
+            return NotImplemented
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        products = map(mul, self._data, operand)
+        return array(self._typecode, map(sum, zip(*[products] * self._DEMENTION)))
+
+    def __truediv__(self, other: VectorArray | Vector | int | float) -> VectorArray:
+        """각 벡터의 나눗셈을 계산함.
+
+        Args:
+            other (VectorArray | Vector | int | float): 나눗셈에서의 제수.
+
+        Returns:
+            VectorArray: 연산 결과.
+        """
+        return self._elementwise(truediv, other)
+
+    def __floordiv__(self, other: VectorArray | Vector | int | float) -> VectorArray:
+        """각 벡터의 나눗셈. 소수점이 아닌, 몫을 계산.
+
+        Args:
+            other (VectorArray | Vector | int | float): 나눗셈에서의 제수.
+
+        Returns:
+            VectorArray: 연산 결과.
+        """
+        return self._elementwise(floordiv, other)
+
+    def __mod__(self, other: VectorArray | Vector | int | float) -> VectorArray:
+        """각 벡터의 나눗셈. 소수점이 아닌, 나머지를 계산.
+
+        Args:
+            other (VectorArray | Vector | int | float): 나눗셈에서의 제수.
+
+        Returns:
+            VectorArray: 연산 결과.
+        """
+        return self._elementwise(mod, other)
+
+    def _reflected(self, operator: Callable[[float, float], float], other: Any) -> VectorArray:
+        """벡터, 혹은 스칼라가 좌항인 성분별 연산을 버퍼 전체에 대해 수행함.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+        """
+        if _defers_to_numpy(other):
+            return NotImplemented
+        operand = self._operand(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        return self._wrap(array(self._typecode, map(operator, operand, self._data)))
+
+    def __radd__(self, other: Vector | int | float) -> VectorArray:
+        return self._elementwise(add, other)
+
+    def __rsub__(self, other: Vector | int | float) -> VectorArray:
+        return self._reflected(sub, other)
+
+    def __rmul__(self, other: Vector | int | float) -> array:
+        return self * other
+
+    def __rtruediv__(self, other: Vector | int | float) -> VectorArray:
+        return self._reflected(truediv, other)
+
+    def __rfloordiv__(self, other: Vector | int | float) -> VectorArray:
+        return self._reflected(floordiv, other)
+
+    def __rmod__(self, other: Vector | int | float) -> VectorArray:
+        return self._reflected(mod, other)
+
+    def __neg__(self) -> VectorArray:
+        """각 벡터의 역벡터를 구함.
+
+        Returns:
+            VectorArray: 역벡터들의 배열.
+        """
+        return self._wrap(array(self._typecode, map(neg, self._data)))
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """내부 버퍼를 복사하지 않고 (N, 차원) 형태의 NumPy 배열로 노출함. (np.asarray 지원)
+
+        Args:
+            dtype (Any, optional): 배열의 자료형. 저장 정밀도와 다르면 복사됨. Defaults to None.
+            copy (bool | None, optional): True일 시 복사본을 반환함. Defaults to None.
+
+        Returns:
+            Any: 내부 버퍼를 공유하는 NumPy 배열.
+        """
+        numpy = _import_numpy()
+        values = numpy.frombuffer(self._data, dtype=self.dtype).reshape(-1, self._DEMENTION)
+        if copy or (dtype is not None and numpy.dtype(dtype) != values.dtype):
+            return values.astype(dtype if dtype is not None else values.dtype, copy=True)
+        return values
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """내부 버퍼를 버퍼 프로토콜로 노출함. (Python 3.12+, PEP 688)"""
+        return memoryview(self._data)
+
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """NumPy ufunc를 내부 버퍼에 대해 직접 실행함.
+
+        결과가 (N, 차원) 형태의 float32, 혹은 float64 배열이면 복사 없이 같은 종류의 벡터 배열로 감싸서 반환하고,
+        그렇지 않으면 NumPy 배열을 그대로 반환함. NumPy의 실수 스칼라와의 사칙연산은 파이썬 실수와 같이
+        연산자로 계산하므로, 피연산자의 순서나 스칼라의 자료형과 관계없이 결과가 같음. (* 는 내적)
+        """
+        operator = _UFUNC_OPERATORS.get(ufunc.__name__)
+        if operator is not None and method == "__call__" and not kwargs and len(inputs) == 2:
+            numpy = _import_numpy()
+            left, right = inputs
+            if left is self and isinstance(right, (numpy.integer, numpy.floating)):
+                return operator(self, float(right))
+            if right is self and isinstance(left, (numpy.integer, numpy.floating)):
+                return operator(float(left), self)
+        inputs = tuple(_as_ndarray(value) for value in inputs)
+        out = kwargs.get("out")
+        if out is not None:
+            kwargs["out"] = tuple(_as_ndarray(value) for value in out)
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(result, tuple):
+            return tuple(self._from_ufunc_result(value) for value in result)
+        return self._from_ufunc_result(result)
+
+    def _from_ufunc_result(self, result: Any) -> Any:
+        """ufunc의 결과가 벡터 배열의 형태일 시 벡터 배열로 감쌈."""
+        numpy = _import_numpy()
+        if (
+            isinstance(result, numpy.ndarray)
+            and result.ndim == 2
+            and result.shape[1] == self._DEMENTION
+            and result.dtype.name in _TYPECODES
+            and result.flags.c_contiguous
+        ):
+            return type(self).from_numpy(result)
+        return result
+
+    def __reduce__(self) -> tuple[Any, tuple[array]]:
+        # 버퍼를 array로 복사하여 저장함. array는 내부 바이트를 그대로 피클링함
+        return (self._wrap, (array(self._typecode, self._data),))
+
+    def __len__(self) -> int:
+        return len(self._data) // self._DEMENTION
+
+    def __iter__(self) -> Iterator[Vector]:
+        values = iter(self._data)
+        return map(self._VECTOR_TYPE, *[values] * self._DEMENTION)
+
+    def __getitem__(self, index: int | slice) -> Vector | VectorArray:
+        dim = self._DEMENTION
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            if indices.step == 1:
+                return self._wrap(array(self._typecode, self._data[indices.start * dim : indices.stop * dim]))
+            values = iter(self._data)
+            points = list(zip(*[values] * dim))
+            return self._wrap(array(self._typecode, chain.from_iterable(map(points.__getitem__, indices))))
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError
+        start = (index % count) * dim
+        return self._VECTOR_TYPE(*self._data[start : start + dim])
+
+    def __setitem__(self, index: int, vector: Vector) -> None:
+        if not isinstance(vector, self._VECTOR_TYPE):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError
+        start = (index % count) * self._DEMENTION
+        self._data[start : start + self._DEMENTION] = array(self._typecode, vector)
+
+
+class Vector2Array(VectorArray):
+    """2차원 벡터 여러 개를 일괄 연산하기 위한 클래스"""
+
+    __slots__ = ()
+
+    _DEMENTION = 2
+    _VECTOR_TYPE = Vector2
+
+    @property
+    def x(self) -> array:
+        """모든 벡터의 X축 성분을 불러옴.
+
+        Returns:
+            array: X축 성분들.
+        """
+        return self.component(0)
+
+    @property
+    def y(self) -> array:
+        """모든 벡터의 Y축 성분을 불러옴.
+
+        Returns:
+            array: Y축 성분들.
+        """
+        return self.component(1)
+
+
+class Vector3Array(VectorArray):
+    """3차원 벡터 여러 개를 일괄 연산하기 위한 클래스"""
+
+    __slots__ = ()
+
+    _DEMENTION = 3
+    _VECTOR_TYPE = Vector3
+
+    @property
+    def x(self) -> array:
+        """모든 벡터의 X축 성분을 불러옴.
+
+        Returns:
+            array: X축 성분들.
+        """
+        return self.component(0)
+
+    @property
+    def y(self) -> array:
+        """모든 벡터의 Y축 성분을 불러옴.
+
+        Returns:
+            array: Y축 성분들.
+        """
+        return self.component(1)
+
+    @property
+    def z(self) -> array:
+        """모든 벡터의 Z축 성분을 불러옴.
+
+        Returns:
+            array: Z축 성분들.
+        """
+        return self.component(2)
+
+    def __matmul__(self, other: Vector3Array | Vector3 | int | float) -> Vector3Array:
+        """각 공간벡터의 외적을 계산함.
+
+        Args:
+            other (Vector3Array | Vector3 | int | float): 외적할 벡터 배열, 벡터, 혹은 스칼라.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Vector3Array: 연산 결과.
+        """
+        if self._operand(other) is NotImplemented:
+            return NotImplemented
+        if isinstance(other, Vector3Array):
+            bx, by, bz = other.x, other.y, other.z
+        elif isinstance(other, Vector3):
+            bx, by, bz = repeat(other.x), repeat(other.y), repeat(other.z)
+        else:
+            bx = by = bz = repeat(float(other))
+        ax, ay, az = self.x, self.y, self.z
+        cx = map(sub, map(mul, ay, bz), map(mul, az, by))
+        cy = map(sub, map(mul, az, bx), map(mul, ax, bz))
+        cz = map(sub, map(mul, ax, by), map(mul, ay, bx))
+        return self._wrap(array(self._typecode, chain.from_iterable(zip(cx, cy, cz))))
+
+    def __rmatmul__(self, other: Vector3 | int | float) -> Vector3Array:
+        # 외적은 교환하면 부호가 바뀜: a × b = -(b × a)
+        result = self.__matmul__(other)
+        return NotImplemented if result is NotImplemented else -result
+
+    def to_euler_angles(self) -> Vector3Array:
+        """각 공간벡터를 오일러각(roll, pitch, yaw)으로 변환함. Vector3.to_euler_angles와 같은 결과를 반환함.
+
+        짐벌락 여부에 따른 두 경우를 모든 벡터에 대해 계산한 후, 마스크로 각 벡터에 맞는 값을 고름.
+        NumPy가 설치되어 있으면 NumPy로 계산함.
+
+        Raises:
+            ZeroDivisionError: 크기가 0인 벡터가 있을 때 발생하는 에러.
+
+        Returns:
+            Vector3Array: 오일러각 배열 (x: roll, y: pitch, z: yaw) [라디안]
+        """
+        numpy = _optional_numpy()
+        if numpy is not None:
+            return self._to_euler_angles_numpy(numpy)
+
+        norms = self.norm()
+        xs = array("d", map(truediv, self.x, norms))
+        ys = array("d", map(truediv, self.y, norms))
+        zs = array("d", map(truediv, self.z, norms))
+
+        # pitch가 ±90도에 가까운 벡터 (짐벌락)
+        locked = list(map(ge, map(abs, ys), repeat(0.9999)))
+
+        pitch = map(asin, map(neg, ys))
+        yaw = array("d", _select(locked, repeat(0.0), map(atan2, xs, zs)))
+        roll = _select(
+            locked,
+            map(atan2, map(neg, zs), xs),
+            map(
+                atan2,
+                map(sub, map(mul, xs, map(sin, yaw)), map(mul, zs, map(cos, yaw))),
+                map(neg, ys),
+            ),
+        )
+        return Vector3Array.from_components(roll, pitch, yaw, dtype=self.dtype)
+
+    def rotate(self, euler_angles: Vector3 | list[float] | Vector3Array) -> Vector3Array:
+        """오일러 각도를 입력으로 받아 각 공간벡터를 회전시킴. Vector3.rotate와 같은 회전을 나타냄.
+
+        Args:
+            euler_angles (Vector3 | list[float] | Vector3Array): 모든 벡터에 적용할 오일러 각도 벡터 (roll, pitch, yaw) [라디안],
+                    혹은 각 벡터마다 적용할 오일러 각도 배열. NumPy가 설치되어 있으면 NumPy로 계산함.
+
+        Raises:
+            ValueError: 길이가 다른 오일러 각도 배열이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector3Array: 회전된 공간벡터 배열.
+        """
+        numpy = _optional_numpy()
+        if not isinstance(euler_angles, Vector3Array):
+            from Vector.rotation import Rotation3D
+
+            rotation = Rotation3D(euler_angles)
+            if numpy is None:
+                return rotation.apply(self)
+            matrix = numpy.array(rotation.matrix, dtype=self.dtype).T
+            return Vector3Array._from_ndarray(numpy.asarray(self) @ matrix, self._typecode)
+        if len(euler_angles) != len(self):
+            raise ValueError("Operations cannot be performed with batches of different length.")
+        if numpy is not None:
+            return self._rotate_numpy(numpy, euler_angles)
+
+        cos_r = array("d", map(cos, euler_angles.x))
+        sin_r = array("d", map(sin, euler_angles.x))
+        cos_p = array("d", map(cos, euler_angles.y))
+        sin_p = array("d", map(sin, euler_angles.y))
+        cos_y = array("d", map(cos, euler_angles.z))
+        sin_y = array("d", map(sin, euler_angles.z))
+        sin_r_sin_p = array("d", map(mul, sin_r, sin_p))
+        cos_r_sin_p = array("d", map(mul, cos_r, sin_p))
+
+        # 각 벡터의 회전 행렬 성분 (행 우선)
+        matrix = (
+            map(mul, cos_p, cos_y),
+            map(mul, cos_p, sin_y),
+            map(neg, sin_p),
+            map(sub, map(mul, sin_r_sin_p, cos_y), map(mul, cos_r, sin_y)),
+            map(add, map(mul, sin_r_sin_p, sin_y), map(mul, cos_r, cos_y)),
+            map(mul, sin_r, cos_p),
+            map(add, map(mul, cos_r_sin_p, cos_y), map(mul, sin_r, sin_y)),
+            map(sub, map(mul, cos_r_sin_p, sin_y), map(mul, sin_r, cos_y)),
+            map(mul, cos_r, cos_p),
+        )
+        xs, ys, zs = self.x, self.y, self.z
+        return Vector3Array.from_components(
+            *(
+                map(
+                    add,
+                    map(add, map(mul, xs, matrix[row]), map(mul, ys, matrix[row + 1])),
+                    map(mul, zs, matrix[row + 2]),
+                )
+                for row in (0, 3, 6)
+            ),
+            dtype=self.dtype,
+        )
+
+    def _to_euler_angles_numpy(self, numpy: Any) -> Vector3Array:
+        """to_euler_angles를 NumPy로 계산함."""
+        values = numpy.asarray(self)
+        norms = numpy.sqrt(numpy.einsum("ij,ij->i", values, values))
+        if not norms.all():
+            raise ZeroDivisionError("float division by zero")
+        xs, ys, zs = (values / norms[:, None]).T
+
+        locked = numpy.abs(ys) >= 0.9999
+        pitch = numpy.arcsin(-ys)
+        yaw = numpy.where(locked, 0.0, numpy.arctan2(xs, zs))
+        roll = numpy.where(
+            locked,
+            numpy.arctan2(-zs, xs),
+            numpy.arctan2(xs * numpy.sin(yaw) - zs * numpy.cos(yaw), -ys),
+        )
+        return Vector3Array._from_ndarray(numpy.stack((roll, pitch, yaw), axis=1), self._typecode)
+
+    def _rotate_numpy(self, numpy: Any, euler_angles: Vector3Array) -> Vector3Array:
+        """각 벡터마다 다른 오일러 각도로 회전하는 rotate를 NumPy로 계산함."""
+        roll, pitch, yaw = numpy.asarray(euler_angles).T
+        cos_r, sin_r = numpy.cos(roll), numpy.sin(roll)
+        cos_p, sin_p = numpy.cos(pitch), numpy.sin(pitch)
+        cos_y, sin_y = numpy.cos(yaw), numpy.sin(yaw)
+        sin_r_sin_p = sin_r * sin_p
+        cos_r_sin_p = cos_r * sin_p
+
+        # (N, 3, 3) 형태의 회전 행렬
+        matrices = numpy.stack(
+            (
+                cos_p * cos_y,
+                cos_p * sin_y,
+                -sin_p,
+                sin_r_sin_p * cos_y - cos_r * sin_y,
+                sin_r_sin_p * sin_y + cos_r * cos_y,
+                sin_r * cos_p,
+                cos_r_sin_p * cos_y + sin_r * sin_y,
+                cos_r_sin_p * sin_y - sin_r * cos_y,
+                cos_r * cos_p,
+            ),
+            axis=1,
+        ).reshape(-1, 3, 3)
+        return Vector3Array._from_ndarray(
+            numpy.einsum("nij,nj->ni", matrices, numpy.asarray(self)), self._typecode
+        )
+
+
+class Vector4Array(VectorArray):
+    """4차원 벡터 여러 개를 일괄 연산하기 위한 클래스"""
+
+    __slots__ = ()
+
+    _DEMENTION = 4
+    _VECTOR_TYPE = Vector4
+
+    @property
+    def x(self) -> array:
+        """모든 벡터의 X축 성분을 불러옴.
+
+        Returns:
+            array: X축 성분들.
+        """
+        return self.component(0)
+
+    @property
+    def y(self) -> array:
+        """모든 벡터의 Y축 성분을 불러옴.
+
+        Returns:
+            array: Y축 성분들.
+        """
+        return self.component(1)
+
+    @property
+    def z(self) -> array:
+        """모든 벡터의 Z축 성분을 불러옴.
+
+        Returns:
+            array: Z축 성분들.
+        """
+        return self.component(2)
+
+    @property
+    def w(self) -> array:
+        """모든 벡터의 W축 성분을 불러옴.
+
+        Returns:
+            array: W축 성분들.
+        """
+        return self.component(3)
+
+
+class VectorNArray(VectorArray):
+    """임의 차원의 벡터(VectorN) 여러 개를 일괄 연산하기 위한 클래스.
+
+    VectorNArray.of(차원)으로 해당 차원의 배열 클래스를 얻어 사용하며, 모든 연산은 다른 벡터 배열과 같은 커널로 수행됨.
+
+        features = VectorNArray.of(16)(vectors)
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        if not cls._DEMENTION:
+            raise TypeError("Use VectorNArray.of(demention) to create a batch of VectorN.")
+        return object.__new__(cls)
+
+    @staticmethod
+    def of(demention: int) -> type[VectorNArray]:
+        """주어진 차원의 벡터 배열 클래스를 반환함. 처음 요청된 차원이면 클래스를 생성함.
+
+        Args:
+            demention (int): 벡터의 차원.
+
+        Raises:
+            ValueError: 차원이 양의 정수가 아닐 때 발생하는 에러.
+
+        Returns:
+            type[VectorNArray]: 해당 차원의 벡터 배열 클래스.
+        """
+        try:
+            return _VECTOR_N_ARRAY_TYPES[demention]
+        except KeyError:
+            pass
+        vector_type = VectorN.of(demention)
+        name = f"{vector_type.__name__}Array"
+        array_type = type(
+            name,
+            (VectorNArray,),
+            {
+                "__slots__": (),
+                "__module__": __name__,
+                "__qualname__": name,
+                "__doc__": f"{demention}차원 벡터 여러 개를 일괄 연산하기 위한 클래스",
+                "_DEMENTION": demention,
+                "_VECTOR_TYPE": vector_type,
+            },
+        )
+        _VECTOR_N_ARRAY_TYPES[demention] = array_type
+        return array_type
+
+
+_VECTOR_N_ARRAY_TYPES: dict[int, type[VectorNArray]] = {}
+_ARRAY_TYPES: dict[type[Vector], type[VectorArray]] = {
+    Vector2: Vector2Array,
+    Vector3: Vector3Array,
+    Vector4: Vector4Array,
+}
+
+
+def _array_type(vector_type: type[Vector]) -> type[VectorArray]:
+    """벡터 클래스에 맞는 벡터 배열 클래스를 반환함. 불변 벡터 등의 하위 클래스는 기본 클래스의 배열을 사용함."""
+    vector_type = vector_type._VECTOR_TYPE
+    if issubclass(vector_type, VectorN):
+        return VectorNArray.of(vector_type._DEMENTION)
+    return _ARRAY_TYPES[vector_type]
+
+
+def __getattr__(name: str) -> Any:
+    # 피클링된 VectorNArray 클래스(VectorN6Array 등)를 다른 프로세스에서도 불러올 수 있도록, 처음 접근할 때 생성함
+    if name.startswith("VectorN") and name.endswith("Array") and name[7:-5].isdigit():
+        return VectorNArray.of(int(name[7:-5]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
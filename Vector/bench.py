@@ -0,0 +1,386 @@
+"""벡터 클래스의 메모리 사용량과 연산 속도를 측정하기 위한 모듈
+
+``python -m Vector.bench`` 로 실행할 수 있음. 결과는 JSON으로 출력되며, 이전 결과와 비교하여
+느려진 항목이 있으면 0이 아닌 종료 코드를 반환함.
+
+    python -m Vector.bench --output baseline.json
+    python -m Vector.bench --compare baseline.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from collections import deque
+from operator import (
+    add,
+    eq,
+    floordiv,
+    iadd,
+    ifloordiv,
+    imod,
+    imul,
+    isub,
+    itruediv,
+    matmul,
+    mod,
+    mul,
+    neg,
+    sub,
+    truediv,
+)
+from timeit import Timer
+from typing import Any, Callable, Iterable
+
+from Vector.batch import _array_type
+from Vector.rotation import Rotation2D, Rotation3D
+from Vector.vector import Vector, Vector2, Vector3, Vector4
+
+VECTOR_TYPES: tuple[type[Vector], ...] = (Vector2, Vector3, Vector4)
+SCALAR_OPERATORS: dict[str, Callable[[object, object], object]] = {
+    "+": add,
+    "-": sub,
+    "*": mul,
+    "/": truediv,
+    "//": floordiv,
+    "%": mod,
+}
+# 복합 대입 연산은 피연산자를 바꾸므로, 반복해도 값이 변하지 않는 스칼라와 연산함
+INPLACE_OPERATORS: dict[str, tuple[Callable[[Any, Any], Any], float]] = {
+    "+=": (iadd, 0.0),
+    "-=": (isub, 0.0),
+    "*=": (imul, 1.0),
+    "/=": (itruediv, 1.0),
+    "//=": (ifloordiv, 1.0),
+    "%=": (imod, 1e9),
+}
+DEFAULT_BATCH_SIZES: tuple[int, ...] = (1, 100, 10_000)
+SCHEMA_VERSION = 1
+
+
+def _best_of(statement: Callable[[], object], number: int, repeat: int) -> float:
+    """주어진 함수를 반복 실행하여 1회당 가장 빠른 실행 시간을 구함.
+
+    Args:
+        statement (Callable[[], object]): 측정할 함수.
+        number (int): 한 번의 측정에서 실행할 횟수.
+        repeat (int): 측정을 반복할 횟수.
+
+    Returns:
+        float: 1회 실행에 걸린 시간. [초]
+    """
+    return min(Timer(statement).repeat(repeat=repeat, number=number)) / number
+
+
+def bytes_per_instance(vector_type: type[Vector], count: int = 100_000) -> float:
+    """벡터 하나가 차지하는 평균 메모리를 측정함.
+
+    Args:
+        vector_type (type[Vector]): 측정할 벡터 클래스.
+        count (int, optional): 생성할 벡터의 개수. Defaults to 100_000.
+
+    Returns:
+        float: 벡터 하나당 메모리 사용량. [바이트]
+    """
+    components = range(1, vector_type().demention + 1)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        vectors = [vector_type(*components) for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # 리스트 자체가 차지하는 포인터 공간은 제외함
+    return (after - before) / len(vectors) - 8
+
+
+def construction_time(
+    vector_type: type[Vector], number: int = 100_000, repeat: int = 5
+) -> float:
+    """벡터 하나를 생성하는데 걸리는 시간을 측정함.
+
+    Args:
+        vector_type (type[Vector]): 측정할 벡터 클래스.
+        number (int, optional): 한 번의 측정에서 생성할 횟수. Defaults to 100_000.
+        repeat (int, optional): 측정을 반복할 횟수. Defaults to 5.
+
+    Returns:
+        float: 생성 1회에 걸린 시간. [초]
+    """
+    components = tuple(float(i) for i in range(1, vector_type().demention + 1))
+    return _best_of(lambda: vector_type(*components), number, repeat)
+
+
+def scalar_operator_time(
+    vector_type: type[Vector],
+    operator: Callable[[object, object], object],
+    reflected: bool = False,
+    number: int = 100_000,
+    repeat: int = 5,
+) -> float:
+    """벡터와 스칼라 사이의 연산 1회에 걸리는 시간을 측정함.
+
+    Args:
+        vector_type (type[Vector]): 측정할 벡터 클래스.
+        operator (Callable[[object, object], object]): 측정할 연산자.
+        reflected (bool, optional): True일 시 스칼라를 좌항으로 둠. (예: 2.0 * v) Defaults to False.
+        number (int, optional): 한 번의 측정에서 연산할 횟수. Defaults to 100_000.
+        repeat (int, optional): 측정을 반복할 횟수. Defaults to 5.
+
+    Returns:
+        float: 연산 1회에 걸린 시간. [초]
+    """
+    vector = vector_type(*range(1, vector_type().demention + 1))
+    scalar = 2.0
+    if reflected:
+        return _best_of(lambda: operator(scalar, vector), number, repeat)
+    return _best_of(lambda: operator(vector, scalar), number, repeat)
+
+
+def vector_cases(
+    vector_type: type[Vector],
+) -> dict[str, Callable[[Any, Any], Any]]:
+    """벡터 클래스별로 측정할 항목들을 반환함.
+
+    각 항목은 (벡터, 같은 차원의 다른 벡터)를 받아 측정할 연산을 한 번 실행하는 함수임.
+
+    Args:
+        vector_type (type[Vector]): 측정할 벡터 클래스.
+
+    Returns:
+        dict[str, Callable[[Any, Any], Any]]: 항목 이름과 측정할 함수.
+    """
+    name = vector_type.__name__
+    cases: dict[str, Callable[[Any, Any], Any]] = {
+        f"{name}()": lambda vector, other: vector_type(*vector),
+    }
+    for symbol, operator in SCALAR_OPERATORS.items():
+        cases[f"{name} {symbol} {name}"] = operator
+        cases[f"{name} {symbol} scalar"] = lambda vector, other, operator=operator: operator(vector, 2.0)
+        cases[f"scalar {symbol} {name}"] = lambda vector, other, operator=operator: operator(2.0, vector)
+    for symbol, (operator, scalar) in INPLACE_OPERATORS.items():
+        cases[f"{name} {symbol} scalar"] = lambda vector, other, operator=operator, scalar=scalar: operator(
+            vector, scalar
+        )
+    if vector_type is Vector3:
+        cases[f"{name} @ {name}"] = matmul
+    cases[f"-{name}"] = lambda vector, other: neg(vector)
+    cases[f"{name} == {name}"] = eq
+    cases[f"{name}.norm"] = lambda vector, other: vector.norm()
+    # 첫 실행 이후에는 단위벡터를 다시 정규화하게 됨
+    cases[f"{name}.normalize"] = lambda vector, other: vector.normalize()
+    cases[f"{name}.distance"] = lambda vector, other: vector.distance(other)
+    if vector_type is Vector2:
+        cases[f"{name}.rotate"] = lambda vector, other: vector.rotate(30.0)
+        cases[f"{name}.to_3d"] = lambda vector, other: vector.to_3d()
+    if vector_type is Vector3:
+        cases[f"{name}.rotate"] = lambda vector, other: vector.rotate([0.1, 0.2, 0.3])
+        cases[f"{name}.to_euler_angles"] = lambda vector, other: vector.to_euler_angles()
+        cases[f"{name}.to_2d"] = lambda vector, other: vector.to_2d()
+    if vector_type is Vector4:
+        cases[f"{name}.to_2d"] = lambda vector, other: vector.to_2d()
+        cases[f"{name}.to_3d"] = lambda vector, other: vector.to_3d()
+    return cases
+
+
+def array_cases(
+    vector_type: type[Vector],
+) -> dict[str, Callable[[Any, Any], Any]]:
+    """벡터 배열 클래스별로 측정할 항목들을 반환함.
+
+    각 항목은 (벡터 배열, 같은 길이의 다른 벡터 배열)을 받아 측정할 연산을 한 번 실행하는 함수임.
+
+    Args:
+        vector_type (type[Vector]): 배열의 원소가 되는 벡터 클래스.
+
+    Returns:
+        dict[str, Callable[[Any, Any], Any]]: 항목 이름과 측정할 함수.
+    """
+    name = _array_type(vector_type).__name__
+    cases: dict[str, Callable[[Any, Any], Any]] = {}
+    for symbol, operator in SCALAR_OPERATORS.items():
+        if symbol != "*":
+            cases[f"{name} {symbol} {name}"] = operator
+        cases[f"{name} {symbol} scalar"] = lambda batch, other, operator=operator: operator(batch, 2.0)
+    cases[f"{name}.norm"] = lambda batch, other: batch.norm()
+    cases[f"{name}.normalize"] = lambda batch, other: batch.normalize()
+    cases[f"{name}.dot"] = lambda batch, other: batch.dot(other)
+    if vector_type is Vector2:
+        rotation_2d = Rotation2D(30.0)
+        cases[f"Rotation2D.apply({name})"] = lambda batch, other: rotation_2d.apply(batch)
+    if vector_type is Vector3:
+        rotation_3d = Rotation3D([0.1, 0.2, 0.3])
+        cases[f"{name} @ {name}"] = matmul
+        cases[f"Rotation3D.apply({name})"] = lambda batch, other: rotation_3d.apply(batch)
+    return cases
+
+
+def _sample_vectors(vector_type: type[Vector], size: int, offset: int) -> list[Vector]:
+    """측정에 사용할 0이 아닌 성분을 가진 벡터들을 생성함."""
+    demention = vector_type().demention
+    return [
+        vector_type(*(float((index + axis + offset) % 7 + 1) for axis in range(demention)))
+        for index in range(size)
+    ]
+
+
+def _time_per_vector(
+    function: Callable[[Any, Any], Any],
+    operands: Iterable[tuple[Any, Any]],
+    vectors_per_call: int,
+    operations: int,
+    repeat: int,
+) -> float:
+    """주어진 함수를 모든 피연산자에 적용하는데 걸린 시간을 벡터 하나당 시간으로 환산함. [나노초]"""
+    operands = list(operands)
+    vectors_per_round = len(operands) * vectors_per_call
+    number = max(1, operations // vectors_per_round)
+    if len(operands) == 1:
+        vector, other = operands[0]
+        statement: Callable[[], object] = lambda: function(vector, other)
+    else:
+        firsts = [vector for vector, _ in operands]
+        seconds = [other for _, other in operands]
+        statement = lambda: deque(map(function, firsts, seconds), maxlen=0)
+    return _best_of(statement, number, repeat) / vectors_per_round * 1e9
+
+
+def run_suite(
+    batch_sizes: Iterable[int] = DEFAULT_BATCH_SIZES,
+    operations: int = 20_000,
+    repeat: int = 5,
+    vector_types: Iterable[type[Vector]] = VECTOR_TYPES,
+) -> dict[str, Any]:
+    """모든 항목을 여러 배치 크기에서 측정하여 JSON으로 저장할 수 있는 결과를 반환함.
+
+    벡터 항목은 배치 크기만큼의 벡터에 연산을 하나씩 적용하며, 배열 항목은 배치 크기만큼의 벡터를 가진
+    배열에 연산을 한 번 적용함. 모든 시간은 벡터 하나당 나노초로 환산됨.
+
+    Args:
+        batch_sizes (Iterable[int], optional): 측정할 배치 크기들. Defaults to (1, 100, 10_000).
+        operations (int, optional): 한 번의 측정에서 처리할 벡터의 개수. Defaults to 20_000.
+        repeat (int, optional): 측정을 반복할 횟수. 가장 빠른 값이 사용됨. Defaults to 5.
+        vector_types (Iterable[type[Vector]], optional): 측정할 벡터 클래스들. Defaults to VECTOR_TYPES.
+
+    Returns:
+        dict[str, Any]: 측정 환경, 인스턴스당 메모리, 항목별 결과를 담은 dict.
+    """
+    from Vector import VERSION
+
+    batch_sizes = tuple(batch_sizes)
+    vector_types = tuple(vector_types)
+    results: dict[str, dict[str, float]] = {}
+    for vector_type in vector_types:
+        for size in batch_sizes:
+            vectors = _sample_vectors(vector_type, size, 0)
+            others = _sample_vectors(vector_type, size, 3)
+            for case, function in vector_cases(vector_type).items():
+                # normalize 등 피연산자를 바꾸는 항목이 다른 항목에 영향을 주지 않도록 매번 복사함
+                operands = [(vector_type(*vector), other) for vector, other in zip(vectors, others)]
+                results.setdefault(case, {})[str(size)] = _time_per_vector(
+                    function, operands, 1, operations, repeat
+                )
+            array_type = _array_type(vector_type)
+            for case, function in array_cases(vector_type).items():
+                operands = [(array_type(vectors), array_type(others))]
+                results.setdefault(case, {})[str(size)] = _time_per_vector(
+                    function, operands, size, operations, repeat
+                )
+    return {
+        "schema": SCHEMA_VERSION,
+        "version": VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "unit": "ns/vector",
+        "batch_sizes": list(batch_sizes),
+        "bytes_per_instance": {
+            vector_type.__name__: bytes_per_instance(vector_type) for vector_type in vector_types
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = 0.1
+) -> list[str]:
+    """두 측정 결과를 비교하여 tolerance보다 더 느려진 항목들을 찾음.
+
+    한쪽 결과에만 있는 항목은 비교하지 않음.
+
+    Args:
+        baseline (dict[str, Any]): 기준이 되는 측정 결과.
+        current (dict[str, Any]): 비교할 측정 결과.
+        tolerance (float, optional): 허용할 속도 저하 비율. 0.1일 시 10%까지 허용함. Defaults to 0.1.
+
+    Raises:
+        ValueError: 형식이 다른 측정 결과가 주어졌을 때 발생하는 에러.
+
+    Returns:
+        list[str]: 느려진 항목들의 설명. 느려진 항목이 없으면 빈 리스트.
+    """
+    if baseline.get("schema") != current.get("schema"):
+        raise ValueError("Benchmark results with different schemas cannot be compared.")
+    regressions = []
+    for case, timings in current["results"].items():
+        baseline_timings = baseline["results"].get(case, {})
+        for size, elapsed in timings.items():
+            reference = baseline_timings.get(size)
+            if reference and elapsed > reference * (1.0 + tolerance):
+                regressions.append(
+                    f"{case} [batch {size}]: {reference:.1f} -> {elapsed:.1f} ns/vector "
+                    f"(+{(elapsed / reference - 1.0) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m Vector.bench", description="Benchmark the Vector module and emit JSON."
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_BATCH_SIZES),
+        help="numbers of vectors processed per measured call",
+    )
+    parser.add_argument(
+        "--operations", type=int, default=20_000, help="vectors processed per timing sample"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per case")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed slowdown ratio before a case counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.batch_sizes, args.operations, args.repeat)
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, results, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""벡터에서 유도되는 값들을 캐시하기 위한 모듈
+
+CachedVector2, CachedVector3는 일반 벡터와 같게 동작하지만, 오일러각과 마지막 회전 결과를
+한 번만 계산하여 저장해둠. 성분이 바뀌면 (setter, normalize, 복합 대입 연산 등) 저장된 값은 자동으로 지워짐.
+회전 행렬은 모든 벡터가 공유하는 크기가 제한된 LRU 캐시에 회전 방향을 키로 저장됨.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from Vector.rotation import Rotation2D, Rotation3D
+from Vector.vector import Vector2, Vector3
+
+
+class CacheStats:
+    """캐시의 적중, 실패, 제거 횟수를 기록하기 위한 클래스."""
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """기록된 횟수들을 메트릭으로 내보내기 위한 dict로 반환함.
+
+        Returns:
+            dict[str, int]: hits, misses, evictions를 키로 가지는 dict.
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def reset(self) -> None:
+        """기록된 횟수들을 모두 0으로 초기화함."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class LRUCache:
+    """크기가 제한된 LRU(Least Recently Used) 캐시 클래스.
+
+    가득 찬 상태에서 새 값이 추가되면 가장 오랫동안 사용되지 않은 값이 제거됨.
+    """
+
+    __slots__ = ("__maxsize", "__entries", "__stats")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """캐시를 생성함.
+
+        Args:
+            maxsize (int, optional): 저장할 수 있는 값의 최대 개수. 0일 시 아무것도 저장하지 않음. Defaults to 1024.
+
+        Raises:
+            ValueError: maxsize가 음수일 때 발생하는 에러.
+        """
+        if maxsize < 0:
+            raise ValueError("The size of a cache must not be negative.")
+        self.__maxsize: int = maxsize
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__stats = CacheStats()
+
+    @property
+    def maxsize(self) -> int:
+        """저장할 수 있는 값의 최대 개수를 반환함.
+
+        Returns:
+            int: 최대 개수.
+        """
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        """저장할 수 있는 값의 최대 개수를 설정함. 초과하는 값들은 오래된 순서대로 제거됨.
+
+        Args:
+            value (int): 설정할 최대 개수.
+
+        Raises:
+            ValueError: 음수가 주어졌을 때 발생하는 에러.
+        """
+        if value < 0:
+            raise ValueError("The size of a cache must not be negative.")
+        self.__maxsize = value
+        self.__evict()
+
+    @property
+    def stats(self) -> CacheStats:
+        """해당 캐시의 적중, 실패, 제거 횟수를 반환함.
+
+        Returns:
+            CacheStats: 기록된 횟수.
+        """
+        return self.__stats
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """key에 저장된 값을 반환하며, 없을 시 compute로 계산하여 저장한 후 반환함.
+
+        Args:
+            key (Hashable): 값을 찾기 위한 키.
+            compute (Callable[[], Any]): 값이 없을 때 호출할 함수.
+
+        Returns:
+            Any: 저장되어 있던 값, 혹은 새로 계산된 값.
+        """
+        entries = self.__entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.__stats.misses += 1
+            value = compute()
+            entries[key] = value
+            self.__evict()
+            return value
+        entries.move_to_end(key)
+        self.__stats.hits += 1
+        return value
+
+    def __evict(self) -> None:
+        """최대 개수를 초과하는 값들을 오래된 순서대로 제거함."""
+        entries = self.__entries
+        while len(entries) > self.__maxsize:
+            entries.popitem(last=False)
+            self.__stats.evictions += 1
+
+    def clear(self) -> None:
+        """저장된 모든 값을 제거함. 기록된 횟수는 유지됨."""
+        self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+
+# 모든 캐시 벡터가 공유하는 회전 행렬 캐시
+ROTATION_CACHE = LRUCache(1024)
+# 캐시 벡터들의 오일러각, 회전 결과 캐시의 적중 기록
+VECTOR_CACHE_STATS = CacheStats()
+
+
+def cached_rotation_2d(degree: float | int) -> Rotation2D:
+    """주어진 각도의 평면 회전을 회전 캐시에서 불러오며, 없을 시 생성하여 저장함.
+
+    Args:
+        degree (float | int): 회전 각도. [도]
+
+    Returns:
+        Rotation2D: 해당 각도의 평면 회전.
+    """
+    return ROTATION_CACHE.get_or_compute((2, float(degree)), lambda: Rotation2D(degree))
+
+
+def cached_rotation_3d(euler_angles: Vector3 | list[float] | tuple[float, ...]) -> Rotation3D:
+    """주어진 오일러 각도의 공간 회전을 회전 캐시에서 불러오며, 없을 시 생성하여 저장함.
+
+    Args:
+        euler_angles (Vector3 | list[float] | tuple[float, ...]): 오일러 각도 벡터 (roll, pitch, yaw) [라디안].
+
+    Returns:
+        Rotation3D: 해당 방향의 공간 회전.
+    """
+    key = (3, *map(float, euler_angles))
+    return ROTATION_CACHE.get_or_compute(key, lambda: Rotation3D(list(key[1:])))
+
+
+def _rotation_2d_from_key(key: tuple[float]) -> Rotation2D:
+    """(각도,) 형태의 키로부터 평면 회전을 불러옴."""
+    return cached_rotation_2d(key[0])
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """모든 캐시의 적중, 실패, 제거 횟수를 메트릭으로 내보내기 위한 dict로 반환함.
+
+    Returns:
+        dict[str, dict[str, int]]: "vector", "rotation"을 키로 가지는 dict.
+    """
+    return {"vector": VECTOR_CACHE_STATS.as_dict(), "rotation": ROTATION_CACHE.stats.as_dict()}
+
+
+def reset_cache_stats() -> None:
+    """모든 캐시의 기록된 횟수를 0으로 초기화함."""
+    VECTOR_CACHE_STATS.reset()
+    ROTATION_CACHE.stats.reset()
+
+
+class _CachedVector:
+    """캐시 벡터 클래스들의 공통 동작을 정의하는 클래스.
+
+    성분을 바꾸는 모든 대입은 __setattr__을 거치므로, 이곳에서 저장된 값을 지움.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *components: float | int | None, **kwargs: float | int | None) -> None:
+        object.__setattr__(self, "_cache", {})
+        super().__init__(*components, **kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        self._cache.clear()
+
+    def _memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """해당 벡터에 저장된 값을 반환하며, 없을 시 compute로 계산하여 저장함."""
+        cache = self._cache
+        try:
+            value = cache[key]
+        except KeyError:
+            VECTOR_CACHE_STATS.misses += 1
+            value = cache[key] = compute()
+            return value
+        VECTOR_CACHE_STATS.hits += 1
+        return value
+
+    def _memo_rotation(
+        self, key: tuple[float, ...], rotation: Callable[[Any], Any], result_type: type
+    ) -> Any:
+        """같은 방향으로 마지막에 회전시킨 결과가 저장되어 있으면 재사용함."""
+        cached = self._cache.get("rotate")
+        if cached is not None and cached[0] == key:
+            VECTOR_CACHE_STATS.hits += 1
+            return result_type(*cached[1])
+        VECTOR_CACHE_STATS.misses += 1
+        result = rotation(key).apply(self)
+        # 반환된 벡터가 수정되어도 캐시가 오염되지 않도록 성분만 저장함
+        self._cache["rotate"] = (key, (*result,))
+        return result
+
+    def invalidate(self) -> None:
+        """해당 벡터에 저장된 값들을 모두 지움. 성분이 바뀔 때 자동으로 호출됨."""
+        self._cache.clear()
+
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        # 저장된 값은 복사본과 공유하지 않음
+        return (type(self), tuple(self))
+
+
+class CachedVector2(_CachedVector, Vector2):
+    """마지막 회전 결과를 캐시하고 회전 행렬을 공유하는 평면벡터 클래스.
+
+    연산 결과는 일반 평면벡터(Vector2)로 반환됨.
+    """
+
+    __slots__ = ("_cache",)
+
+    def rotate(self, degree: float) -> Vector2:
+        """해당 평면벡터를 회전시킴. 회전 행렬은 회전 캐시에서 불러옴.
+
+        Args:
+            degree (float): 회전시킬 각도. [도]
+
+        Returns:
+            Vector2: 회전된 평면벡터.
+        """
+        return self._memo_rotation((degree,), _rotation_2d_from_key, Vector2)
+
+
+class CachedVector3(_CachedVector, Vector3):
+    """오일러각과 마지막 회전 결과를 캐시하고 회전 행렬을 공유하는 공간벡터 클래스.
+
+    연산 결과는 일반 공간벡터(Vector3)로 반환됨.
+    """
+
+    __slots__ = ("_cache",)
+
+    def to_euler_angles(self) -> Vector3:
+        """해당 공간벡터를 오일러각(roll, pitch, yaw)으로 변환함. 성분이 바뀌기 전까지 다시 계산하지 않음.
+
+        Returns:
+            Vector3: 오일러각을 나타내는 Vector3 (x: roll, y: pitch, z: yaw) [라디안]
+        """
+        # 반환된 벡터가 수정되어도 캐시가 오염되지 않도록 성분만 저장함
+        return Vector3(*self._memo("euler", lambda: tuple(super(CachedVector3, self).to_euler_angles())))
+
+    def rotate(self, euler_angles: Vector3 | list[float]) -> Vector3:
+        """오일러 각도를 입력으로 받아 공간벡터를 회전시킴. 회전 행렬은 회전 캐시에서 불러옴.
+
+        Args:
+            euler_angles (Vector3 | list[float]): 오일러 각도 벡터 (roll, pitch, yaw) [라디안].
+
+        Returns:
+            Vector3: 회전된 공간벡터.
+        """
+        if isinstance(euler_angles, Vector3):
+            key = (euler_angles.x, euler_angles.y, euler_angles.z)
+        else:
+            key = tuple(euler_angles)
+        return self._memo_rotation(key, cached_rotation_3d, Vector3)
+
@@ -0,0 +1,322 @@
+"""벡터 연산을 지연 계산하기 위한 모듈
+
+lazy()로 감싼 벡터, 벡터 배열, 스칼라끼리의 연산은 즉시 계산되지 않고 식 트리를 만듦.
+evaluate()를 호출하면 식 트리 전체가 하나의 함수로 합쳐져, 중간 벡터나 중간 배열을 만들지 않고
+벡터마다 한 번씩만 계산됨. 같은 부분식은 한 번만 계산되며, 합쳐진 함수는 식의 형태별로 캐시됨.
+
+    a, b, c = lazy(batch_a), lazy(batch_b), lazy(batch_c)
+    result = ((a + b) / 2 - c).evaluate()
+"""
+
+from __future__ import annotations
+from array import array
+from functools import lru_cache
+from itertools import chain, repeat
+from math import hypot
+from operator import add, floordiv, mod, mul, neg, sub, truediv
+from typing import Any, Callable
+
+from Vector.batch import VectorArray, _array_type
+from Vector.vector import Vector, _is_real_num
+
+_SYMBOLS: dict[Callable[[Any, Any], Any], str] = {
+    add: "+",
+    sub: "-",
+    mul: "*",
+    truediv: "/",
+    floordiv: "//",
+    mod: "%",
+}
+
+
+class Expression:
+    """지연 계산되는 벡터 식을 표현하기 위한 클래스.
+
+    각 식은 벡터마다 벡터(demention > 0), 혹은 스칼라(demention == 0)를 계산함.
+    ``*`` 는 Vector와 같이 내적을(스칼라와의 곱도 모든 성분에 곱한 후 더함), ``@`` 는 외적을 나타냄.
+    """
+
+    __slots__ = ("_operator", "_operands", "_demention", "_value")
+
+    def __init__(
+        self,
+        operator: str,
+        operands: tuple[Expression, ...],
+        demention: int,
+        value: Any = None,
+    ) -> None:
+        """식을 정의함. 직접 생성하지 않고 lazy()와 연산자를 사용함.
+
+        Args:
+            operator (str): 연산의 종류. 값을 그대로 나타내는 식은 "leaf".
+            operands (tuple[Expression, ...]): 피연산자 식들.
+            demention (int): 결과 벡터의 차원. 스칼라일 시 0.
+            value (Any, optional): "leaf"일 시 감싼 벡터, 벡터 배열, 혹은 스칼라. Defaults to None.
+        """
+        self._operator = operator
+        self._operands = operands
+        self._demention = demention
+        self._value = value
+
+    @property
+    def demention(self) -> int:
+        """식의 결과 벡터의 차원을 반환함. 스칼라일 시 0.
+
+        Returns:
+            int: 차원
+        """
+        return self._demention
+
+    def _binary(self, operator: Callable[[Any, Any], Any], other: Any, reflected: bool = False) -> Expression:
+        """두 식 사이의 연산을 나타내는 식을 만듦. 벡터와 스칼라의 연산은 스칼라를 모든 성분에 적용함."""
+        other = lazy(other)
+        left, right = (other, self) if reflected else (self, other)
+        if left._demention and right._demention and left._demention != right._demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        if operator is mul and (left._demention or right._demention):
+            # Vector와 같이, 벡터와의 곱은 스칼라와의 곱도 내적으로 계산함
+            return Expression("dot", (left, right), 0)
+        return Expression(_SYMBOLS[operator], (left, right), left._demention or right._demention)
+
+    def __add__(self, other: Any) -> Expression:
+        return self._binary(add, other)
+
+    def __sub__(self, other: Any) -> Expression:
+        return self._binary(sub, other)
+
+    def __mul__(self, other: Any) -> Expression:
+        return self._binary(mul, other)
+
+    def __truediv__(self, other: Any) -> Expression:
+        return self._binary(truediv, other)
+
+    def __floordiv__(self, other: Any) -> Expression:
+        return self._binary(floordiv, other)
+
+    def __mod__(self, other: Any) -> Expression:
+        return self._binary(mod, other)
+
+    def __radd__(self, other: Any) -> Expression:
+        return self._binary(add, other, reflected=True)
+
+    def __rsub__(self, other: Any) -> Expression:
+        return self._binary(sub, other, reflected=True)
+
+    def __rmul__(self, other: Any) -> Expression:
+        return self._binary(mul, other, reflected=True)
+
+    def __rtruediv__(self, other: Any) -> Expression:
+        return self._binary(truediv, other, reflected=True)
+
+    def __rfloordiv__(self, other: Any) -> Expression:
+        return self._binary(floordiv, other, reflected=True)
+
+    def __rmod__(self, other: Any) -> Expression:
+        return self._binary(mod, other, reflected=True)
+
+    def __matmul__(self, other: Any) -> Expression:
+        """두 공간벡터 식의 외적을 나타내는 식을 만듦. Vector3와 같이, 스칼라는 모든 성분이 같은 공간벡터로 봄.
+
+        Raises:
+            TypeError: 공간벡터가 아닌 식과 연산하거나, 두 식이 모두 스칼라일 때 발생하는 에러.
+        """
+        other = lazy(other)
+        if (self._demention, other._demention) not in ((3, 3), (3, 0), (0, 3)):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        return Expression("cross", (self, other), 3)
+
+    def __rmatmul__(self, other: Any) -> Expression:
+        return lazy(other).__matmul__(self)
+
+    def __neg__(self) -> Expression:
+        return Expression("neg", (self,), self._demention)
+
+    def __pos__(self) -> Expression:
+        return self
+
+    def norm(self) -> Expression:
+        """벡터 식의 크기를 나타내는 식을 만듦.
+
+        Raises:
+            TypeError: 스칼라 식의 크기를 구하려 할 때 발생하는 에러.
+
+        Returns:
+            Expression: 벡터마다 크기를 계산하는 스칼라 식.
+        """
+        if not self._demention:
+            raise TypeError("The norm of a scalar expression is not defined.")
+        return Expression("norm", (self,), 0)
+
+    def dot(self, other: Any) -> Expression:
+        """두 벡터 식의 내적을 나타내는 식을 만듦. (self * other와 같음)"""
+        return self._binary(mul, other)
+
+    def evaluate(self) -> Vector | VectorArray | array | float:
+        """식 전체를 하나의 함수로 합쳐 계산함.
+
+        Raises:
+            TypeError: 정밀도가 다른 벡터 배열들이 식에 포함되어 있을 때 발생하는 에러.
+            ValueError: 길이가 다른 벡터 배열들이 식에 포함되어 있을 때 발생하는 에러.
+
+        Returns:
+            Vector | VectorArray | array | float: 벡터 배열이 포함된 식은 같은 정밀도의 벡터 배열(스칼라 식은 array)을,
+                아니면 벡터(스칼라 식은 float)를 반환함.
+        """
+        leaves: list[Any] = []
+        source = _generate(self, leaves)
+        kernel = _compile(source)
+        batches = [leaf for leaf in leaves if isinstance(leaf, VectorArray)]
+        if not batches:
+            arguments = list(chain.from_iterable(_components(leaf) for leaf in leaves))
+            result = kernel(*arguments)
+            if not self._demention:
+                return result
+            return self._vector_type(leaves)(*result)
+
+        count = len(batches[0])
+        if any(len(batch) != count for batch in batches):
+            raise ValueError("Operations cannot be performed with batches of different length.")
+        typecode = batches[0]._typecode
+        if any(batch._typecode != typecode for batch in batches):
+            raise TypeError(
+                "Operations cannot be performed with batches of different precision. "
+                "Use astype() to convert explicitly."
+            )
+        streams: list[Any] = []
+        for leaf in leaves:
+            if isinstance(leaf, VectorArray):
+                # 같은 반복자를 차원 수만큼 넘겨, 한 번에 한 벡터의 성분들을 차례로 꺼냄
+                streams.extend([iter(leaf.data)] * leaf.demention)
+            else:
+                streams.extend(_repeat_components(leaf, count))
+        results = map(kernel, *streams)
+        if not self._demention:
+            return array(typecode, results)
+        array_type = _array_type(self._vector_type(leaves))
+        return array_type._wrap(array(typecode, chain.from_iterable(results)))
+
+    def _vector_type(self, leaves: list[Any]) -> type[Vector]:
+        """결과와 같은 차원인 첫 번째 벡터, 혹은 벡터 배열의 벡터 클래스를 결과의 클래스로 사용함."""
+        return next(
+            leaf._VECTOR_TYPE
+            for leaf in leaves
+            if isinstance(leaf, (Vector, VectorArray)) and leaf.demention == self._demention
+        )
+
+    def __repr__(self) -> str:
+        if self._operator == "leaf":
+            return repr(self._value) if _is_real_num(self._value) else f"<{type(self._value).__name__}>"
+        if self._operator in ("neg", "norm", "cross", "dot"):
+            return f"{self._operator}({', '.join(map(repr, self._operands))})"
+        left, right = self._operands
+        return f"({left!r} {self._operator} {right!r})"
+
+
+def lazy(value: Vector | VectorArray | Expression | float | int) -> Expression:
+    """벡터, 벡터 배열, 혹은 스칼라를 지연 계산되는 식으로 감쌈.
+
+    Args:
+        value (Vector | VectorArray | Expression | float | int): 감쌀 값. 이미 식이면 그대로 반환함.
+
+    Raises:
+        TypeError: 벡터, 벡터 배열, 스칼라가 아닌 값이 주어졌을 때 발생하는 에러.
+
+    Returns:
+        Expression: 값을 나타내는 식.
+    """
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, (Vector, VectorArray)):
+        return Expression("leaf", (), value.demention, value)
+    if _is_real_num(value) and value is not None:
+        return Expression("leaf", (), 0, value)
+    raise TypeError("Only vectors, vector batches and scalars can be used in an expression.")
+
+
+def _components(leaf: Any) -> tuple[Any, ...]:
+    """벡터의 성분들, 혹은 스칼라 하나를 튜플로 반환함."""
+    return tuple(leaf) if isinstance(leaf, Vector) else (leaf,)
+
+
+def _repeat_components(leaf: Any, count: int) -> list[repeat[Any]]:
+    """벡터 배열과 함께 계산할 벡터나 스칼라의 각 성분을 count번 반복함."""
+    return [repeat(component, count) for component in _components(leaf)]
+
+
+def _generate(expression: Expression, leaves: list[Any]) -> str:
+    """식 트리를 벡터 하나를 계산하는 함수의 소스 코드로 변환함.
+
+    구조가 같은 부분식은 같은 지역 변수에 한 번만 계산되며, 감싼 값들은 처음 등장한 순서대로
+    leaves에 추가되어 함수의 인자가 됨. 소스 코드는 식의 구조에만 의존하므로 캐시의 키로 사용됨.
+    """
+    parameters: list[str] = []
+    lines: list[str] = []
+    leaf_names: dict[int, list[str]] = {}
+    subexpressions: dict[tuple[Any, ...], tuple[Any, list[str]]] = {}
+
+    def visit(node: Expression) -> tuple[Any, list[str]]:
+        """노드를 계산하는 코드를 추가하고, (구조 키, 성분별 변수 이름)을 반환함."""
+        if node._operator == "leaf":
+            names = leaf_names.get(id(node._value))
+            if names is None:
+                index = len(leaves)
+                leaves.append(node._value)
+                width = node._demention or 1
+                names = [f"v{index}_{axis}" for axis in range(width)]
+                parameters.extend(names)
+                leaf_names[id(node._value)] = names
+            return (names[0],), names
+
+        children = [visit(operand) for operand in node._operands]
+        key = (node._operator, node._demention, *(child_key for child_key, _ in children))
+        if key in subexpressions:
+            return subexpressions[key]
+
+        operands = [names for _, names in children]
+        if node._operator == "neg":
+            (value,) = operands
+            values = [f"-{name}" for name in value]
+        elif node._operator == "norm":
+            (value,) = operands
+            values = [f"hypot({', '.join(value)})"]
+        elif node._operator == "dot":
+            left, right = operands
+            width = max(len(left), len(right))
+            left = left * width if len(left) == 1 else left
+            right = right * width if len(right) == 1 else right
+            values = [" + ".join(f"{a} * {b}" for a, b in zip(left, right))]
+        elif node._operator == "cross":
+            left, right = operands
+            ax, ay, az = left * 3 if len(left) == 1 else left
+            bx, by, bz = right * 3 if len(right) == 1 else right
+            values = [
+                f"({ay} * {bz}) - ({az} * {by})",
+                f"({az} * {bx}) - ({ax} * {bz})",
+                f"({ax} * {by}) - ({ay} * {bx})",
+            ]
+        else:
+            left, right = operands
+            width = node._demention or 1
+            left = left * width if len(left) == 1 else left
+            right = right * width if len(right) == 1 else right
+            values = [f"{a} {node._operator} {b}" for a, b in zip(left, right)]
+
+        index = len(subexpressions)
+        names = [f"t{index}_{axis}" for axis in range(len(values))]
+        lines.extend(f"    {name} = {value}" for name, value in zip(names, values))
+        subexpressions[key] = (key, names)
+        return key, names
+
+    _, result = visit(expression)
+    returned = result[0] if not expression._demention else f"({', '.join(result)},)"
+    return "\n".join(
+        [f"def kernel({', '.join(parameters)}):", *lines, f"    return {returned}"]
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile(source: str) -> Callable[..., Any]:
+    """_generate로 만든 소스 코드를 함수로 만듦. 같은 구조의 식은 컴파일된 함수를 재사용함."""
+    namespace: dict[str, Any] = {"hypot": hypot}
+    exec(compile(source, "<Vector.expression>", "exec"), namespace)
+    return namespace["kernel"]
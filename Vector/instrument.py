@@ -0,0 +1,223 @@
+"""벡터 연산의 호출 횟수, 실행 시간, 생성된 객체 수를 측정하기 위한 모듈
+
+enable()을 호출하면 벡터 클래스들의 메서드를 측정용 함수로 교체하고, disable()을 호출하면 원래의
+메서드로 되돌림. 따라서 측정을 끈 상태에서는 추가 비용이 전혀 없음.
+
+    with measure() as result:
+        simulate()
+    print(result.snapshot.allocations)
+
+스칼라와의 연산은 "Vector3.__mul__(scalar)"와 같이 따로 집계되며, 연산 중에 생성된 벡터는 해당 연산에
+할당으로 기록되어 어떤 연산이 임시 객체를 만드는지 알 수 있음.
+"""
+
+from __future__ import annotations
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.batch import VectorArray
+from Vector.vector import Vector, Vector2, Vector3, Vector4, _is_real_num
+
+DEFAULT_CLASSES: tuple[type, ...] = (Vector, Vector2, Vector3, Vector4, VectorArray)
+# 측정하지 않는 메서드. 생성자는 따로 측정됨
+_EXCLUDED = frozenset(
+    ("__init__", "__new__", "__repr__", "__str__", "__setattr__", "__getattribute__", "__array__")
+)
+_DIRECT = "<direct>"
+
+_originals: dict[tuple[type, str], Callable[..., Any]] = {}
+_calls: Counter[str] = Counter()
+_time_ns: Counter[str] = Counter()
+_constructions: Counter[str] = Counter()
+_allocations: Counter[str] = Counter()
+# 현재 실행 중인 측정 대상 연산들의 이름
+_active: list[str] = []
+
+
+class Snapshot:
+    """특정 시점까지 집계된 측정 결과를 담는 클래스.
+
+    두 스냅샷의 차(later - earlier)는 그 사이에 집계된 결과를 나타냄.
+    """
+
+    __slots__ = ("calls", "time_ns", "constructions", "allocations")
+
+    def __init__(
+        self,
+        calls: Counter[str],
+        time_ns: Counter[str],
+        constructions: Counter[str],
+        allocations: Counter[str],
+    ) -> None:
+        """측정 결과를 정의함.
+
+        Args:
+            calls (Counter[str]): "클래스.메서드"별 호출 횟수.
+            time_ns (Counter[str]): "클래스.메서드"별 누적 실행 시간. 내부에서 호출한 메서드의 시간을 포함함. [나노초]
+            constructions (Counter[str]): 클래스별 생성된 객체의 수.
+            allocations (Counter[str]): 객체를 생성한 연산별 생성된 객체의 수. 연산 밖에서 직접 생성된 경우 "<direct>".
+        """
+        self.calls = calls
+        self.time_ns = time_ns
+        self.constructions = constructions
+        self.allocations = allocations
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """측정 결과를 메트릭으로 내보내기 위한 dict로 반환함.
+
+        Returns:
+            dict[str, dict[str, int]]: calls, time_ns, constructions, allocations를 키로 가지는 dict.
+        """
+        return {
+            "calls": dict(self.calls),
+            "time_ns": dict(self.time_ns),
+            "constructions": dict(self.constructions),
+            "allocations": dict(self.allocations),
+        }
+
+    def temporary_ratio(self, operation: str) -> float:
+        """전체 생성된 객체 중 해당 연산에서 생성된 객체의 비율을 구함.
+
+        Args:
+            operation (str): 연산의 이름. (예: "Vector3.__mul__(scalar)")
+
+        Returns:
+            float: 0.0 ~ 1.0 사이의 비율. 생성된 객체가 없으면 0.0.
+        """
+        total = sum(self.allocations.values())
+        return self.allocations[operation] / total if total else 0.0
+
+    def __sub__(self, other: Snapshot) -> Snapshot:
+        return Snapshot(
+            self.calls - other.calls,
+            self.time_ns - other.time_ns,
+            self.constructions - other.constructions,
+            self.allocations - other.allocations,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Snapshot(calls={sum(self.calls.values())}, "
+            f"constructions={sum(self.constructions.values())})"
+        )
+
+
+def _instrument_method(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """호출 횟수와 실행 시간을 집계하는 함수로 메서드를 감쌈."""
+
+    @wraps(method)
+    def instrumented(self: Any, *args: Any, **kwargs: Any) -> Any:
+        key = f"{type(self).__name__}.{name}"
+        if len(args) == 1 and _is_real_num(args[0]) and args[0] is not None:
+            key += "(scalar)"
+        _calls[key] += 1
+        _active.append(key)
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _time_ns[key] += perf_counter_ns() - start
+            _active.pop()
+
+    return instrumented
+
+
+def _instrument_constructor(method: Callable[..., Any]) -> Callable[..., Any]:
+    """생성된 객체의 수를 클래스별, 생성한 연산별로 집계하는 함수로 생성자를 감쌈."""
+
+    @wraps(method)
+    def instrumented(self: Any, *args: Any, **kwargs: Any) -> None:
+        _constructions[type(self).__name__] += 1
+        _allocations[_active[-1] if _active else _DIRECT] += 1
+        method(self, *args, **kwargs)
+
+    return instrumented
+
+
+def is_enabled() -> bool:
+    """측정이 켜져 있는지 반환함.
+
+    Returns:
+        bool: 측정 중일 시 True.
+    """
+    return bool(_originals)
+
+
+def enable(classes: Iterable[type] = DEFAULT_CLASSES) -> None:
+    """주어진 클래스들의 메서드를 측정용 함수로 교체함. 하위 클래스들도 함께 측정됨.
+
+    이미 측정 중인 경우, 새로 주어진 클래스들만 추가로 측정함.
+
+    Args:
+        classes (Iterable[type], optional): 측정할 클래스들. Defaults to DEFAULT_CLASSES.
+    """
+    for cls in classes:
+        for name, member in list(vars(cls).items()):
+            if not callable(member) or isinstance(member, type) or (cls, name) in _originals:
+                continue
+            if name == "__init__":
+                _originals[(cls, name)] = member
+                setattr(cls, name, _instrument_constructor(member))
+            elif name not in _EXCLUDED and (not name.startswith("_") or name.endswith("__")):
+                _originals[(cls, name)] = member
+                setattr(cls, name, _instrument_method(name, member))
+
+
+def disable() -> None:
+    """모든 메서드를 원래대로 되돌림. 집계된 결과는 유지됨."""
+    for (cls, name), member in _originals.items():
+        setattr(cls, name, member)
+    _originals.clear()
+
+
+def reset() -> None:
+    """집계된 결과를 모두 지움."""
+    _calls.clear()
+    _time_ns.clear()
+    _constructions.clear()
+    _allocations.clear()
+
+
+def snapshot() -> Snapshot:
+    """지금까지 집계된 결과를 복사하여 반환함.
+
+    Returns:
+        Snapshot: 집계된 결과.
+    """
+    return Snapshot(Counter(_calls), Counter(_time_ns), Counter(_constructions), Counter(_allocations))
+
+
+class Measurement:
+    """measure()로 측정한 구간의 결과를 담는 클래스. 구간이 끝난 후 snapshot이 채워짐."""
+
+    __slots__ = ("snapshot",)
+
+    def __init__(self) -> None:
+        self.snapshot: Snapshot | None = None
+
+
+@contextmanager
+def measure(classes: Iterable[type] = DEFAULT_CLASSES) -> Iterator[Measurement]:
+    """with 구문 안에서 실행된 연산만을 측정함.
+
+    측정이 꺼져 있었다면 구간이 끝난 후 다시 끔. 다른 구간 안에 중첩하여 사용할 수 있음.
+
+    Args:
+        classes (Iterable[type], optional): 측정할 클래스들. Defaults to DEFAULT_CLASSES.
+
+    Yields:
+        Iterator[Measurement]: 구간이 끝난 후 결과가 채워지는 객체.
+    """
+    was_enabled = is_enabled()
+    enable(classes)
+    before = snapshot()
+    measurement = Measurement()
+    try:
+        yield measurement
+    finally:
+        measurement.snapshot = snapshot() - before
+        if not was_enabled:
+            disable()
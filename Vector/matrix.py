@@ -0,0 +1,470 @@
+"""2x2, 3x3, 4x4 행렬을 표현하고 벡터에 선형 변환을 적용하기 위한 모듈"""
+
+from __future__ import annotations
+from array import array
+from functools import reduce
+from itertools import chain, repeat
+from operator import add, mul, truediv
+from typing import Any, Iterable, Iterator
+
+from Vector.batch import Vector2Array, Vector3Array, Vector4Array, VectorArray
+from Vector.quaternion import Quaternion
+from Vector.rotation import Rotation2D, Rotation3D
+from Vector.vector import Vector, Vector2, Vector3, Vector4, _is_real_num
+
+
+def _linear_combinations(
+    elements: tuple[float, ...], size: int, columns: list[Any], translate: bool = False
+) -> list[Iterator[float]]:
+    """행렬의 각 행과 성분 열들의 선형 결합을 행마다 지연 계산함.
+
+    Args:
+        elements (tuple[float, ...]): 행 우선으로 나열된 행렬의 성분.
+        size (int): 행렬의 한 행의 길이.
+        columns (list[Any]): 각 축의 성분 시퀀스. 행의 길이보다 짧으면 나머지 열은 0으로 간주함.
+        translate (bool, optional): True일 시 columns 다음 열을 1로 간주하여 상수항으로 더함. Defaults to False.
+
+    Returns:
+        list[Iterator[float]]: 각 행의 계산 결과.
+    """
+    results = []
+    for row in range(len(elements) // size):
+        start = row * size
+        terms = [map(mul, column, repeat(elements[start + i])) for i, column in enumerate(columns)]
+        combined = reduce(lambda left, right: map(add, left, right), terms)
+        if translate:
+            combined = map(add, combined, repeat(elements[start + len(columns)]))
+        results.append(combined)
+    return results
+
+
+class Matrix:
+    """정사각 행렬의 공통 동작을 정의하는 클래스"""
+
+    __slots__ = ("_elements",)
+
+    _DEMENTION: int = 0
+    _VECTOR_TYPE: type[Vector] = Vector
+    _ARRAY_TYPE: type[VectorArray] = VectorArray
+
+    def __init__(self, rows: Iterable[Iterable[float | int]] | None = None) -> None:
+        """행렬을 정의함.
+
+        Args:
+            rows (Iterable[Iterable[float | int]] | None, optional): 각 행의 성분. None일 시 단위행렬이 됨.
+                Defaults to None.
+
+        Raises:
+            TypeError: 정수, 실수가 아닌 다른 타입의 값이 성분으로 주어졌을 때 발생하는 에러.
+            ValueError: 행렬의 크기가 차원과 맞지 않을 때 발생하는 에러.
+        """
+        size = self._DEMENTION
+        if rows is None:
+            self._elements: tuple[float, ...] = self._identity_elements()
+            return
+        matrix_rows = [tuple(row) for row in rows]
+        if len(matrix_rows) != size or any(len(row) != size for row in matrix_rows):
+            raise ValueError(f"The matrix must be {size}x{size}.")
+        elements = tuple(chain.from_iterable(matrix_rows))
+        if not all(map(_is_real_num, elements)):
+            raise TypeError("The element of Matrix must be a float or int")
+        self._elements = tuple(map(float, elements))
+
+    @classmethod
+    def _identity_elements(cls) -> tuple[float, ...]:
+        """단위행렬의 성분을 행 우선으로 반환함."""
+        size = cls._DEMENTION
+        return tuple(1.0 if i % (size + 1) == 0 else 0.0 for i in range(size * size))
+
+    @classmethod
+    def _from_elements(cls, elements: tuple[float, ...]) -> Matrix:
+        """행 우선으로 나열된 성분으로부터 검사 없이 행렬을 생성함."""
+        matrix = cls.__new__(cls)
+        matrix._elements = elements
+        return matrix
+
+    @classmethod
+    def identity(cls) -> Matrix:
+        """단위행렬을 생성함.
+
+        Returns:
+            Matrix: 단위행렬.
+        """
+        return cls._from_elements(cls._identity_elements())
+
+    @property
+    def demention(self) -> int:
+        """해당 행렬의 차원을 반환합니다.
+
+        Returns:
+            int: 차원
+        """
+        return self._DEMENTION
+
+    @property
+    def rows(self) -> tuple[tuple[float, ...], ...]:
+        """해당 행렬의 각 행을 반환함.
+
+        Returns:
+            tuple[tuple[float, ...], ...]: 각 행의 성분.
+        """
+        size = self._DEMENTION
+        return tuple(self._elements[i : i + size] for i in range(0, size * size, size))
+
+    def transpose(self) -> Matrix:
+        """해당 행렬의 전치행렬을 구함.
+
+        Returns:
+            Matrix: 전치행렬.
+        """
+        size = self._DEMENTION
+        elements = self._elements
+        return self._from_elements(
+            tuple(elements[col * size + row] for row in range(size) for col in range(size))
+        )
+
+    def determinant(self) -> float:
+        """해당 행렬의 행렬식을 구함.
+
+        Returns:
+            float: 행렬식.
+        """
+        rows = [list(row) for row in self.rows]
+        size = self._DEMENTION
+        determinant = 1.0
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda row: abs(rows[row][col]))
+            if rows[pivot][col] == 0.0:
+                return 0.0
+            if pivot != col:
+                rows[col], rows[pivot] = rows[pivot], rows[col]
+                determinant = -determinant
+            determinant *= rows[col][col]
+            for row in range(col + 1, size):
+                factor = rows[row][col] / rows[col][col]
+                rows[row] = [a - factor * b for a, b in zip(rows[row], rows[col])]
+        return determinant
+
+    def inverse(self) -> Matrix:
+        """해당 행렬의 역행렬을 구함. (가우스-조던 소거법)
+
+        Raises:
+            ValueError: 역행렬이 존재하지 않는 행렬일 때 발생하는 에러.
+
+        Returns:
+            Matrix: 역행렬.
+        """
+        size = self._DEMENTION
+        identity = self._identity_elements()
+        rows = [
+            list(row) + list(identity[i * size : (i + 1) * size]) for i, row in enumerate(self.rows)
+        ]
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda row: abs(rows[row][col]))
+            if rows[pivot][col] == 0.0:
+                raise ValueError("The matrix is singular and cannot be inverted.")
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            scale = rows[col][col]
+            rows[col] = [value / scale for value in rows[col]]
+            for row in range(size):
+                if row != col and rows[row][col] != 0.0:
+                    factor = rows[row][col]
+                    rows[row] = [a - factor * b for a, b in zip(rows[row], rows[col])]
+        return self._from_elements(tuple(chain.from_iterable(row[size:] for row in rows)))
+
+    def __matmul__(self, other: Matrix | Vector | VectorArray) -> Matrix | Vector | VectorArray:
+        """행렬곱을 계산함. 벡터 배열이 주어지면 모든 벡터에 한 번에 적용함.
+
+        Args:
+            other (Matrix | Vector | VectorArray): 곱할 행렬, 벡터, 혹은 벡터 배열.
+
+        Raises:
+            TypeError: 타 차원의 행렬, 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Matrix | Vector | VectorArray: 연산 결과.
+        """
+        size = self._DEMENTION
+        elements = self._elements
+        if isinstance(other, type(self)):
+            right = other._elements
+            return self._from_elements(
+                tuple(
+                    sum(elements[row * size + k] * right[k * size + col] for k in range(size))
+                    for row in range(size)
+                    for col in range(size)
+                )
+            )
+        if isinstance(other, self._VECTOR_TYPE):
+            components = tuple(other)
+            return self._VECTOR_TYPE(
+                *(
+                    sum(map(mul, elements[row * size : (row + 1) * size], components))
+                    for row in range(size)
+                )
+            )
+        if isinstance(other, self._ARRAY_TYPE):
+            columns = [other.component(i) for i in range(size)]
+            results = _linear_combinations(elements, size, columns)
+            return self._ARRAY_TYPE._wrap(array(other._typecode, chain.from_iterable(zip(*results))))
+        raise TypeError("Operations cannot be performed with matrices of other dimensions.")
+
+    def __add__(self, other: Matrix) -> Matrix:
+        """행렬의 합을 계산함.
+
+        Args:
+            other (Matrix): 더해질 행렬.
+
+        Raises:
+            TypeError: 타 차원의 행렬과 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Matrix: 연산 결과.
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Operations cannot be performed with matrices of other dimensions.")
+        return self._from_elements(tuple(map(add, self._elements, other._elements)))
+
+    def __sub__(self, other: Matrix) -> Matrix:
+        """행렬의 차를 계산함.
+
+        Args:
+            other (Matrix): 빠질 행렬.
+
+        Raises:
+            TypeError: 타 차원의 행렬과 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Matrix: 연산 결과.
+        """
+        if not isinstance(other, type(self)):
+            raise TypeError("Operations cannot be performed with matrices of other dimensions.")
+        return self._from_elements(tuple(a - b for a, b in zip(self._elements, other._elements)))
+
+    def __mul__(self, other: int | float) -> Matrix:
+        """행렬의 스칼라배를 계산함. 행렬곱은 @ 연산자를 사용함.
+
+        Args:
+            other (int | float): 곱할 스칼라.
+
+        Raises:
+            TypeError: 스칼라가 아닌 자료형과 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Matrix: 연산 결과.
+        """
+        if not _is_real_num(other):
+            raise TypeError("Use the @ operator for matrix products.")
+        return self._from_elements(tuple(map(mul, self._elements, repeat(other))))
+
+    def __rmul__(self, other: int | float) -> Matrix:
+        return self * other
+
+    def __neg__(self) -> Matrix:
+        """해당 행렬의 모든 성분의 부호를 바꿈.
+
+        Returns:
+            Matrix: 연산 결과.
+        """
+        return self * -1.0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._elements == other._elements
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._elements))
+
+    def __getitem__(self, index: int | tuple[int, int]) -> float | tuple[float, ...]:
+        if isinstance(index, tuple):
+            row, col = index
+            size = self._DEMENTION
+            if not (-size <= row < size and -size <= col < size):
+                raise IndexError
+            return self._elements[(row % size) * size + col % size]
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[tuple[float, ...]]:
+        return iter(self.rows)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rows!r})"
+
+
+class Matrix2(Matrix):
+    """2x2 행렬을 표현하기 위한 클래스"""
+
+    __slots__ = ()
+
+    _DEMENTION = 2
+    _VECTOR_TYPE = Vector2
+    _ARRAY_TYPE = Vector2Array
+
+    @classmethod
+    def from_rotation(cls, rotation: Rotation2D) -> Matrix2:
+        """평면 회전으로부터 회전 행렬을 생성함.
+
+        Args:
+            rotation (Rotation2D): 평면 회전.
+
+        Returns:
+            Matrix2: 회전 행렬.
+        """
+        return cls(rotation.matrix)
+
+
+class Matrix3(Matrix):
+    """3x3 행렬을 표현하기 위한 클래스"""
+
+    __slots__ = ()
+
+    _DEMENTION = 3
+    _VECTOR_TYPE = Vector3
+    _ARRAY_TYPE = Vector3Array
+
+    @classmethod
+    def from_rotation(cls, rotation: Rotation3D | Quaternion) -> Matrix3:
+        """공간 회전, 혹은 단위 사원수로부터 회전 행렬을 생성함.
+
+        Args:
+            rotation (Rotation3D | Quaternion): 공간 회전, 혹은 단위 사원수.
+
+        Returns:
+            Matrix3: 회전 행렬.
+        """
+        if isinstance(rotation, Quaternion):
+            rotation = rotation.to_rotation()
+        return cls(rotation.matrix)
+
+    @classmethod
+    def scale(cls, factors: Vector3 | int | float) -> Matrix3:
+        """축별 크기 변환 행렬을 생성함.
+
+        Args:
+            factors (Vector3 | int | float): 각 축의 배율. 스칼라일 시 모든 축에 적용됨.
+
+        Returns:
+            Matrix3: 크기 변환 행렬.
+        """
+        x, y, z = factors if isinstance(factors, Vector3) else (factors,) * 3
+        return cls(((x, 0.0, 0.0), (0.0, y, 0.0), (0.0, 0.0, z)))
+
+
+class Matrix4(Matrix):
+    """4x4 행렬을 표현하기 위한 클래스. 공간벡터의 동차 좌표 변환에 사용됨."""
+
+    __slots__ = ()
+
+    _DEMENTION = 4
+    _VECTOR_TYPE = Vector4
+    _ARRAY_TYPE = Vector4Array
+
+    @classmethod
+    def from_linear(cls, linear: Matrix3, translation: Vector3 | None = None) -> Matrix4:
+        """3x3 선형 변환과 평행 이동으로부터 아핀 변환 행렬을 생성함.
+
+        Args:
+            linear (Matrix3): 선형 변환 행렬.
+            translation (Vector3 | None, optional): 평행 이동량. Defaults to None.
+
+        Returns:
+            Matrix4: 아핀 변환 행렬.
+        """
+        tx, ty, tz = translation if translation is not None else (0.0, 0.0, 0.0)
+        (a, b, c), (d, e, f), (g, h, i) = linear.rows
+        return cls(((a, b, c, tx), (d, e, f, ty), (g, h, i, tz), (0.0, 0.0, 0.0, 1.0)))
+
+    @classmethod
+    def from_rotation(
+        cls, rotation: Rotation3D | Quaternion, translation: Vector3 | None = None
+    ) -> Matrix4:
+        """공간 회전, 혹은 단위 사원수와 평행 이동으로부터 변환 행렬을 생성함.
+
+        Args:
+            rotation (Rotation3D | Quaternion): 공간 회전, 혹은 단위 사원수.
+            translation (Vector3 | None, optional): 평행 이동량. Defaults to None.
+
+        Returns:
+            Matrix4: 변환 행렬.
+        """
+        return cls.from_linear(Matrix3.from_rotation(rotation), translation)
+
+    @classmethod
+    def translation(cls, offset: Vector3) -> Matrix4:
+        """평행 이동 행렬을 생성함.
+
+        Args:
+            offset (Vector3): 평행 이동량.
+
+        Returns:
+            Matrix4: 평행 이동 행렬.
+        """
+        return cls.from_linear(Matrix3.identity(), offset)
+
+    @classmethod
+    def scale(cls, factors: Vector3 | int | float) -> Matrix4:
+        """축별 크기 변환 행렬을 생성함.
+
+        Args:
+            factors (Vector3 | int | float): 각 축의 배율. 스칼라일 시 모든 축에 적용됨.
+
+        Returns:
+            Matrix4: 크기 변환 행렬.
+        """
+        return cls.from_linear(Matrix3.scale(factors))
+
+    def is_affine(self) -> bool:
+        """해당 행렬의 마지막 행이 (0, 0, 0, 1)인지 확인함.
+
+        Returns:
+            bool: 아핀 변환일 시 True를 리턴.
+        """
+        return self._elements[12:16] == (0.0, 0.0, 0.0, 1.0)
+
+    def transform_point(self, point: Vector3 | Vector3Array) -> Vector3 | Vector3Array:
+        """공간벡터를 W = 1인 점으로 보고 변환함. 아핀 변환이 아니면 W로 나눔.
+
+        Args:
+            point (Vector3 | Vector3Array): 변환할 점, 혹은 점들의 배열.
+
+        Raises:
+            TypeError: 공간벡터가 아닌 자료형이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector3 | Vector3Array: 변환된 점, 혹은 점들의 배열.
+        """
+        if isinstance(point, Vector3):
+            result = self @ Vector4(point.x, point.y, point.z, 1.0)
+            if self.is_affine():
+                return result.to_3d()
+            return Vector3(result.x / result.w, result.y / result.w, result.z / result.w)
+        if isinstance(point, Vector3Array):
+            columns = [point.x, point.y, point.z]
+            results = _linear_combinations(self._elements, 4, columns, translate=True)
+            x, y, z, w = results
+            if not self.is_affine():
+                w = array("d", w)
+                x, y, z = map(truediv, x, w), map(truediv, y, w), map(truediv, z, w)
+            return Vector3Array._wrap(array(point._typecode, chain.from_iterable(zip(x, y, z))))
+        raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+
+    def transform_direction(self, direction: Vector3 | Vector3Array) -> Vector3 | Vector3Array:
+        """공간벡터를 W = 0인 방향으로 보고 변환함. 평행 이동은 적용되지 않음.
+
+        Args:
+            direction (Vector3 | Vector3Array): 변환할 방향, 혹은 방향들의 배열.
+
+        Raises:
+            TypeError: 공간벡터가 아닌 자료형이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector3 | Vector3Array: 변환된 방향, 혹은 방향들의 배열.
+        """
+        if isinstance(direction, Vector3):
+            return (self @ Vector4(direction.x, direction.y, direction.z, 0.0)).to_3d()
+        if isinstance(direction, Vector3Array):
+            columns = [direction.x, direction.y, direction.z]
+            x, y, z, _ = _linear_combinations(self._elements, 4, columns)
+            return Vector3Array._wrap(array(direction._typecode, chain.from_iterable(zip(x, y, z))))
+        raise TypeError("Operations cannot be performed with vectors of other dimensions.")
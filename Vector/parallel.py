@@ -0,0 +1,312 @@
+"""큰 벡터 배열의 연산을 청크로 나누어 여러 스레드, 혹은 여러 프로세스에서 실행하기 위한 모듈
+
+모든 실행기는 같은 인터페이스를 가지므로 서로 바꾸어 사용할 수 있음.
+
+    with ProcessExecutor(workers=32) as executor:
+        rotated = executor.transform(methodcaller("rotate", Vector3(0.1, 0.2, 0.3)), batch)
+        executor.apply(Vector3Array.normalize, batch)
+
+- SerialExecutor: 현재 스레드에서 순서대로 실행함.
+- ThreadExecutor: 스레드 풀에서 실행함. NumPy 연산처럼 GIL을 해제하는 함수에서만 빨라짐.
+- ProcessExecutor: 프로세스 풀에서 실행함. 배열은 피클링하지 않고 공유 메모리로 전달되며,
+  함수는 피클링이 가능해야 함. (모듈 수준 함수, 메서드, operator.methodcaller 등)
+"""
+
+from __future__ import annotations
+import os
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.batch import VectorArray, _array_type
+from Vector.vector import Vector
+
+ChunkFunction = Callable[[VectorArray], "VectorArray | None"]
+
+
+def _as_batch(vectors: VectorArray | Iterable[Vector]) -> VectorArray:
+    """벡터 배열은 그대로, 벡터들은 첫 벡터의 종류에 맞는 벡터 배열로 변환하여 반환함."""
+    if isinstance(vectors, VectorArray):
+        return vectors
+    vectors = list(vectors)
+    if not vectors:
+        raise ValueError("Cannot infer the demention of an empty collection of vectors.")
+    return _array_type(type(vectors[0]))(vectors)
+
+
+def _apply_chunk(function: ChunkFunction, chunk: VectorArray) -> Any:
+    """청크에 함수를 적용하고 결과 버퍼를 반환함. 함수가 None을 반환하면 청크가 직접 수정된 것으로 봄.
+
+    결과는 원래 배열의 버퍼에 이어 쓰이므로, 정밀도가 다른 결과(astype 등)는 청크의 정밀도로 변환함.
+
+    Raises:
+        ValueError: 결과의 길이가 청크와 다를 때 발생하는 에러.
+    """
+    result = function(chunk)
+    if result is None:
+        return chunk.data
+    if len(result) != len(chunk):
+        raise ValueError("The transform must return a batch of the same length.")
+    if result._typecode != chunk._typecode:
+        return array(chunk._typecode, result.data)
+    return result.data
+
+
+def _process_chunk(
+    name: str,
+    array_type: type[VectorArray],
+    typecode: str,
+    start: int,
+    stop: int,
+    function: ChunkFunction,
+) -> None:
+    """프로세스 풀의 작업자에서 공유 메모리의 [start, stop) 구간에 함수를 적용하고 결과를 같은 자리에 씀."""
+    shared = SharedMemory(name=name)
+    try:
+        view = shared.buf.cast(typecode)[start:stop]
+        try:
+            data = _apply_chunk(function, array_type._wrap(view))
+            if data is not view:
+                view[:] = data
+        finally:
+            view.release()
+    finally:
+        shared.close()
+
+
+class BatchExecutor(ABC):
+    """벡터 배열을 청크로 나누어 함수를 적용하는 실행기의 기본 클래스.
+
+    하위 클래스는 _run_chunks를 구현하여 청크들을 실행할 방법을 정의함. 구현하지 않은 하위 클래스는 생성할 수 없음.
+    """
+
+    __slots__ = ("_workers", "_chunk_size")
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 65536) -> None:
+        """실행기를 생성함.
+
+        Args:
+            workers (int | None, optional): 작업자의 수. None일 시 CPU 코어의 수. Defaults to None.
+            chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 65536.
+
+        Raises:
+            ValueError: 작업자의 수, 혹은 청크의 크기가 1보다 작을 때 발생하는 에러.
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1 or chunk_size < 1:
+            raise ValueError("The number of workers and the chunk size must be positive.")
+        self._workers: int = workers
+        self._chunk_size: int = chunk_size
+
+    @property
+    def workers(self) -> int:
+        """작업자의 수를 반환함.
+
+        Returns:
+            int: 작업자의 수.
+        """
+        return self._workers
+
+    @property
+    def chunk_size(self) -> int:
+        """한 번에 처리할 벡터의 개수를 반환함.
+
+        Returns:
+            int: 청크의 크기.
+        """
+        return self._chunk_size
+
+    def _bounds(self, batch: VectorArray) -> Iterator[tuple[int, int]]:
+        """각 청크의 버퍼상 [시작, 끝) 위치를 순서대로 반환함."""
+        demention = batch.demention
+        count = len(batch)
+        for start in range(0, count, self._chunk_size):
+            yield start * demention, min(start + self._chunk_size, count) * demention
+
+    @staticmethod
+    def _chunk(batch: VectorArray, start: int, stop: int) -> VectorArray:
+        """버퍼의 [start, stop) 구간을 복사하여 청크로 만듦. 함수가 청크를 수정해도 원본은 바뀌지 않음."""
+        return batch._wrap(array(batch._typecode, batch.data[start:stop]))
+
+    def transform(
+        self, function: ChunkFunction, vectors: VectorArray | Iterable[Vector]
+    ) -> VectorArray:
+        """벡터들을 청크로 나누어 함수를 적용한 결과를 새로운 벡터 배열로 반환함. 주어진 벡터들은 바뀌지 않음.
+
+        Args:
+            function (ChunkFunction): 벡터 배열을 받아 같은 길이의 벡터 배열을 반환하거나,
+                받은 배열을 직접 수정하고 None을 반환하는 함수.
+            vectors (VectorArray | Iterable[Vector]): 처리할 벡터 배열, 혹은 같은 차원의 벡터들.
+
+        Raises:
+            ValueError: 함수의 결과의 길이가 청크와 다를 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 결과 벡터 배열.
+        """
+        batch = _as_batch(vectors)
+        return batch._wrap(self._run_chunks(function, batch))
+
+    def apply(self, function: ChunkFunction, batch: VectorArray) -> None:
+        """벡터 배열을 청크로 나누어 함수를 적용하고, 결과를 같은 배열에 씀.
+
+        Args:
+            function (ChunkFunction): 벡터 배열을 받아 같은 길이의 벡터 배열을 반환하거나,
+                받은 배열을 직접 수정하고 None을 반환하는 함수.
+            batch (VectorArray): 처리할 벡터 배열.
+
+        Raises:
+            ValueError: 함수의 결과의 길이가 청크와 다를 때 발생하는 에러.
+        """
+        batch.data[:] = self._run_chunks(function, batch)
+
+    @abstractmethod
+    def _run_chunks(self, function: ChunkFunction, batch: VectorArray) -> array:
+        """모든 청크에 함수를 적용하고, 결과들을 순서대로 이어붙인 버퍼를 반환함."""
+
+    def close(self) -> None:
+        """실행기가 사용하는 자원을 해제함."""
+
+    def __enter__(self) -> BatchExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class SerialExecutor(BatchExecutor):
+    """현재 스레드에서 청크들을 순서대로 처리하는 실행기."""
+
+    __slots__ = ()
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 65536) -> None:
+        """실행기를 생성함.
+
+        Args:
+            workers (int | None, optional): 사용되지 않음. 다른 실행기와 같은 인자로 생성할 수 있도록 받음. Defaults to None.
+            chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 65536.
+        """
+        super().__init__(1, chunk_size)
+
+    def _run_chunks(self, function: ChunkFunction, batch: VectorArray) -> array:
+        result = array(batch._typecode)
+        for start, stop in self._bounds(batch):
+            result.frombytes(memoryview(_apply_chunk(function, self._chunk(batch, start, stop))).cast("B"))
+        return result
+
+
+class _PoolExecutor(BatchExecutor):
+    """concurrent.futures의 풀을 처음 사용할 때 만들고, close 전까지 재사용하는 실행기.
+
+    하위 클래스는 _create_pool과 _run_chunks를 구현함.
+    """
+
+    __slots__ = ("_pool",)
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 65536) -> None:
+        super().__init__(workers, chunk_size)
+        self._pool: Executor | None = None
+
+    @abstractmethod
+    def _create_pool(self) -> Executor:
+        """청크들을 실행할 풀을 생성함."""
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            self._pool = self._create_pool()
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+class ThreadExecutor(_PoolExecutor):
+    """스레드 풀에서 청크들을 처리하는 실행기.
+
+    파이썬 코드는 GIL 때문에 동시에 실행되지 않으므로, NumPy 연산처럼 GIL을 해제하는 함수에서만 빨라짐.
+    """
+
+    __slots__ = ()
+
+    def _create_pool(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self._workers)
+
+    def _run_chunks(self, function: ChunkFunction, batch: VectorArray) -> array:
+        chunks = [self._chunk(batch, start, stop) for start, stop in self._bounds(batch)]
+        result = array(batch._typecode)
+        for chunk_result in self._get_pool().map(_apply_chunk, [function] * len(chunks), chunks):
+            result.frombytes(memoryview(chunk_result).cast("B"))
+        return result
+
+
+class ProcessExecutor(_PoolExecutor):
+    """프로세스 풀에서 청크들을 처리하는 실행기.
+
+    배열은 한 번만 공유 메모리로 복사되며, 각 작업자는 자신의 청크를 복사 없이 읽고 같은 자리에 결과를 씀.
+    작업자에게는 공유 메모리의 이름과 청크의 위치, 함수만 피클링되어 전달됨.
+    """
+
+    __slots__ = ()
+
+    def _create_pool(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self._workers)
+
+    def _run_chunks(self, function: ChunkFunction, batch: VectorArray) -> array:
+        result = array(batch._typecode)
+        source = memoryview(batch.data).cast("B")
+        if not source.nbytes:
+            return result
+        shared = SharedMemory(create=True, size=source.nbytes)
+        try:
+            shared.buf[: source.nbytes] = source
+            futures = [
+                self._get_pool().submit(
+                    _process_chunk,
+                    shared.name,
+                    type(batch),
+                    batch._typecode,
+                    start,
+                    stop,
+                    function,
+                )
+                for start, stop in self._bounds(batch)
+            ]
+            for future in futures:
+                future.result()
+            result.frombytes(shared.buf[: source.nbytes])
+        finally:
+            source.release()
+            shared.close()
+            shared.unlink()
+        return result
+
+
+_EXECUTORS: dict[str, type[BatchExecutor]] = {
+    "serial": SerialExecutor,
+    "thread": ThreadExecutor,
+    "process": ProcessExecutor,
+}
+
+
+def get_executor(backend: str = "serial", **options: Any) -> BatchExecutor:
+    """이름으로 실행기를 생성함.
+
+    Args:
+        backend (str, optional): "serial", "thread", "process" 중 하나. Defaults to "serial".
+        **options: 실행기의 생성자에 전달할 인자. (workers, chunk_size)
+
+    Raises:
+        ValueError: 지원하지 않는 이름이 주어졌을 때 발생하는 에러.
+
+    Returns:
+        BatchExecutor: 생성된 실행기.
+    """
+    try:
+        executor_type = _EXECUTORS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown executor backend: {backend!r}.") from None
+    return executor_type(**options)
@@ -0,0 +1,282 @@
+"""짧게 쓰이고 버려지는 벡터 객체를 재사용하여 할당과 GC의 부담을 줄이기 위한 모듈
+
+enable()을 호출하면 벡터 클래스들의 연산자(+, -, /, //, %, 단항 -, 스칼라와의 연산)를 결과 객체를
+free list에서 꺼내 쓰는 함수로 교체하고, disable()을 호출하면 원래의 연산자로 되돌림.
+따라서 풀링을 끈 상태에서는 추가 비용이 전혀 없음.
+
+    enable()
+    for frame in frames:
+        with arena():
+            step(world)        # 이 안에서 연산자로 생성된 임시 벡터들은 블록이 끝나면 free list로 돌아감
+    print(stats())
+
+arena는 블록 안에서 생성된 벡터 중 블록이 끝날 때 어디에서도 참조되지 않는 것만 회수하므로,
+블록 밖으로 반환되거나 다른 객체에 저장된 벡터는 안전하게 유지되며 바깥 arena로 넘겨짐.
+풀링과 arena는 프로세스 전체에 적용되며, 측정(Vector.instrument)과 동시에 사용하지 않음.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from sys import getrefcount
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.vector import (
+    Vector,
+    Vector2,
+    Vector3,
+    _ELEMENTWISE_OPERATORS,
+    _REFLECTED_OPERATORS,
+    _compile_methods,
+)
+
+DEFAULT_CLASSES: tuple[type[Vector], ...] = (Vector2, Vector3)
+DEFAULT_MAX_SIZE = 65536
+# 새로운 벡터를 결과로 생성하는 연산자. 복합 대입 연산자는 객체를 생성하지 않으므로 제외함
+_ALLOCATING = ("__neg__",) + tuple(operator[0] for operator in _ELEMENTWISE_OPERATORS + _REFLECTED_OPERATORS)
+
+
+def _unreferenced_count() -> int:
+    """리스트에만 담겨 있는 객체를 반복문에서 꺼냈을 때의 참조 횟수를 구함. (리스트, 반복 변수, 인자)"""
+    count = 0
+    for item in [object()]:
+        count = getrefcount(item)
+    return count
+
+
+_UNREFERENCED = _unreferenced_count()
+
+
+def _allocator_source(fields: tuple[str, ...]) -> str:
+    """free list에서 벡터를 꺼내 성분을 채우는 함수와, 생성한 벡터를 arena에 기록하는 함수를 만드는 함수의 소스 코드를 생성함."""
+    params = ", ".join(f"c{i}" for i in range(len(fields)))
+
+    def assign(indent: str) -> str:
+        return "".join(f"{indent}vector.{field} = c{i}\n" for i, field in enumerate(fields))
+
+    return f"""
+def allocate({params}):
+    if free:
+        vector = pop()
+    else:
+        vector = new(cls)
+        stats.misses += 1
+{assign("    ")}    return vector
+
+def tracking(record):
+    def allocate({params}):
+        if free:
+            vector = pop()
+        else:
+            vector = new(cls)
+            stats.misses += 1
+{assign("        ")}        record(vector)
+        return vector
+    return allocate
+"""
+
+
+class PoolStats:
+    """풀의 적중, 실패 횟수를 기록하기 위한 클래스.
+
+    free list에 돌려준 벡터 중 다시 꺼내 쓴 개수를 적중으로, free list가 비어 새로 생성한 개수를 실패로 셈.
+    """
+
+    __slots__ = ("misses", "recycled", "_free")
+
+    def __init__(self, free: list[Vector]) -> None:
+        self.misses: int = 0
+        self.recycled: int = 0
+        self._free = free
+
+    @property
+    def hits(self) -> int:
+        """free list에서 꺼내 쓴 벡터의 개수를 반환함.
+
+        Returns:
+            int: 적중 횟수.
+        """
+        return self.recycled - len(self._free)
+
+    @property
+    def hit_rate(self) -> float:
+        """풀링된 연산의 결과 중 free list에서 꺼내 쓴 비율을 반환함. 연산이 없었다면 0.
+
+        Returns:
+            float: 적중률. (0 ~ 1)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """기록된 횟수들을 메트릭으로 내보내기 위한 dict로 반환함.
+
+        Returns:
+            dict[str, float]: hits, misses, hit_rate, free를 키로 가지는 dict.
+        """
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate, "free": len(self._free)}
+
+    def __repr__(self) -> str:
+        return f"PoolStats(hits={self.hits}, misses={self.misses}, free={len(self._free)})"
+
+
+class _Pool:
+    """한 벡터 클래스의 free list와 교체한 연산자들을 보관하기 위한 클래스."""
+
+    __slots__ = ("free", "max_size", "stats", "originals", "pooled", "globals", "allocate", "tracking")
+
+    def __init__(self, cls: type[Vector], max_size: int) -> None:
+        self.free: list[Vector] = []
+        self.max_size = max_size
+        self.stats = PoolStats(self.free)
+        namespace: dict[str, Any] = {
+            "free": self.free,
+            "pop": self.free.pop,
+            "new": object.__new__,
+            "cls": cls,
+            "stats": self.stats,
+        }
+        exec(compile(_allocator_source(cls._FIELDS), f"<{__name__}.{cls.__name__}>", "exec"), namespace)
+        self.allocate: Callable[..., Vector] = namespace["allocate"]
+        self.tracking: Callable[[Callable[[Vector], None]], Callable[..., Vector]] = namespace["tracking"]
+        methods = _compile_methods(cls, "_allocate", {"_allocate": self.allocate})
+        self.pooled = {name: methods[name] for name in _ALLOCATING}
+        self.originals = {name: cls.__dict__[name] for name in _ALLOCATING}
+        self.globals: dict[str, Any] = methods["__neg__"].__globals__
+
+    def recycle(self, vector: Vector) -> None:
+        """벡터를 free list에 돌려줌. free list가 가득 차 있으면 버림."""
+        if len(self.free) < self.max_size:
+            self.free.append(vector)
+            self.stats.recycled += 1
+
+
+_pools: dict[type[Vector], _Pool] = {}
+# 진행 중인 arena들이 기록한 벡터들. 마지막이 가장 안쪽의 arena
+_arenas: list[list[Vector]] = []
+# 직전의 가장 바깥 arena가 끝날 때 아직 참조되고 있던 벡터들. 다음 arena가 끝날 때 한 번 더 확인함
+_survivors: list[Vector] = []
+
+
+def _track(record: Callable[[Vector], None] | None) -> None:
+    """풀링된 연산자들이 생성한 벡터를 기록할 함수를 바꿈. None일 시 기록하지 않음."""
+    for pool in _pools.values():
+        pool.globals["_allocate"] = pool.allocate if record is None else pool.tracking(record)
+
+
+def _reclaim(vectors: list[Vector], survivors: list[Vector] | None) -> None:
+    """어디에서도 참조되지 않는 벡터는 free list에 돌려주고, 나머지는 survivors에 담음. None일 시 버림."""
+    for vector in vectors:
+        if getrefcount(vector) <= _UNREFERENCED:
+            pool = _pools.get(type(vector))
+            if pool is not None:
+                pool.recycle(vector)
+        elif survivors is not None:
+            survivors.append(vector)
+
+
+def is_enabled() -> bool:
+    """풀링이 켜져 있는지 여부를 반환함.
+
+    Returns:
+        bool: 풀링이 켜져 있으면 True.
+    """
+    return bool(_pools)
+
+
+def enable(classes: Iterable[type[Vector]] = DEFAULT_CLASSES, max_size: int = DEFAULT_MAX_SIZE) -> None:
+    """벡터 클래스들의 연산자를 free list를 사용하는 연산자로 교체함. 이미 켜져 있는 클래스는 그대로 둠.
+
+    Args:
+        classes (Iterable[type[Vector]], optional): 풀링할 벡터 클래스들. Defaults to DEFAULT_CLASSES.
+        max_size (int, optional): 클래스마다 free list에 보관할 벡터의 최대 개수. Defaults to DEFAULT_MAX_SIZE.
+
+    Raises:
+        TypeError: 성분별 연산자가 생성된 벡터 클래스(Vector2, Vector3, Vector4, VectorN)가 아닌 클래스가 주어졌을 때 발생하는 에러.
+        ValueError: 최대 개수가 1보다 작을 때 발생하는 에러.
+    """
+    if max_size < 1:
+        raise ValueError("The maximum size of a pool must be positive.")
+    for cls in classes:
+        if cls in _pools:
+            continue
+        if not (isinstance(cls, type) and issubclass(cls, Vector) and cls._VECTOR_TYPE is cls and cls._FIELDS):
+            raise TypeError(f"{getattr(cls, '__name__', cls)} does not support pooling.")
+        pool = _Pool(cls, max_size)
+        _pools[cls] = pool
+        for name, method in pool.pooled.items():
+            setattr(cls, name, method)
+    _track(_arenas[-1].append if _arenas else None)
+
+
+def disable() -> None:
+    """모든 클래스의 연산자를 원래대로 되돌리고 free list를 비움.
+
+    Raises:
+        RuntimeError: arena 안에서 호출했을 때 발생하는 에러.
+    """
+    if _arenas:
+        raise RuntimeError("Cannot disable pooling inside an arena.")
+    for cls, pool in _pools.items():
+        for name, method in pool.originals.items():
+            if cls.__dict__.get(name) is pool.pooled[name]:
+                setattr(cls, name, method)
+    _pools.clear()
+    _survivors.clear()
+
+
+@contextmanager
+def arena() -> Iterator[None]:
+    """블록 안에서 풀링된 연산자가 생성한 벡터들을 기록하였다가, 블록이 끝날 때 더 이상 참조되지 않는 것을 회수함.
+
+    블록이 끝날 때까지 참조되는 벡터는 회수하지 않고 바깥 arena에 넘겨, 바깥 arena가 끝날 때 다시 확인함.
+    가장 바깥 arena에서 살아남은 벡터는 다음 arena가 끝날 때 한 번 더 확인하므로, 프레임마다 새로 계산하여
+    교체하는 상태(위치 목록 등)도 회수됨. 풀링이 꺼져 있으면 아무 일도 하지 않음. arena는 중첩할 수 있음.
+
+    Yields:
+        Iterator[None]: 블록의 실행.
+    """
+    record: list[Vector] = []
+    _arenas.append(record)
+    _track(record.append)
+    try:
+        yield
+    finally:
+        _arenas.pop()
+        parent = _arenas[-1] if _arenas else None
+        _track(parent.append if parent is not None else None)
+        if parent is not None:
+            _reclaim(record, parent)
+        else:
+            survivors: list[Vector] = []
+            _reclaim(record, survivors)
+            _reclaim(_survivors, None)
+            _survivors[:] = survivors
+
+
+def release(*vectors: Vector) -> None:
+    """더 이상 사용하지 않을 벡터들을 직접 free list에 돌려줌. 돌려준 벡터는 이후 다른 연산의 결과로 재사용되므로,
+    다시 사용하거나 두 번 돌려주지 않아야 함. 풀링하지 않는 클래스의 벡터는 무시함.
+
+    Args:
+        *vectors (Vector): 돌려줄 벡터들.
+    """
+    for vector in vectors:
+        pool = _pools.get(type(vector))
+        if pool is not None:
+            pool.recycle(vector)
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """풀링 중인 클래스별 적중, 실패 횟수와 적중률을 반환함.
+
+    Returns:
+        dict[str, dict[str, float]]: 클래스 이름별 PoolStats.as_dict()의 결과.
+    """
+    return {cls.__name__: pool.stats.as_dict() for cls, pool in _pools.items()}
+
+
+def reset_stats() -> None:
+    """모든 클래스의 적중, 실패 횟수를 0으로 초기화함. free list에 남은 벡터는 그대로 둠."""
+    for pool in _pools.values():
+        pool.stats.misses = 0
+        pool.stats.recycled = len(pool.free)
@@ -0,0 +1,416 @@
+"""사원수(Quaternion)를 이용한 3차원 회전과 보간을 위한 모듈"""
+
+from __future__ import annotations
+from array import array
+from itertools import chain, repeat
+from math import acos, cos, sin, sqrt
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.batch import Vector3Array, Vector4Array
+from Vector.rotation import Rotation3D
+from Vector.vector import Vector, Vector3, Vector4, _FrozenVector, _is_real_num
+
+# 두 사원수의 내적이 이 값보다 크면 slerp 대신 nlerp로 계산함 (sin(theta)가 0에 가까워지는 것을 방지)
+_SLERP_THRESHOLD = 0.9995
+
+
+class Quaternion(Vector4):
+    """회전을 표현하기 위한 사원수 클래스.
+
+    X, Y, Z 성분은 벡터부를, W 성분은 스칼라부를 나타냄.
+    ``@`` 연산자는 해밀턴 곱을, ``*`` 연산자는 Vector4와 같이 내적을 계산함.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        x: float | int | None = 0.0,
+        y: float | int | None = 0.0,
+        z: float | int | None = 0.0,
+        w: float | int | None = 1.0,
+    ) -> None:
+        """사원수를 정의함. 인자가 주어지지 않으면 항등 회전이 됨.
+
+        Args:
+            x (float | int | None, optional): 벡터부의 X축 성분. Defaults to 0.0.
+            y (float | int | None, optional): 벡터부의 Y축 성분. Defaults to 0.0.
+            z (float | int | None, optional): 벡터부의 Z축 성분. Defaults to 0.0.
+            w (float | int | None, optional): 스칼라부. Defaults to 1.0.
+
+        Raises:
+            TypeError: 정수, 실수, 혹은 None이 아닌 다른 타입의 값이 인자로 주어졌을 때 발생하는 에러.
+        """
+        super().__init__(x, y, z, w)
+
+    @classmethod
+    def from_axis_angle(cls, axis: Vector3, angle: float | int) -> Quaternion:
+        """회전축과 회전각으로부터 단위 사원수를 생성함. 오른손 법칙을 따름.
+
+        Args:
+            axis (Vector3): 회전축. 단위벡터가 아니어도 됨.
+            angle (float | int): 회전각. [라디안]
+
+        Raises:
+            ValueError: 크기가 0인 회전축이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Quaternion: 생성된 사원수.
+        """
+        norm = axis.norm()
+        if norm == 0.0:
+            raise ValueError("The rotation axis must not be a zero vector.")
+        scale = sin(angle / 2) / norm
+        return cls(axis.x * scale, axis.y * scale, axis.z * scale, cos(angle / 2))
+
+    @classmethod
+    def from_euler(cls, euler_angles: Vector3 | list[float]) -> Quaternion:
+        """오일러 각도로부터 단위 사원수를 생성함. Vector3.rotate와 같은 회전을 나타냄.
+
+        Args:
+            euler_angles (Vector3 | list[float]): 오일러 각도 벡터 (roll, pitch, yaw) [라디안].
+
+        Returns:
+            Quaternion: 생성된 사원수.
+        """
+        if isinstance(euler_angles, list):
+            euler_angles = Vector3(*euler_angles)
+        cos_r, sin_r = cos(euler_angles.x / 2), sin(euler_angles.x / 2)
+        cos_p, sin_p = cos(euler_angles.y / 2), sin(euler_angles.y / 2)
+        cos_y, sin_y = cos(euler_angles.z / 2), sin(euler_angles.z / 2)
+        # Vector3.rotate는 yaw -> pitch -> roll 순서 회전의 역(전치)행렬을 적용하므로 켤레를 취함
+        return cls(
+            -(sin_r * cos_p * cos_y - cos_r * sin_p * sin_y),
+            -(cos_r * sin_p * cos_y + sin_r * cos_p * sin_y),
+            -(cos_r * cos_p * sin_y - sin_r * sin_p * cos_y),
+            cos_r * cos_p * cos_y + sin_r * sin_p * sin_y,
+        )
+
+    def conjugate(self) -> Quaternion:
+        """해당 사원수의 켤레 사원수를 구함. 단위 사원수의 경우 역회전과 같음.
+
+        Returns:
+            Quaternion: 켤레 사원수.
+        """
+        return Quaternion(-self.x, -self.y, -self.z, self.w)
+
+    def inverse(self) -> Quaternion:
+        """해당 사원수의 역원을 구함.
+
+        Raises:
+            ZeroDivisionError: 크기가 0인 사원수의 역원을 구하려 할 때 발생하는 에러.
+
+        Returns:
+            Quaternion: 역원.
+        """
+        norm_squared = self * self
+        return Quaternion(
+            -self.x / norm_squared,
+            -self.y / norm_squared,
+            -self.z / norm_squared,
+            self.w / norm_squared,
+        )
+
+    def to_rotation(self) -> Rotation3D:
+        """해당 단위 사원수와 같은 회전을 나타내는 회전 행렬을 생성함.
+
+        Returns:
+            Rotation3D: 생성된 회전.
+        """
+        x, y, z, w = self.x, self.y, self.z, self.w
+        return Rotation3D._from_matrix(
+            (
+                1.0 - 2.0 * (y * y + z * z),
+                2.0 * (x * y - z * w),
+                2.0 * (x * z + y * w),
+                2.0 * (x * y + z * w),
+                1.0 - 2.0 * (x * x + z * z),
+                2.0 * (y * z - x * w),
+                2.0 * (x * z - y * w),
+                2.0 * (y * z + x * w),
+                1.0 - 2.0 * (x * x + y * y),
+            )
+        )
+
+    def rotate(self, target: Vector3 | Vector3Array) -> Vector3 | Vector3Array:
+        """해당 단위 사원수로 공간벡터, 혹은 공간벡터 배열을 회전시킴.
+
+        공간벡터 하나는 q·v·q* 를 행렬 없이 전개한 식(v + 2w(u×v) + 2u×(u×v))으로 계산하며,
+        배열은 회전 행렬을 한 번만 만들어 일괄 적용함.
+
+        Args:
+            target (Vector3 | Vector3Array): 회전시킬 공간벡터, 혹은 공간벡터 배열.
+
+        Raises:
+            TypeError: 공간벡터가 아닌 자료형이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector3 | Vector3Array: 회전된 공간벡터, 혹은 공간벡터 배열.
+        """
+        if isinstance(target, Vector3Array):
+            return self.to_rotation().apply(target)
+        if not isinstance(target, Vector3):
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        qx, qy, qz, qw = self.x, self.y, self.z, self.w
+        vx, vy, vz = target.x, target.y, target.z
+        tx = 2.0 * (qy * vz - qz * vy)
+        ty = 2.0 * (qz * vx - qx * vz)
+        tz = 2.0 * (qx * vy - qy * vx)
+        return Vector3(
+            vx + qw * tx + (qy * tz - qz * ty),
+            vy + qw * ty + (qz * tx - qx * tz),
+            vz + qw * tz + (qx * ty - qy * tx),
+        )
+
+    def __add__(self, other: Quaternion | int | float) -> Quaternion:
+        """두 사원수의 합을 계산함. 결과는 Vector4가 아닌 사원수로 반환됨.
+
+        Args:
+            other (Quaternion | int | float): 더해질 사원수, 혹은 스칼라.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Quaternion: 연산 결과.
+        """
+        return _as_quaternion(Vector4.__add__(self, other))
+
+    def __sub__(self, other: Quaternion | int | float) -> Quaternion:
+        """두 사원수의 차를 계산함. 결과는 Vector4가 아닌 사원수로 반환됨.
+
+        Args:
+            other (Quaternion | int | float): 빠질 사원수, 혹은 스칼라.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Quaternion: 연산 결과.
+        """
+        return _as_quaternion(Vector4.__sub__(self, other))
+
+    def __truediv__(self, other: Quaternion | int | float) -> Quaternion:
+        """사원수의 성분별 나눗셈을 계산함. q / q.norm()처럼 정규화한 결과도 사원수로 반환됨.
+
+        Args:
+            other (Quaternion | int | float): 나눗셈에서의 제수.
+
+        Raises:
+            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Quaternion: 연산 결과.
+        """
+        return _as_quaternion(Vector4.__truediv__(self, other))
+
+    def __floordiv__(self, other: Quaternion | int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__floordiv__(self, other))
+
+    def __mod__(self, other: Quaternion | int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__mod__(self, other))
+
+    def __radd__(self, other: int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__radd__(self, other))
+
+    def __rsub__(self, other: int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__rsub__(self, other))
+
+    def __rtruediv__(self, other: int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__rtruediv__(self, other))
+
+    def __rfloordiv__(self, other: int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__rfloordiv__(self, other))
+
+    def __rmod__(self, other: int | float) -> Quaternion:
+        return _as_quaternion(Vector4.__rmod__(self, other))
+
+    def __neg__(self) -> Quaternion:
+        """모든 성분의 부호를 바꾼 사원수를 구함. 단위 사원수의 경우 같은 회전을 나타냄.
+
+        Returns:
+            Quaternion: 연산 결과.
+        """
+        return Quaternion(-self.x, -self.y, -self.z, -self.w)
+
+    def __matmul__(self, other: Quaternion) -> Quaternion:
+        """두 사원수의 해밀턴 곱을 계산함. other의 회전을 먼저 적용한 후 해당 회전을 적용하는 회전과 같음.
+
+        Args:
+            other (Quaternion): 곱할 사원수.
+
+        Raises:
+            TypeError: 사원수가 아닌 자료형과 연산하는 경우 발생하는 에러.
+
+        Returns:
+            Quaternion: 연산 결과.
+        """
+        if not isinstance(other, Quaternion):
+            raise TypeError("The Hamilton product can only be computed between quaternions.")
+        ax, ay, az, aw = self.x, self.y, self.z, self.w
+        bx, by, bz, bw = other.x, other.y, other.z, other.w
+        return Quaternion(
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+            aw * bw - ax * bx - ay * by - az * bz,
+        )
+
+
+class FrozenQuaternion(_FrozenVector, Quaternion):
+    """dict의 키, set의 원소로 사용할 수 있는 불변 사원수 클래스.
+
+    연산 결과는 일반 사원수(Quaternion)로 반환됨.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _inplace(self, operator: Callable[[Any, Any], Any], other: Any) -> Any:
+        """복사한 사원수에 복합 대입 연산을 적용한 후 다시 불변 사원수로 만듦."""
+        result = operator(Quaternion(*self), other)
+        return result.freeze() if isinstance(result, Vector) else result
+
+
+Quaternion._FROZEN_TYPE = FrozenQuaternion
+
+
+def _as_quaternion(result: Vector4 | object) -> Quaternion | object:
+    """Vector4의 연산 결과를 사원수로 변환함. NotImplemented 등은 그대로 반환함."""
+    return Quaternion(*result) if isinstance(result, Vector4) else result
+
+
+def _lerp_components(
+    start: tuple[float, ...], end: tuple[float, ...], t: float, spherical: bool
+) -> tuple[float, float, float, float]:
+    """두 사원수의 성분 사이를 보간함. 항상 짧은 경로를 택함."""
+    dot = start[0] * end[0] + start[1] * end[1] + start[2] * end[2] + start[3] * end[3]
+    sign = 1.0
+    if dot < 0.0:
+        dot, sign = -dot, -1.0
+    if spherical and dot < _SLERP_THRESHOLD:
+        theta = acos(dot)
+        sin_theta = sin(theta)
+        scale_start = sin((1.0 - t) * theta) / sin_theta
+        scale_end = sign * sin(t * theta) / sin_theta
+        return (
+            scale_start * start[0] + scale_end * end[0],
+            scale_start * start[1] + scale_end * end[1],
+            scale_start * start[2] + scale_end * end[2],
+            scale_start * start[3] + scale_end * end[3],
+        )
+    scale_start, scale_end = 1.0 - t, sign * t
+    x = scale_start * start[0] + scale_end * end[0]
+    y = scale_start * start[1] + scale_end * end[1]
+    z = scale_start * start[2] + scale_end * end[2]
+    w = scale_start * start[3] + scale_end * end[3]
+    norm = sqrt(x * x + y * y + z * z + w * w)
+    return (x / norm, y / norm, z / norm, w / norm)
+
+
+def slerp(start: Quaternion, end: Quaternion, t: float) -> Quaternion:
+    """두 단위 사원수 사이를 구면 선형 보간함.
+
+    Args:
+        start (Quaternion): t = 0일 때의 사원수.
+        end (Quaternion): t = 1일 때의 사원수.
+        t (float): 보간 비율.
+
+    Returns:
+        Quaternion: 보간된 사원수.
+    """
+    return Quaternion(*_lerp_components(tuple(start), tuple(end), t, True))
+
+
+def nlerp(start: Quaternion, end: Quaternion, t: float) -> Quaternion:
+    """두 단위 사원수 사이를 선형 보간한 후 정규화함. slerp보다 빠르지만 각속도가 일정하지 않음.
+
+    Args:
+        start (Quaternion): t = 0일 때의 사원수.
+        end (Quaternion): t = 1일 때의 사원수.
+        t (float): 보간 비율.
+
+    Returns:
+        Quaternion: 보간된 사원수.
+    """
+    return Quaternion(*_lerp_components(tuple(start), tuple(end), t, False))
+
+
+def _quaternion_stream(source: Vector4 | Vector4Array) -> Iterator[tuple[float, ...]]:
+    """사원수, 혹은 사원수 배열을 성분 튜플의 나열로 변환함."""
+    if isinstance(source, Vector4Array):
+        values = iter(source.data)
+        return zip(values, values, values, values)
+    if isinstance(source, Vector4):
+        return repeat(tuple(source))
+    raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+
+
+def _lerp_batch(
+    start: Vector4 | Vector4Array,
+    end: Vector4 | Vector4Array,
+    t: float | Iterable[float],
+    spherical: bool,
+) -> Vector4Array:
+    """배열 단위의 보간을 수행함."""
+    batches = [source for source in (start, end) if isinstance(source, Vector4Array)]
+    lengths = {len(batch) for batch in batches}
+    typecode = batches[0]._typecode if batches else "d"
+    if _is_real_num(t):
+        if not lengths:
+            raise ValueError("At least one of start, end or t must be a batch.")
+        ratios: Iterable[float] = repeat(float(t))
+    else:
+        ratios = array("d", t)
+        lengths.add(len(ratios))
+    if len(lengths) > 1:
+        raise ValueError("Operations cannot be performed with batches of different length.")
+    components = map(
+        _lerp_components,
+        _quaternion_stream(start),
+        _quaternion_stream(end),
+        ratios,
+        repeat(spherical, lengths.pop()),
+    )
+    return Vector4Array._wrap(array(typecode, chain.from_iterable(components)))
+
+
+def slerp_batch(
+    start: Vector4 | Vector4Array, end: Vector4 | Vector4Array, t: float | Iterable[float]
+) -> Vector4Array:
+    """여러 사원수 쌍, 혹은 여러 보간 비율에 대해 한 번에 구면 선형 보간함.
+
+    start, end, t 중 배열(시퀀스)로 주어진 인자들은 길이가 같아야 하며, 나머지는 모든 원소에 공통으로 적용됨.
+
+    Args:
+        start (Vector4 | Vector4Array): t = 0일 때의 사원수, 혹은 사원수 배열.
+        end (Vector4 | Vector4Array): t = 1일 때의 사원수, 혹은 사원수 배열.
+        t (float | Iterable[float]): 보간 비율, 혹은 보간 비율의 시퀀스.
+
+    Raises:
+        ValueError: 배열의 길이가 서로 다르거나, 배열로 주어진 인자가 없을 때 발생하는 에러.
+
+    Returns:
+        Vector4Array: 보간된 사원수 배열.
+    """
+    return _lerp_batch(start, end, t, True)
+
+
+def nlerp_batch(
+    start: Vector4 | Vector4Array, end: Vector4 | Vector4Array, t: float | Iterable[float]
+) -> Vector4Array:
+    """여러 사원수 쌍, 혹은 여러 보간 비율에 대해 한 번에 정규화 선형 보간함.
+
+    start, end, t 중 배열(시퀀스)로 주어진 인자들은 길이가 같아야 하며, 나머지는 모든 원소에 공통으로 적용됨.
+
+    Args:
+        start (Vector4 | Vector4Array): t = 0일 때의 사원수, 혹은 사원수 배열.
+        end (Vector4 | Vector4Array): t = 1일 때의 사원수, 혹은 사원수 배열.
+        t (float | Iterable[float]): 보간 비율, 혹은 보간 비율의 시퀀스.
+
+    Raises:
+        ValueError: 배열의 길이가 서로 다르거나, 배열로 주어진 인자가 없을 때 발생하는 에러.
+
+    Returns:
+        Vector4Array: 보간된 사원수 배열.
+    """
+    return _lerp_batch(start, end, t, False)
@@ -0,0 +1,258 @@
+"""회전 행렬을 미리 계산해두고 여러 벡터에 재사용하기 위한 모듈"""
+
+from __future__ import annotations
+from itertools import repeat
+from math import cos, sin, pi
+from operator import add, mul, sub
+
+from Vector.batch import Vector2Array, Vector3Array
+from Vector.vector import Vector2, Vector3
+
+
+class Rotation2D:
+    """평면벡터의 회전을 표현하기 위한 클래스.
+
+    생성 시 cos, sin 값을 한 번만 계산하며, 이후 여러 벡터에 재사용함.
+    """
+
+    __slots__ = ("__cos", "__sin")
+
+    def __init__(self, degree: float | int = 0.0) -> None:
+        """평면 회전을 정의함.
+
+        Args:
+            degree (float | int, optional): 회전시킬 각도. [도] Defaults to 0.0.
+        """
+        radian = degree * (pi / 180)
+        self.__cos: float = cos(radian)
+        self.__sin: float = sin(radian)
+
+    @classmethod
+    def _from_cos_sin(cls, cos_theta: float, sin_theta: float) -> Rotation2D:
+        """계산된 cos, sin 값으로부터 회전을 생성함."""
+        rotation = cls.__new__(cls)
+        rotation.__cos = cos_theta
+        rotation.__sin = sin_theta
+        return rotation
+
+    @property
+    def matrix(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """해당 회전의 회전 행렬을 반환함.
+
+        Returns:
+            tuple[tuple[float, float], tuple[float, float]]: 2x2 회전 행렬. (행 우선)
+        """
+        return ((self.__cos, -self.__sin), (self.__sin, self.__cos))
+
+    def inverse(self) -> Rotation2D:
+        """해당 회전의 역회전을 구함.
+
+        Returns:
+            Rotation2D: 역회전.
+        """
+        return Rotation2D._from_cos_sin(self.__cos, -self.__sin)
+
+    def apply(self, target: Vector2 | Vector2Array) -> Vector2 | Vector2Array:
+        """평면벡터, 혹은 평면벡터 배열을 회전시킴.
+
+        Args:
+            target (Vector2 | Vector2Array): 회전시킬 평면벡터, 혹은 평면벡터 배열.
+
+        Raises:
+            TypeError: 평면벡터가 아닌 자료형이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector2 | Vector2Array: 회전된 평면벡터, 혹은 평면벡터 배열.
+        """
+        cos_theta, sin_theta = self.__cos, self.__sin
+        if isinstance(target, Vector2):
+            x, y = target.x, target.y
+            return Vector2(x * cos_theta - y * sin_theta, x * sin_theta + y * cos_theta)
+        if isinstance(target, Vector2Array):
+            xs, ys = target.x, target.y
+            return Vector2Array.from_components(
+                map(sub, map(mul, xs, repeat(cos_theta)), map(mul, ys, repeat(sin_theta))),
+                map(add, map(mul, xs, repeat(sin_theta)), map(mul, ys, repeat(cos_theta))),
+                dtype=target.dtype,
+            )
+        raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+
+    def __matmul__(self, other: Rotation2D) -> Rotation2D:
+        """두 회전을 합성함. other를 먼저 적용한 후 해당 회전을 적용하는 회전과 같음.
+
+        Args:
+            other (Rotation2D): 합성할 회전.
+
+        Raises:
+            TypeError: 다른 차원의 회전과 합성하는 경우 발생하는 에러.
+
+        Returns:
+            Rotation2D: 합성된 회전. 회전이 아닌 자료형일 시 NotImplemented를 반환함.
+        """
+        if not isinstance(other, Rotation2D):
+            if isinstance(other, Rotation3D):
+                raise TypeError("Only rotations of the same dimension can be composed.")
+            return NotImplemented
+        return Rotation2D._from_cos_sin(
+            self.__cos * other.__cos - self.__sin * other.__sin,
+            self.__sin * other.__cos + self.__cos * other.__sin,
+        )
+
+
+class Rotation3D:
+    """공간벡터의 회전을 표현하기 위한 클래스.
+
+    생성 시 3x3 회전 행렬을 한 번만 계산하며, 이후 여러 벡터에 재사용함.
+    """
+
+    __slots__ = ("__matrix",)
+
+    def __init__(self, euler_angles: Vector3 | list[float] | None = None) -> None:
+        """오일러 각도로부터 공간 회전을 정의함. Vector3.rotate와 같은 회전을 나타냄.
+
+        Args:
+            euler_angles (Vector3 | list[float] | None, optional): 오일러 각도 벡터 (roll, pitch, yaw) [라디안].
+                None일 시 항등 회전이 됨. Defaults to None.
+        """
+        if euler_angles is None:
+            self.__matrix: tuple[float, ...] = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+            return
+        if isinstance(euler_angles, list):
+            euler_angles = Vector3(*euler_angles)
+        roll, pitch, yaw = euler_angles.x, euler_angles.y, euler_angles.z
+
+        cos_r, sin_r = cos(roll), sin(roll)
+        cos_p, sin_p = cos(pitch), sin(pitch)
+        cos_y, sin_y = cos(yaw), sin(yaw)
+
+        self.__matrix = (
+            cos_p * cos_y,
+            cos_p * sin_y,
+            -sin_p,
+            sin_r * sin_p * cos_y - cos_r * sin_y,
+            sin_r * sin_p * sin_y + cos_r * cos_y,
+            sin_r * cos_p,
+            cos_r * sin_p * cos_y + sin_r * sin_y,
+            cos_r * sin_p * sin_y - sin_r * cos_y,
+            cos_r * cos_p,
+        )
+
+    @classmethod
+    def from_axis_angle(cls, axis: Vector3, angle: float | int) -> Rotation3D:
+        """회전축과 회전각으로부터 공간 회전을 생성함. 오른손 법칙을 따름.
+
+        Args:
+            axis (Vector3): 회전축. 단위벡터가 아니어도 됨.
+            angle (float | int): 회전각. [라디안]
+
+        Raises:
+            ValueError: 크기가 0인 회전축이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Rotation3D: 생성된 회전.
+        """
+        norm = axis.norm()
+        if norm == 0.0:
+            raise ValueError("The rotation axis must not be a zero vector.")
+        x, y, z = axis.x / norm, axis.y / norm, axis.z / norm
+        cos_a, sin_a = cos(angle), sin(angle)
+        t = 1.0 - cos_a
+        return cls._from_matrix(
+            (
+                t * x * x + cos_a,
+                t * x * y - sin_a * z,
+                t * x * z + sin_a * y,
+                t * x * y + sin_a * z,
+                t * y * y + cos_a,
+                t * y * z - sin_a * x,
+                t * x * z - sin_a * y,
+                t * y * z + sin_a * x,
+                t * z * z + cos_a,
+            )
+        )
+
+    @classmethod
+    def _from_matrix(cls, matrix: tuple[float, ...]) -> Rotation3D:
+        """행 우선으로 나열된 9개의 성분으로부터 회전을 생성함."""
+        rotation = cls.__new__(cls)
+        rotation.__matrix = matrix
+        return rotation
+
+    @property
+    def matrix(self) -> tuple[tuple[float, float, float], ...]:
+        """해당 회전의 회전 행렬을 반환함.
+
+        Returns:
+            tuple[tuple[float, float, float], ...]: 3x3 회전 행렬. (행 우선)
+        """
+        m = self.__matrix
+        return (m[0:3], m[3:6], m[6:9])
+
+    def inverse(self) -> Rotation3D:
+        """해당 회전의 역회전을 구함. 회전 행렬의 전치행렬과 같음.
+
+        Returns:
+            Rotation3D: 역회전.
+        """
+        m = self.__matrix
+        return Rotation3D._from_matrix((m[0], m[3], m[6], m[1], m[4], m[7], m[2], m[5], m[8]))
+
+    def apply(self, target: Vector3 | Vector3Array) -> Vector3 | Vector3Array:
+        """공간벡터, 혹은 공간벡터 배열을 회전시킴.
+
+        Args:
+            target (Vector3 | Vector3Array): 회전시킬 공간벡터, 혹은 공간벡터 배열.
+
+        Raises:
+            TypeError: 공간벡터가 아닌 자료형이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Vector3 | Vector3Array: 회전된 공간벡터, 혹은 공간벡터 배열.
+        """
+        m = self.__matrix
+        if isinstance(target, Vector3):
+            x, y, z = target.x, target.y, target.z
+            return Vector3(
+                m[0] * x + m[1] * y + m[2] * z,
+                m[3] * x + m[4] * y + m[5] * z,
+                m[6] * x + m[7] * y + m[8] * z,
+            )
+        if isinstance(target, Vector3Array):
+            xs, ys, zs = target.x, target.y, target.z
+            return Vector3Array.from_components(
+                *(
+                    map(
+                        add,
+                        map(add, map(mul, xs, repeat(m[row])), map(mul, ys, repeat(m[row + 1]))),
+                        map(mul, zs, repeat(m[row + 2])),
+                    )
+                    for row in (0, 3, 6)
+                ),
+                dtype=target.dtype,
+            )
+        raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+
+    def __matmul__(self, other: Rotation3D) -> Rotation3D:
+        """두 회전을 합성함. other를 먼저 적용한 후 해당 회전을 적용하는 회전과 같음.
+
+        Args:
+            other (Rotation3D): 합성할 회전.
+
+        Raises:
+            TypeError: 다른 차원의 회전과 합성하는 경우 발생하는 에러.
+
+        Returns:
+            Rotation3D: 합성된 회전. 회전이 아닌 자료형일 시 NotImplemented를 반환함.
+        """
+        if not isinstance(other, Rotation3D):
+            if isinstance(other, Rotation2D):
+                raise TypeError("Only rotations of the same dimension can be composed.")
+            return NotImplemented
+        a, b = self.__matrix, other.__matrix
+        return Rotation3D._from_matrix(
+            tuple(
+                a[row] * b[col] + a[row + 1] * b[col + 3] + a[row + 2] * b[col + 6]
+                for row in (0, 3, 6)
+                for col in (0, 1, 2)
+            )
+        )
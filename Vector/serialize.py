@@ -0,0 +1,354 @@
+"""벡터와 벡터 배열을 간결한 바이너리 형식으로 저장하고 불러오기 위한 모듈
+
+형식은 16바이트 헤더 뒤에 리틀 엔디언 성분이 [x0, y0, z0, x1, y1, z1, ...] 순서로 연속 저장된 형태임.
+
+    헤더: 매직 넘버(4) | 차원(1) | 자료형(1, b"f" 혹은 b"d") | 종류(1, 벡터 0 / 배열 1) | 예약(1) | 벡터의 개수(8)
+
+벡터의 개수가 _UNKNOWN_COUNT인 경우, 파일의 끝까지 벡터가 이어지는 것으로 봄. (탐색할 수 없는 스트림에 쓴 경우)
+VectorWriter와 VectorReader는 청크 단위로 쓰고 읽으므로, 전체 크기와 관계없이 일정한 메모리만 사용함.
+"""
+
+from __future__ import annotations
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Iterator
+
+from Vector.batch import VectorArray, _array_type
+from Vector.vector import Vector, Vector2, Vector3, Vector4, VectorN
+
+_MAGIC = b"VEC\x01"
+_HEADER = struct.Struct("<4sBcBxQ")  # 매직 넘버, 차원, 자료형, 종류, 벡터의 개수
+_UNKNOWN_COUNT = 0xFFFF_FFFF_FFFF_FFFF
+_KIND_VECTOR = 0
+_KIND_BATCH = 1
+_TYPECODES: dict[str, bytes] = {"float32": b"f", "float64": b"d"}
+_MAX_DEMENTION = 0xFF
+_VECTOR_TYPES: dict[int, type[Vector]] = {2: Vector2, 3: Vector3, 4: Vector4}
+
+
+def _vector_type(demention: int) -> type[Vector]:
+    """차원에 맞는 벡터 클래스를 반환함. 2, 3, 4차원 외에는 VectorN을 사용함."""
+    return _VECTOR_TYPES.get(demention) or VectorN.of(demention)
+
+
+def _typecode(dtype: str) -> bytes:
+    """자료형의 이름을 array의 typecode로 변환함.
+
+    Raises:
+        ValueError: 지원하지 않는 자료형이 주어졌을 때 발생하는 에러.
+    """
+    try:
+        return _TYPECODES[dtype]
+    except KeyError:
+        raise ValueError("The dtype must be 'float32' or 'float64'.") from None
+
+
+def _to_bytes(values: Iterable[float], typecode: bytes) -> bytes:
+    """성분들을 리틀 엔디언 바이트로 변환함."""
+    packed = array(typecode.decode(), values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _from_bytes(data: bytes, typecode: bytes) -> array:
+    """리틀 엔디언 바이트를 저장된 정밀도 그대로의 성분들로 변환함."""
+    values = array(typecode.decode())
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def dumps(value: Vector | VectorArray, dtype: str | None = None) -> bytes:
+    """벡터, 혹은 벡터 배열을 바이너리 형식으로 변환함.
+
+    Args:
+        value (Vector | VectorArray): 변환할 벡터, 혹은 벡터 배열.
+        dtype (str | None, optional): 성분을 저장할 자료형. "float32" 혹은 "float64".
+                None일 시 벡터 배열은 배열의 정밀도로, 벡터는 "float64"로 저장함. Defaults to None.
+
+    Raises:
+        TypeError: 벡터, 벡터 배열이 아닌 값이 주어졌을 때 발생하는 에러.
+        ValueError: 지원하지 않는 자료형, 혹은 255차원을 넘는 벡터가 주어졌을 때 발생하는 에러.
+
+    Returns:
+        bytes: 변환된 바이트.
+    """
+    if dtype is None:
+        dtype = value.dtype if isinstance(value, VectorArray) else "float64"
+    typecode = _typecode(dtype)
+    if isinstance(value, (Vector, VectorArray)) and value.demention > _MAX_DEMENTION:
+        raise ValueError("The demention of a vector must be between 1 and 255.")
+    if isinstance(value, Vector):
+        header = _HEADER.pack(_MAGIC, value.demention, typecode, _KIND_VECTOR, 1)
+        return header + _to_bytes(value, typecode)
+    if isinstance(value, VectorArray):
+        header = _HEADER.pack(_MAGIC, value.demention, typecode, _KIND_BATCH, len(value))
+        return header + _to_bytes(value.data, typecode)
+    raise TypeError("Only vectors and vector batches can be serialized.")
+
+
+def loads(data: bytes) -> Vector | VectorArray:
+    """바이너리 형식의 바이트로부터 벡터, 혹은 벡터 배열을 불러옴.
+
+    Args:
+        data (bytes): dumps로 변환된 바이트. float32로 저장된 벡터 배열은 float32 배열로 불러옴.
+
+    Raises:
+        ValueError: 올바른 형식이 아니거나, 길이가 맞지 않을 때 발생하는 에러.
+
+    Returns:
+        Vector | VectorArray: 저장되어 있던 벡터, 혹은 벡터 배열.
+    """
+    demention, typecode, kind, count = _parse_header(bytes(data[: _HEADER.size]))
+    body = data[_HEADER.size :]
+    item_size = struct.calcsize(typecode.decode())
+    if count == _UNKNOWN_COUNT:
+        count = len(body) // (demention * item_size)
+    if len(body) != count * demention * item_size:
+        raise ValueError("The data does not match the length in its header.")
+    values = _from_bytes(body, typecode)
+    if kind == _KIND_VECTOR:
+        return _vector_type(demention)(*values)
+    return _array_type(_vector_type(demention))._wrap(values)
+
+
+def dump(value: Vector | VectorArray, file: BinaryIO, dtype: str | None = None) -> None:
+    """벡터, 혹은 벡터 배열을 바이너리 형식으로 파일에 씀.
+
+    Args:
+        value (Vector | VectorArray): 저장할 벡터, 혹은 벡터 배열.
+        file (BinaryIO): 바이너리 쓰기 모드로 열린 파일.
+        dtype (str | None, optional): 성분을 저장할 자료형. "float32" 혹은 "float64".
+                None일 시 벡터 배열은 배열의 정밀도로, 벡터는 "float64"로 저장함. Defaults to None.
+    """
+    file.write(dumps(value, dtype))
+
+
+def load(file: BinaryIO) -> Vector | VectorArray:
+    """파일로부터 바이너리 형식의 벡터, 혹은 벡터 배열을 불러옴.
+
+    Args:
+        file (BinaryIO): 바이너리 읽기 모드로 열린 파일.
+
+    Returns:
+        Vector | VectorArray: 저장되어 있던 벡터, 혹은 벡터 배열.
+    """
+    return loads(file.read())
+
+
+def _parse_header(header: bytes) -> tuple[int, bytes, int, int]:
+    """헤더를 해석하여 (차원, 자료형, 종류, 벡터의 개수)를 반환함.
+
+    Raises:
+        ValueError: 올바른 헤더가 아닐 때 발생하는 에러.
+    """
+    if len(header) != _HEADER.size:
+        raise ValueError("The data is too small to contain a vector header.")
+    magic, demention, typecode, kind, count = _HEADER.unpack(header)
+    if (
+        magic != _MAGIC
+        or demention == 0
+        or typecode not in _TYPECODES.values()
+        or kind not in (_KIND_VECTOR, _KIND_BATCH)
+    ):
+        raise ValueError("The data is not in the vector binary format.")
+    return demention, typecode, kind, count
+
+
+class VectorWriter:
+    """벡터들을 바이너리 형식으로 조금씩 파일에 쓰기 위한 클래스.
+
+    탐색이 가능한 파일은 닫을 때 헤더의 벡터의 개수를 채우며, 아니면 개수를 알 수 없음으로 기록함.
+    """
+
+    __slots__ = ("__file", "__demention", "__typecode", "__count", "__start", "__buffer", "__chunk_size")
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        demention: int,
+        dtype: str = "float64",
+        chunk_size: int = 65536,
+    ) -> None:
+        """쓰기를 시작하며 헤더를 씀.
+
+        Args:
+            file (BinaryIO): 바이너리 쓰기 모드로 열린 파일. 쓰기가 끝나도 닫지 않음.
+            demention (int): 쓸 벡터의 차원. (1 ~ 255)
+            dtype (str, optional): 성분을 저장할 자료형. "float32" 혹은 "float64". Defaults to "float64".
+            chunk_size (int, optional): 모아두었다가 한 번에 쓸 벡터의 개수. Defaults to 65536.
+
+        Raises:
+            ValueError: 지원하지 않는 차원, 혹은 자료형이 주어졌을 때 발생하는 에러.
+        """
+        if not isinstance(demention, int) or not 1 <= demention <= _MAX_DEMENTION:
+            raise ValueError("The demention of a vector must be between 1 and 255.")
+        self.__file = file
+        self.__demention = demention
+        self.__typecode = _typecode(dtype)
+        self.__count = 0
+        self.__chunk_size = chunk_size
+        self.__buffer = array("d")
+        try:
+            self.__start: int | None = file.tell() if file.seekable() else None
+        except OSError:
+            self.__start = None
+        file.write(_HEADER.pack(_MAGIC, demention, self.__typecode, _KIND_BATCH, _UNKNOWN_COUNT))
+
+    def write(self, vector: Vector) -> None:
+        """벡터 하나를 씀.
+
+        Args:
+            vector (Vector): 쓸 벡터.
+
+        Raises:
+            TypeError: 차원이 다른 벡터가 주어졌을 때 발생하는 에러.
+        """
+        if not isinstance(vector, Vector) or vector.demention != self.__demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        self.__buffer.extend(vector)
+        if len(self.__buffer) >= self.__chunk_size * self.__demention:
+            self.__flush_buffer()
+
+    def write_batch(self, batch: VectorArray | Iterable[Vector]) -> None:
+        """여러 벡터를 씀.
+
+        Args:
+            batch (VectorArray | Iterable[Vector]): 쓸 벡터 배열, 혹은 벡터들.
+
+        Raises:
+            TypeError: 차원이 다른 벡터가 주어졌을 때 발생하는 에러.
+        """
+        if not isinstance(batch, VectorArray):
+            for vector in batch:
+                self.write(vector)
+            return
+        if batch.demention != self.__demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        self.__flush_buffer()
+        self.__file.write(_to_bytes(batch.data, self.__typecode))
+        self.__count += len(batch)
+
+    def __flush_buffer(self) -> None:
+        """모아둔 벡터들을 파일에 씀."""
+        if self.__buffer:
+            self.__file.write(_to_bytes(self.__buffer, self.__typecode))
+            self.__count += len(self.__buffer) // self.__demention
+            self.__buffer = array("d")
+
+    def close(self) -> None:
+        """남은 벡터들을 쓰고, 가능하면 헤더의 벡터의 개수를 채움. 파일은 닫지 않음."""
+        self.__flush_buffer()
+        if self.__start is not None:
+            end = self.__file.tell()
+            self.__file.seek(self.__start)
+            self.__file.write(
+                _HEADER.pack(_MAGIC, self.__demention, self.__typecode, _KIND_BATCH, self.__count)
+            )
+            self.__file.seek(end)
+        self.__file.flush()
+
+    def __enter__(self) -> VectorWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count + len(self.__buffer) // self.__demention
+
+
+class VectorReader:
+    """바이너리 형식의 파일에서 벡터들을 조금씩 읽기 위한 클래스."""
+
+    __slots__ = ("__file", "__demention", "__typecode", "__kind", "__count", "__chunk_size")
+
+    def __init__(self, file: BinaryIO, chunk_size: int = 65536) -> None:
+        """헤더를 읽고 읽기를 준비함.
+
+        Args:
+            file (BinaryIO): 바이너리 읽기 모드로 열린 파일. 읽기가 끝나도 닫지 않음.
+            chunk_size (int, optional): 한 번에 읽을 벡터의 개수. Defaults to 65536.
+
+        Raises:
+            ValueError: 올바른 형식의 파일이 아닐 때 발생하는 에러.
+        """
+        self.__file = file
+        self.__chunk_size = chunk_size
+        demention, typecode, kind, count = _parse_header(file.read(_HEADER.size))
+        self.__demention = demention
+        self.__typecode = typecode
+        self.__kind = kind
+        self.__count: int | None = None if count == _UNKNOWN_COUNT else count
+
+    @property
+    def demention(self) -> int:
+        """저장된 벡터의 차원을 반환합니다.
+
+        Returns:
+            int: 차원
+        """
+        return self.__demention
+
+    @property
+    def dtype(self) -> str:
+        """성분이 저장된 자료형을 반환함.
+
+        Returns:
+            str: "float32" 혹은 "float64".
+        """
+        return "float32" if self.__typecode == b"f" else "float64"
+
+    def __len__(self) -> int:
+        """헤더에 기록된 벡터의 개수를 반환함.
+
+        Raises:
+            TypeError: 개수를 알 수 없는 스트림일 때 발생하는 에러.
+        """
+        if self.__count is None:
+            raise TypeError("The number of vectors in this stream is unknown.")
+        return self.__count
+
+    def batches(self) -> Iterator[VectorArray]:
+        """저장된 벡터들을 chunk_size개씩 벡터 배열로 읽음.
+
+        Raises:
+            ValueError: 파일이 벡터의 중간에서 끝났을 때 발생하는 에러.
+
+        Yields:
+            Iterator[VectorArray]: 최대 chunk_size개의 벡터를 가진 벡터 배열.
+        """
+        array_type = _array_type(_vector_type(self.__demention))
+        vector_size = self.__demention * struct.calcsize(self.__typecode.decode())
+        remaining = self.__count
+        while remaining is None or remaining > 0:
+            count = self.__chunk_size if remaining is None else min(self.__chunk_size, remaining)
+            data = self.__file.read(count * vector_size)
+            if not data and remaining is None:
+                return
+            if len(data) % vector_size or (remaining is not None and len(data) != count * vector_size):
+                raise ValueError("The stream ended in the middle of a vector.")
+            if remaining is not None:
+                remaining -= count
+            yield array_type._wrap(_from_bytes(data, self.__typecode))
+
+    def __iter__(self) -> Iterator[Vector]:
+        for batch in self.batches():
+            yield from batch
+
+    def read(self) -> Vector | VectorArray:
+        """남은 내용을 모두 읽음. dumps로 저장된 벡터 하나는 벡터로 반환함.
+
+        Returns:
+            Vector | VectorArray: 읽은 벡터, 혹은 벡터 배열.
+        """
+        data = array(self.__typecode.decode())
+        for chunk in self.batches():
+            data.extend(chunk.data)
+        batch = _array_type(_vector_type(self.__demention))._wrap(data)
+        if self.__kind == _KIND_VECTOR:
+            return batch[0]
+        return batch
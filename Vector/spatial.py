@@ -0,0 +1,451 @@
+"""평면벡터, 공간벡터 집합에서 가까운 점을 빠르게 찾기 위한 공간 인덱스 모듈
+
+k-d 트리(KDTree)와 균일 격자(UniformGrid)를 제공하며, 두 인덱스 모두
+k-최근접 이웃, 반경, 축 정렬 경계 상자(AABB) 질의와 점의 추가/삭제를 지원함.
+점은 추가된 순서대로 0부터 매겨지는 정수 ID로 식별됨.
+"""
+
+from __future__ import annotations
+from heapq import heappush, heappushpop, nsmallest
+from itertools import product, repeat
+from math import floor, prod, sqrt
+from typing import Iterable, Iterator
+
+from Vector.batch import Vector2Array, Vector3Array
+from Vector.vector import Vector, Vector2, Vector3
+
+Point = tuple[float, ...]
+
+
+def _squared_distance(a: Point, b: Point) -> float:
+    """두 점 사이 거리의 제곱을 구함."""
+    return sum((p - q) * (p - q) for p, q in zip(a, b))
+
+
+class _SpatialIndex:
+    """공간 인덱스의 공통 동작(점의 차원 확인, ID 관리)을 정의하는 클래스"""
+
+    __slots__ = ("_demention", "_points", "_next_id")
+
+    def __init__(self) -> None:
+        self._demention: int = 0
+        self._points: dict[int, Point] = {}
+        self._next_id: int = 0
+
+    def _coordinates(self, point: Vector | Point, register: bool = False) -> Point:
+        """벡터를 좌표 튜플로 변환하고 인덱스의 차원과 같은지 확인함.
+
+        Args:
+            point (Vector | Point): 변환할 벡터.
+            register (bool, optional): True일 시 비어있는 인덱스의 차원을 해당 벡터의 차원으로 정함.
+                Defaults to False.
+
+        Raises:
+            TypeError: 평면벡터, 공간벡터가 아니거나 인덱스와 차원이 다를 때 발생하는 에러.
+        """
+        if isinstance(point, (Vector2, Vector3)):
+            coordinates = tuple(point)
+        elif isinstance(point, tuple) and len(point) in (2, 3):
+            coordinates = point
+        else:
+            raise TypeError("Spatial indexes only support Vector2 and Vector3.")
+        if not self._demention:
+            if register:
+                self._demention = len(coordinates)
+        elif len(coordinates) != self._demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        return coordinates
+
+    def _point_stream(
+        self, points: Iterable[Vector] | Vector2Array | Vector3Array
+    ) -> Iterator[Point]:
+        """벡터들, 혹은 벡터 배열을 좌표 튜플의 나열로 변환함."""
+        if isinstance(points, (Vector2Array, Vector3Array)):
+            values = iter(points.data)
+            points = zip(*[values] * points.demention)
+        return map(self._coordinates, points, repeat(True))
+
+    def _vector(self, point: Point) -> Vector:
+        return Vector2(*point) if len(point) == 2 else Vector3(*point)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, point_id: int) -> bool:
+        return point_id in self._points
+
+    def __getitem__(self, point_id: int) -> Vector:
+        """ID에 해당하는 점을 벡터로 반환함.
+
+        Raises:
+            KeyError: 존재하지 않는 ID가 주어졌을 때 발생하는 에러.
+        """
+        return self._vector(self._points[point_id])
+
+
+class _Node:
+    """k-d 트리의 노드"""
+
+    __slots__ = ("point", "point_id", "axis", "left", "right", "removed")
+
+    def __init__(self, point: Point, point_id: int, axis: int) -> None:
+        self.point = point
+        self.point_id = point_id
+        self.axis = axis
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.removed = False
+
+
+class KDTree(_SpatialIndex):
+    """k-d 트리 공간 인덱스.
+
+    질의는 평균 O(log N)이며, 삭제된 점은 표시만 해두었다가 전체의 절반을 넘으면 트리를 다시 만듦.
+    """
+
+    __slots__ = ("__root", "__nodes", "__removed_count")
+
+    def __init__(self, points: Iterable[Vector] | Vector2Array | Vector3Array = ()) -> None:
+        """점들로부터 균형 잡힌 k-d 트리를 생성함.
+
+        Args:
+            points (Iterable[Vector] | Vector2Array | Vector3Array, optional): 인덱싱할 점들. Defaults to ().
+
+        Raises:
+            TypeError: 평면벡터, 공간벡터가 아니거나 차원이 섞여 있을 때 발생하는 에러.
+        """
+        super().__init__()
+        for point in self._point_stream(points):
+            self._points[self._next_id] = point
+            self._next_id += 1
+        self.__rebuild()
+
+    def __rebuild(self) -> None:
+        """삭제되지 않은 점들로 트리를 다시 만듦."""
+        self.__nodes: dict[int, _Node] = {}
+        self.__removed_count = 0
+        self.__root = self.__build(list(self._points.items()), 0)
+
+    def __build(self, items: list[tuple[int, Point]], depth: int) -> _Node | None:
+        """중앙값을 기준으로 나누어 부분 트리를 만듦."""
+        if not items:
+            return None
+        axis = depth % self._demention
+        items.sort(key=lambda item: item[1][axis])
+        median = len(items) // 2
+        point_id, point = items[median]
+        node = _Node(point, point_id, axis)
+        self.__nodes[point_id] = node
+        node.left = self.__build(items[:median], depth + 1)
+        node.right = self.__build(items[median + 1 :], depth + 1)
+        return node
+
+    def insert(self, point: Vector) -> int:
+        """점을 추가함.
+
+        Args:
+            point (Vector): 추가할 점.
+
+        Raises:
+            TypeError: 인덱스와 차원이 다른 벡터가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            int: 추가된 점의 ID.
+        """
+        coordinates = self._coordinates(point, register=True)
+        point_id = self._next_id
+        self._next_id += 1
+        self._points[point_id] = coordinates
+        if self.__root is None:
+            self.__root = _Node(coordinates, point_id, 0)
+            self.__nodes[point_id] = self.__root
+            return point_id
+        node = self.__root
+        while True:
+            branch = "left" if coordinates[node.axis] < node.point[node.axis] else "right"
+            child = getattr(node, branch)
+            if child is None:
+                child = _Node(coordinates, point_id, (node.axis + 1) % self._demention)
+                setattr(node, branch, child)
+                self.__nodes[point_id] = child
+                return point_id
+            node = child
+
+    def remove(self, point_id: int) -> None:
+        """점을 삭제함.
+
+        Args:
+            point_id (int): 삭제할 점의 ID.
+
+        Raises:
+            KeyError: 존재하지 않는 ID가 주어졌을 때 발생하는 에러.
+        """
+        del self._points[point_id]
+        self.__nodes.pop(point_id).removed = True
+        self.__removed_count += 1
+        if self.__removed_count > len(self._points):
+            self.__rebuild()
+
+    def nearest(self, target: Vector, k: int = 1) -> list[tuple[int, float]]:
+        """주어진 점에서 가장 가까운 k개의 점을 찾음.
+
+        Args:
+            target (Vector): 기준점.
+            k (int, optional): 찾을 점의 개수. Defaults to 1.
+
+        Returns:
+            list[tuple[int, float]]: (ID, 거리)의 리스트. 가까운 순서로 정렬됨.
+        """
+        coordinates = self._coordinates(target)
+        if k <= 0:
+            return []
+        heap: list[tuple[float, int]] = []  # (-거리의 제곱, ID)의 최대 힙
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if not node.removed:
+                candidate = (-_squared_distance(coordinates, node.point), node.point_id)
+                if len(heap) < k:
+                    heappush(heap, candidate)
+                elif candidate > heap[0]:
+                    heappushpop(heap, candidate)
+            difference = coordinates[node.axis] - node.point[node.axis]
+            near, far = (node.left, node.right) if difference < 0 else (node.right, node.left)
+            if len(heap) < k or difference * difference < -heap[0][0]:
+                stack.append(far)
+            stack.append(near)
+        return [(point_id, sqrt(-distance)) for distance, point_id in sorted(heap, reverse=True)]
+
+    def radius(self, target: Vector, radius: float) -> list[int]:
+        """주어진 점으로부터 반경 안에 있는 점들을 찾음.
+
+        Args:
+            target (Vector): 기준점.
+            radius (float): 반경.
+
+        Returns:
+            list[int]: 반경 안에 있는 점들의 ID.
+        """
+        coordinates = self._coordinates(target)
+        radius_squared = radius * radius
+        found = []
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if not node.removed and _squared_distance(coordinates, node.point) <= radius_squared:
+                found.append(node.point_id)
+            difference = coordinates[node.axis] - node.point[node.axis]
+            if difference - radius <= 0:
+                stack.append(node.left)
+            if difference + radius >= 0:
+                stack.append(node.right)
+        return sorted(found)
+
+    def box(self, lower: Vector, upper: Vector) -> list[int]:
+        """축 정렬 경계 상자 안에 있는 점들을 찾음.
+
+        Args:
+            lower (Vector): 상자의 각 축 최솟값.
+            upper (Vector): 상자의 각 축 최댓값.
+
+        Returns:
+            list[int]: 상자 안(경계 포함)에 있는 점들의 ID.
+        """
+        low, high = self._coordinates(lower), self._coordinates(upper)
+        found = []
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point = node.point
+            if not node.removed and all(a <= p <= b for a, p, b in zip(low, point, high)):
+                found.append(node.point_id)
+            if low[node.axis] <= point[node.axis]:
+                stack.append(node.left)
+            if high[node.axis] >= point[node.axis]:
+                stack.append(node.right)
+        return sorted(found)
+
+
+class UniformGrid(_SpatialIndex):
+    """균일 격자(공간 해시) 공간 인덱스.
+
+    점의 분포가 고르고 질의 반경이 격자 크기와 비슷할 때 k-d 트리보다 빠르며, 추가/삭제가 O(1)임.
+    """
+
+    __slots__ = ("__cell_size", "__cells", "__low", "__high")
+
+    def __init__(
+        self, cell_size: float, points: Iterable[Vector] | Vector2Array | Vector3Array = ()
+    ) -> None:
+        """균일 격자를 생성함.
+
+        Args:
+            cell_size (float): 격자 한 칸의 한 변의 길이.
+            points (Iterable[Vector] | Vector2Array | Vector3Array, optional): 인덱싱할 점들. Defaults to ().
+
+        Raises:
+            ValueError: 격자의 크기가 0 이하일 때 발생하는 에러.
+        """
+        if cell_size <= 0:
+            raise ValueError("The cell size must be positive.")
+        super().__init__()
+        self.__cell_size = float(cell_size)
+        self.__cells: dict[tuple[int, ...], list[int]] = {}
+        # 점이 있었던 칸들의 경계 상자. 삭제 시에는 줄이지 않으므로 실제보다 클 수 있음
+        self.__low: tuple[int, ...] | None = None
+        self.__high: tuple[int, ...] | None = None
+        for point in self._point_stream(points):
+            self.__add(point)
+
+    def __cell(self, point: Point) -> tuple[int, ...]:
+        """점이 속한 격자 칸의 좌표를 구함."""
+        size = self.__cell_size
+        return tuple(floor(value / size) for value in point)
+
+    def __add(self, coordinates: Point) -> int:
+        point_id = self._next_id
+        self._next_id += 1
+        self._points[point_id] = coordinates
+        cell = self.__cell(coordinates)
+        self.__cells.setdefault(cell, []).append(point_id)
+        if self.__low is None or self.__high is None:
+            self.__low = self.__high = cell
+        else:
+            self.__low = tuple(map(min, self.__low, cell))
+            self.__high = tuple(map(max, self.__high, cell))
+        return point_id
+
+    def insert(self, point: Vector) -> int:
+        """점을 추가함.
+
+        Args:
+            point (Vector): 추가할 점.
+
+        Raises:
+            TypeError: 인덱스와 차원이 다른 벡터가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            int: 추가된 점의 ID.
+        """
+        return self.__add(self._coordinates(point, register=True))
+
+    def remove(self, point_id: int) -> None:
+        """점을 삭제함.
+
+        Args:
+            point_id (int): 삭제할 점의 ID.
+
+        Raises:
+            KeyError: 존재하지 않는 ID가 주어졌을 때 발생하는 에러.
+        """
+        cell = self.__cell(self._points.pop(point_id))
+        members = self.__cells[cell]
+        members.remove(point_id)
+        if not members:
+            del self.__cells[cell]
+
+    def __cells_between(self, low: tuple[int, ...], high: tuple[int, ...]) -> Iterator[int]:
+        """두 격자 칸 좌표 사이(경계 포함)의 모든 칸에 속한 점들의 ID를 나열함."""
+        cells = self.__cells
+        ranges = [range(a, b + 1) for a, b in zip(low, high)]
+        # 범위 안의 칸 수가 점이 있는 칸 수보다 많으면, 점이 있는 칸들만 확인함
+        if len(cells) < prod(map(len, ranges)):
+            for cell, members in cells.items():
+                if all(a <= c <= b for a, c, b in zip(low, cell, high)):
+                    yield from members
+            return
+        for cell in product(*ranges):
+            yield from cells.get(cell, ())
+
+    def radius(self, target: Vector, radius: float) -> list[int]:
+        """주어진 점으로부터 반경 안에 있는 점들을 찾음.
+
+        Args:
+            target (Vector): 기준점.
+            radius (float): 반경.
+
+        Returns:
+            list[int]: 반경 안에 있는 점들의 ID.
+        """
+        coordinates = self._coordinates(target)
+        radius_squared = radius * radius
+        points = self._points
+        low = self.__cell(tuple(value - radius for value in coordinates))
+        high = self.__cell(tuple(value + radius for value in coordinates))
+        return sorted(
+            point_id
+            for point_id in self.__cells_between(low, high)
+            if _squared_distance(coordinates, points[point_id]) <= radius_squared
+        )
+
+    def box(self, lower: Vector, upper: Vector) -> list[int]:
+        """축 정렬 경계 상자 안에 있는 점들을 찾음.
+
+        Args:
+            lower (Vector): 상자의 각 축 최솟값.
+            upper (Vector): 상자의 각 축 최댓값.
+
+        Returns:
+            list[int]: 상자 안(경계 포함)에 있는 점들의 ID.
+        """
+        low, high = self._coordinates(lower), self._coordinates(upper)
+        points = self._points
+        return sorted(
+            point_id
+            for point_id in self.__cells_between(self.__cell(low), self.__cell(high))
+            if all(a <= p <= b for a, p, b in zip(low, points[point_id], high))
+        )
+
+    def __start_ring(self, center: tuple[int, ...]) -> int:
+        """기준 칸에서 점이 있는 칸들의 경계 상자까지의 칸 수(체비쇼프 거리)를 구함. 그보다 가까운 칸에는 점이 없음."""
+        if self.__low is None or self.__high is None:
+            return 0
+        return max(max(low - c, c - high, 0) for c, low, high in zip(center, self.__low, self.__high))
+
+    def nearest(self, target: Vector, k: int = 1) -> list[tuple[int, float]]:
+        """주어진 점에서 가장 가까운 k개의 점을 찾음. 찾을 때까지 탐색 범위를 한 칸씩 넓힘.
+
+        탐색은 점이 있는 칸들의 경계 상자에 닿는 범위부터 시작하며, 탐색 범위의 칸 수가 점이 있는 칸 수보다
+        많아지면 모든 점을 한 번에 확인하므로, 멀리 떨어진 점이나 성긴 격자에서도 빈 칸을 하나씩 확인하지 않음.
+
+        Args:
+            target (Vector): 기준점.
+            k (int, optional): 찾을 점의 개수. Defaults to 1.
+
+        Returns:
+            list[tuple[int, float]]: (ID, 거리)의 리스트. 가까운 순서로 정렬됨.
+        """
+        coordinates = self._coordinates(target)
+        k = min(k, len(self._points))
+        if k <= 0:
+            return []
+        points = self._points
+        center = self.__cell(coordinates)
+        ring = self.__start_ring(center)
+        while True:
+            if (2 * ring + 1) ** len(center) >= len(self.__cells):
+                candidates = nsmallest(
+                    k, ((_squared_distance(coordinates, point), point_id) for point_id, point in points.items())
+                )
+                break
+            low = tuple(c - ring for c in center)
+            high = tuple(c + ring for c in center)
+            scanned = list(self.__cells_between(low, high))
+            candidates = nsmallest(
+                k,
+                ((_squared_distance(coordinates, points[point_id]), point_id) for point_id in scanned),
+            )
+            # 탐색한 칸들 밖의 점은 최소 ring * cell_size 만큼 떨어져 있음
+            reach = ring * self.__cell_size
+            if len(candidates) == k and candidates[-1][0] <= reach * reach:
+                break
+            if len(scanned) == len(points):
+                break
+            ring += 1
+        return [(point_id, sqrt(distance)) for distance, point_id in candidates]
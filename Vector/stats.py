@@ -0,0 +1,403 @@
+"""벡터들의 합, 평균, 범위, 공분산, 주축 등의 통계를 계산하기 위한 모듈
+
+Statistics는 벡터 배열을 청크 단위로 받아 통계량을 누적하므로, 메모리에 한 번에 담을 수 없는 입력도
+청크를 하나씩 넘겨 처리할 수 있음.
+
+    stats = Statistics(batch)
+    centroid, (low, high) = stats.mean(), stats.bounds()
+
+    stats = Statistics.from_batches(VectorReader(file).batches())
+    axes = stats.principal_axes()
+
+각 청크의 합은 math.fsum으로 정확히 반올림하여 계산하고, 청크 사이의 합은 보정 합(Neumaier)으로 누적함.
+공분산은 청크마다 청크의 평균을 기준으로 계산한 뒤 Chan의 방법으로 합치므로, 평균이 원점에서 멀어도 정밀도가 유지됨.
+"""
+
+from __future__ import annotations
+from itertools import repeat
+from math import copysign, fsum, inf, sqrt
+from operator import mul, sub
+from typing import Iterable
+
+from Vector.batch import VectorArray, _array_type
+from Vector.matrix import Matrix, Matrix2, Matrix3, Matrix4
+from Vector.vector import Vector
+
+_MATRIX_TYPES: dict[int, type[Matrix]] = {2: Matrix2, 3: Matrix3, 4: Matrix4}
+
+
+def _compensated_add(total: list[float], compensation: list[float], values: Iterable[float]) -> None:
+    """각 성분의 누적 합에 값을 보정 합(Neumaier)으로 더함."""
+    for i, value in enumerate(values):
+        current = total[i]
+        result = current + value
+        if abs(current) >= abs(value):
+            compensation[i] += (current - result) + value
+        else:
+            compensation[i] += (value - result) + current
+        total[i] = result
+
+
+def _symmetric_eigen(matrix: list[list[float]]) -> list[tuple[float, list[float]]]:
+    """대칭 행렬의 고윳값과 단위 고유벡터를 야코비 방법으로 구해, 고윳값이 큰 순서대로 반환함.
+
+    각 고유벡터는 절댓값이 가장 큰 성분이 양수가 되도록 부호를 정함.
+    """
+    size = len(matrix)
+    a = [row[:] for row in matrix]
+    v = [[float(i == j) for j in range(size)] for i in range(size)]
+    scale = fsum(value * value for row in a for value in row)
+    for _ in range(64):
+        off_diagonal = fsum(a[p][q] * a[p][q] for p in range(size) for q in range(p + 1, size))
+        if off_diagonal <= scale * 1e-32:
+            break
+        for p in range(size):
+            for q in range(p + 1, size):
+                if a[p][q] == 0.0:
+                    continue
+                theta = (a[q][q] - a[p][p]) / (2.0 * a[p][q])
+                t = copysign(1.0, theta) / (abs(theta) + sqrt(theta * theta + 1.0))
+                c = 1.0 / sqrt(t * t + 1.0)
+                s = t * c
+                for k in range(size):
+                    akp, akq = a[k][p], a[k][q]
+                    a[k][p], a[k][q] = c * akp - s * akq, s * akp + c * akq
+                for k in range(size):
+                    apk, aqk = a[p][k], a[q][k]
+                    a[p][k], a[q][k] = c * apk - s * aqk, s * apk + c * aqk
+                for k in range(size):
+                    vkp, vkq = v[k][p], v[k][q]
+                    v[k][p], v[k][q] = c * vkp - s * vkq, s * vkp + c * vkq
+    pairs = []
+    for i in range(size):
+        axis = [v[k][i] for k in range(size)]
+        sign = copysign(1.0, max(axis, key=abs))
+        pairs.append((a[i][i], [sign * value for value in axis]))
+    pairs.sort(key=lambda pair: pair[0], reverse=True)
+    return pairs
+
+
+class Statistics:
+    """같은 차원의 벡터들의 통계량을 청크 단위로 누적하기 위한 클래스.
+
+    update로 벡터 배열을 더할 때마다 개수, 합, 가중 합, 성분별 최솟값과 최댓값, 평균에 대한 곱의 합을
+    갱신하며, 각 통계는 메서드를 호출할 때 누적된 값으로부터 계산함.
+    """
+
+    __slots__ = (
+        "_vector_type",
+        "_count",
+        "_sum",
+        "_sum_error",
+        "_weighted_sum",
+        "_weighted_sum_error",
+        "_weight",
+        "_weight_error",
+        "_min",
+        "_max",
+        "_mean",
+        "_comoments",
+    )
+
+    def __init__(
+        self,
+        vectors: VectorArray | Iterable[Vector] | None = None,
+        weights: Iterable[float | int] | None = None,
+    ) -> None:
+        """비어 있는 누적기를 생성하고, 벡터들이 주어지면 바로 더함.
+
+        Args:
+            vectors (VectorArray | Iterable[Vector] | None, optional): 처음에 더할 벡터들. Defaults to None.
+            weights (Iterable[float | int] | None, optional): 각 벡터의 가중치. None일 시 모두 1. Defaults to None.
+
+        Raises:
+            TypeError: 차원이 서로 다른 벡터들이 주어졌을 때 발생하는 에러.
+            ValueError: 가중치의 개수가 벡터의 개수와 다를 때 발생하는 에러.
+        """
+        self._vector_type: type[Vector] | None = None
+        self._count = 0
+        self._weight = 0.0
+        self._weight_error = 0.0
+        if vectors is not None:
+            self.update(vectors, weights)
+
+    @classmethod
+    def from_batches(cls, batches: Iterable[VectorArray]) -> Statistics:
+        """벡터 배열들을 차례로 더한 누적기를 생성함. 한 번에 하나의 배열만 메모리에 있으면 됨.
+
+        Args:
+            batches (Iterable[VectorArray]): 같은 차원의 벡터 배열들. (VectorReader.batches(), Stream.batches() 등)
+
+        Raises:
+            TypeError: 차원이 서로 다른 벡터 배열들이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Statistics: 생성된 누적기.
+        """
+        statistics = cls()
+        for batch in batches:
+            statistics.update(batch)
+        return statistics
+
+    @property
+    def count(self) -> int:
+        """지금까지 더한 벡터의 개수를 반환함.
+
+        Returns:
+            int: 벡터의 개수.
+        """
+        return self._count
+
+    @property
+    def demention(self) -> int:
+        """통계를 계산하는 벡터의 차원을 반환함. 아직 아무 벡터도 더하지 않았다면 0.
+
+        Returns:
+            int: 차원
+        """
+        return self._vector_type._DEMENTION if self._vector_type is not None else 0
+
+    def _start(self, vector_type: type[Vector]) -> None:
+        """첫 벡터의 종류에 맞게 성분별 누적값을 초기화함."""
+        dim = vector_type._DEMENTION
+        self._vector_type = vector_type
+        self._sum = [0.0] * dim
+        self._sum_error = [0.0] * dim
+        self._weighted_sum = [0.0] * dim
+        self._weighted_sum_error = [0.0] * dim
+        self._min = [inf] * dim
+        self._max = [-inf] * dim
+        self._mean = [0.0] * dim
+        self._comoments = [[0.0] * dim for _ in range(dim)]
+
+    def update(
+        self,
+        vectors: VectorArray | Iterable[Vector],
+        weights: Iterable[float | int] | None = None,
+    ) -> Statistics:
+        """벡터들을 한 번에 훑어 통계량에 더함.
+
+        Args:
+            vectors (VectorArray | Iterable[Vector]): 더할 벡터 배열, 혹은 같은 차원의 벡터들.
+            weights (Iterable[float | int] | None, optional): 각 벡터의 가중치. weighted_mean에만 사용되며,
+                None일 시 모두 1. Defaults to None.
+
+        Raises:
+            TypeError: 지금까지 더한 벡터와 차원이 다른 벡터가 주어졌을 때 발생하는 에러.
+            ValueError: 가중치의 개수가 벡터의 개수와 다를 때 발생하는 에러.
+
+        Returns:
+            Statistics: 자기 자신. (Stream.reduce(Statistics.update, Statistics())처럼 사용할 수 있음)
+        """
+        if not isinstance(vectors, VectorArray):
+            vectors = list(vectors)
+            if not vectors:
+                return self
+            vectors = _array_type(type(vectors[0]))(vectors)
+        count = len(vectors)
+        if not count:
+            return self
+        if self._vector_type is not None and vectors.demention != self.demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        dim = vectors.demention
+        data = vectors.data
+        columns = [data[i::dim] for i in range(dim)]
+
+        part = Statistics()
+        part._start(vectors._VECTOR_TYPE)
+        part._count = count
+        part._sum = [fsum(column) for column in columns]
+        if weights is None:
+            part._weighted_sum, part._weight = part._sum, float(count)
+        else:
+            weights = [float(weight) for weight in weights]
+            if len(weights) != count:
+                raise ValueError("The number of weights must match the number of vectors.")
+            part._weighted_sum = [fsum(map(mul, column, weights)) for column in columns]
+            part._weight = fsum(weights)
+        part._min = [min(column) for column in columns]
+        part._max = [max(column) for column in columns]
+        part._mean = [total / count for total in part._sum]
+        # 청크의 평균을 기준으로 곱의 합을 구해, 평균이 원점에서 멀어도 자릿수가 사라지지 않게 함
+        centered = [list(map(sub, column, repeat(mean))) for column, mean in zip(columns, part._mean)]
+        for i in range(dim):
+            for j in range(i, dim):
+                part._comoments[i][j] = part._comoments[j][i] = fsum(map(mul, centered[i], centered[j]))
+        return self.merge(part)
+
+    def _check_not_empty(self) -> None:
+        """벡터를 하나도 더하지 않았으면 에러를 발생시킴.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+        """
+        if not self._count:
+            raise ValueError("Cannot compute statistics of an empty collection of vectors.")
+
+    def sum(self) -> Vector:
+        """모든 벡터의 합을 반환함.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+
+        Returns:
+            Vector: 벡터들의 합.
+        """
+        self._check_not_empty()
+        return self._vector_type(*map(sum, zip(self._sum, self._sum_error)))
+
+    def mean(self) -> Vector:
+        """모든 벡터의 평균(무게중심)을 반환함.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+
+        Returns:
+            Vector: 벡터들의 평균.
+        """
+        self._check_not_empty()
+        return self._vector_type(*((total + error) / self._count for total, error in zip(self._sum, self._sum_error)))
+
+    def weighted_mean(self) -> Vector:
+        """update에 주어진 가중치로 가중 평균을 반환함. 가중치 없이 더한 벡터의 가중치는 1임.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았거나, 가중치의 합이 0일 때 발생하는 에러.
+
+        Returns:
+            Vector: 벡터들의 가중 평균.
+        """
+        self._check_not_empty()
+        weight = self._weight + self._weight_error
+        if weight == 0.0:
+            raise ValueError("The sum of the weights must not be zero.")
+        return self._vector_type(
+            *((total + error) / weight for total, error in zip(self._weighted_sum, self._weighted_sum_error))
+        )
+
+    def min(self) -> Vector:
+        """성분별 최솟값으로 이루어진 벡터를 반환함.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+
+        Returns:
+            Vector: 성분별 최솟값.
+        """
+        self._check_not_empty()
+        return self._vector_type(*self._min)
+
+    def max(self) -> Vector:
+        """성분별 최댓값으로 이루어진 벡터를 반환함.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+
+        Returns:
+            Vector: 성분별 최댓값.
+        """
+        self._check_not_empty()
+        return self._vector_type(*self._max)
+
+    def bounds(self) -> tuple[Vector, Vector]:
+        """모든 벡터를 포함하는 축 정렬 경계 상자(AABB)를 반환함.
+
+        Raises:
+            ValueError: 벡터를 하나도 더하지 않았을 때 발생하는 에러.
+
+        Returns:
+            tuple[Vector, Vector]: (최소 모서리, 최대 모서리)
+        """
+        return self.min(), self.max()
+
+    def _covariance_rows(self, ddof: int) -> list[list[float]]:
+        """공분산 행렬의 각 행을 반환함.
+
+        Raises:
+            ValueError: 벡터의 개수가 ddof보다 많지 않을 때 발생하는 에러.
+        """
+        self._check_not_empty()
+        if self._count <= ddof:
+            raise ValueError("The number of vectors must be greater than ddof.")
+        divisor = self._count - ddof
+        return [[value / divisor for value in row] for row in self._comoments]
+
+    def covariance(self, ddof: int = 1) -> Matrix | tuple[tuple[float, ...], ...]:
+        """성분 사이의 공분산 행렬을 반환함.
+
+        Args:
+            ddof (int, optional): 자유도 보정. 개수 - ddof로 나눔. 1일 시 표본 공분산, 0일 시 모공분산. Defaults to 1.
+
+        Raises:
+            ValueError: 벡터의 개수가 ddof보다 많지 않을 때 발생하는 에러.
+
+        Returns:
+            Matrix | tuple[tuple[float, ...], ...]: 2, 3, 4차원은 Matrix2, Matrix3, Matrix4로, 그 외의 차원은 각 행의 튜플로 반환함.
+        """
+        rows = self._covariance_rows(ddof)
+        matrix_type = _MATRIX_TYPES.get(len(rows))
+        if matrix_type is None:
+            return tuple(map(tuple, rows))
+        return matrix_type(rows)
+
+    def principal_axes(self, ddof: int = 1) -> list[tuple[float, Vector]]:
+        """공분산 행렬의 고윳값과 고유벡터로부터 주축들을 구함. (주성분 분석)
+
+        Args:
+            ddof (int, optional): 공분산의 자유도 보정. 고윳값의 크기에만 영향을 줌. Defaults to 1.
+
+        Raises:
+            ValueError: 벡터의 개수가 ddof보다 많지 않을 때 발생하는 에러.
+
+        Returns:
+            list[tuple[float, Vector]]: (축 방향의 분산, 단위 벡터인 축)의 목록. 분산이 큰 순서대로 정렬되며,
+                    각 축은 절댓값이 가장 큰 성분이 양수임.
+        """
+        return [
+            (variance, self._vector_type(*axis))
+            for variance, axis in _symmetric_eigen(self._covariance_rows(ddof))
+        ]
+
+    def merge(self, other: Statistics) -> Statistics:
+        """다른 누적기의 통계량을 합침. 여러 작업자가 나누어 계산한 결과를 합칠 때 사용함.
+
+        Args:
+            other (Statistics): 합칠 누적기. 바뀌지 않음.
+
+        Raises:
+            TypeError: 차원이 서로 다른 누적기가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Statistics: 자기 자신.
+        """
+        if not other._count:
+            return self
+        if self._vector_type is None:
+            self._start(other._vector_type)
+        elif other.demention != self.demention:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        # Chan의 방법으로 두 누적기의 평균과 평균에 대한 곱의 합을 합침
+        previous, count = self._count, other._count
+        total = previous + count
+        deltas = [mean - old for mean, old in zip(other._mean, self._mean)]
+        factor = previous * count / total
+        dim = self.demention
+        for i in range(dim):
+            for j in range(dim):
+                self._comoments[i][j] += other._comoments[i][j] + deltas[i] * deltas[j] * factor
+        self._mean = [old + delta * count / total for old, delta in zip(self._mean, deltas)]
+        self._count = total
+        _compensated_add(self._sum, self._sum_error, other._sum)
+        _compensated_add(self._sum, self._sum_error, other._sum_error)
+        _compensated_add(self._weighted_sum, self._weighted_sum_error, other._weighted_sum)
+        _compensated_add(self._weighted_sum, self._weighted_sum_error, other._weighted_sum_error)
+        weight, weight_error = [self._weight], [self._weight_error]
+        _compensated_add(weight, weight_error, (other._weight,))
+        _compensated_add(weight, weight_error, (other._weight_error,))
+        self._weight, self._weight_error = weight[0], weight_error[0]
+        self._min = [min(pair) for pair in zip(self._min, other._min)]
+        self._max = [max(pair) for pair in zip(self._max, other._max)]
+        return self
+
+    def __repr__(self) -> str:
+        return f"Statistics(count={self._count}, demention={self.demention})"
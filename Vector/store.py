@@ -0,0 +1,249 @@
+"""벡터들을 파일에 저장하고 메모리 맵으로 불러오기 위한 모듈
+
+파일은 16바이트 헤더(매직 넘버, 차원, 벡터의 개수) 뒤에 리틀 엔디언 float64 성분이
+[x0, y0, z0, x1, y1, z1, ...] 순서로 연속 저장된 형태임.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from typing import Callable, Iterable, Iterator
+
+from Vector.batch import Vector2Array, Vector3Array, Vector4Array, VectorArray
+from Vector.vector import Vector
+
+_MAGIC = b"VEC\x00"
+_HEADER = struct.Struct("<4sIQ")  # 매직 넘버, 차원, 벡터의 개수
+_ITEM_SIZE = 8
+_ARRAY_TYPES: dict[int, type[VectorArray]] = {2: Vector2Array, 3: Vector3Array, 4: Vector4Array}
+
+
+class VectorStore:
+    """파일에 저장된 벡터들을 메모리 맵으로 다루기 위한 클래스.
+
+    파일 전체를 읽지 않고 필요한 페이지만 운영체제가 불러오므로, 파일 크기와 관계없이 즉시 열림.
+    인덱싱은 벡터를, 슬라이싱은 파일과 메모리를 공유하는 벡터 배열을 반환함.
+    """
+
+    __slots__ = ("__file", "__map", "__view", "__demention", "__count", "__writable")
+
+    def __init__(self, path: str | os.PathLike[str], writable: bool = False) -> None:
+        """저장소 파일을 엶.
+
+        Args:
+            path (str | os.PathLike[str]): 저장소 파일의 경로.
+            writable (bool, optional): True일 시 수정 및 추가가 가능한 상태로 엶. Defaults to False.
+
+        Raises:
+            ValueError: 올바른 저장소 파일이 아닐 때 발생하는 에러.
+            NotImplementedError: 빅 엔디언 플랫폼에서 열려고 할 때 발생하는 에러.
+        """
+        if sys.byteorder != "little":
+            raise NotImplementedError("VectorStore only supports little-endian platforms.")
+        self.__writable = writable
+        self.__file = open(path, "r+b" if writable else "rb")
+        try:
+            header = self.__file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise ValueError("The file is too small to be a vector store.")
+            magic, demention, count = _HEADER.unpack(header)
+            if magic != _MAGIC or demention not in _ARRAY_TYPES:
+                raise ValueError("The file is not a vector store.")
+            self.__demention: int = demention
+            self.__count: int = count
+            self.__remap()
+        except BaseException:
+            self.__file.close()
+            raise
+
+    @classmethod
+    def create(
+        cls, path: str | os.PathLike[str], demention: int, capacity: int = 0
+    ) -> VectorStore:
+        """비어있는 저장소 파일을 새로 만들고 수정 가능한 상태로 엶. 같은 경로의 파일은 덮어씀.
+
+        Args:
+            path (str | os.PathLike[str]): 저장소 파일의 경로.
+            demention (int): 저장할 벡터의 차원. (2, 3, 4)
+            capacity (int, optional): 미리 확보할 벡터의 개수. Defaults to 0.
+
+        Raises:
+            ValueError: 지원하지 않는 차원이 주어졌을 때 발생하는 에러.
+
+        Returns:
+            VectorStore: 생성된 저장소.
+        """
+        if demention not in _ARRAY_TYPES:
+            raise ValueError("The demention of a vector store must be 2, 3 or 4.")
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, demention, 0))
+            file.truncate(_HEADER.size + capacity * demention * _ITEM_SIZE)
+        return cls(path, writable=True)
+
+    def __remap(self) -> None:
+        """파일 전체를 다시 메모리 맵으로 불러옴.
+
+        이전 맵은 닫지 않으므로, 이전에 반환된 벡터 배열들은 계속 유효함.
+        """
+        self.__map = mmap.mmap(
+            self.__file.fileno(),
+            0,
+            access=mmap.ACCESS_WRITE if self.__writable else mmap.ACCESS_READ,
+        )
+        self.__view = memoryview(self.__map)[_HEADER.size :].cast("d")
+
+    @property
+    def demention(self) -> int:
+        """저장된 벡터의 차원을 반환합니다.
+
+        Returns:
+            int: 차원
+        """
+        return self.__demention
+
+    @property
+    def capacity(self) -> int:
+        """파일을 늘리지 않고 저장할 수 있는 벡터의 개수를 반환함.
+
+        Returns:
+            int: 저장 가능한 벡터의 개수.
+        """
+        return len(self.__view) // self.__demention
+
+    def _array_type(self) -> type[VectorArray]:
+        """저장된 벡터의 차원에 맞는 벡터 배열 클래스를 반환함."""
+        return _ARRAY_TYPES[self.__demention]
+
+    def as_batch(self) -> VectorArray:
+        """저장된 모든 벡터를 복사 없이 하나의 벡터 배열로 반환함.
+
+        Returns:
+            VectorArray: 파일과 메모리를 공유하는 벡터 배열.
+        """
+        return self._array_type()._wrap(self.__view[: self.__count * self.__demention])
+
+    def chunks(self, chunk_size: int = 65536) -> Iterator[VectorArray]:
+        """저장된 벡터들을 일정한 개수씩 나누어 복사 없이 순회함.
+
+        Args:
+            chunk_size (int, optional): 한 번에 반환할 벡터의 개수. Defaults to 65536.
+
+        Yields:
+            Iterator[VectorArray]: 파일과 메모리를 공유하는 벡터 배열.
+        """
+        array_type = self._array_type()
+        demention = self.__demention
+        view = self.__view
+        for start in range(0, self.__count, chunk_size):
+            stop = min(start + chunk_size, self.__count)
+            yield array_type._wrap(view[start * demention : stop * demention])
+
+    def transform(
+        self, function: Callable[[VectorArray], VectorArray], chunk_size: int = 65536
+    ) -> None:
+        """저장된 벡터들을 청크 단위로 변환하여 파일에 다시 씀.
+
+        Args:
+            function (Callable[[VectorArray], VectorArray]): 벡터 배열을 받아 같은 길이의 벡터 배열을 반환하는 함수.
+            chunk_size (int, optional): 한 번에 변환할 벡터의 개수. Defaults to 65536.
+
+        Raises:
+            ValueError: 변환 결과의 길이가 입력과 다를 때 발생하는 에러.
+        """
+        for chunk in self.chunks(chunk_size):
+            result = function(chunk)
+            if len(result) != len(chunk):
+                raise ValueError("The transform must return a batch of the same length.")
+            if result.data is not chunk.data:
+                chunk.data[:] = result.data
+
+    def normalize(self, chunk_size: int = 65536) -> None:
+        """저장된 모든 벡터를 청크 단위로 단위 벡터로 변환함.
+
+        Args:
+            chunk_size (int, optional): 한 번에 변환할 벡터의 개수. Defaults to 65536.
+        """
+        for chunk in self.chunks(chunk_size):
+            chunk.normalize()
+
+    def append(self, vector: Vector) -> None:
+        """저장소의 끝에 벡터를 추가함.
+
+        Args:
+            vector (Vector): 추가할 벡터.
+        """
+        self.extend((vector,))
+
+    def extend(self, vectors: Iterable[Vector] | VectorArray) -> None:
+        """저장소의 끝에 여러 벡터를 추가함. 필요 시 파일의 크기를 두 배씩 늘림.
+
+        Args:
+            vectors (Iterable[Vector] | VectorArray): 추가할 벡터들.
+
+        Raises:
+            TypeError: 저장소의 차원과 다른 벡터가 주어졌을 때 발생하는 에러.
+        """
+        array_type = self._array_type()
+        batch = vectors if isinstance(vectors, array_type) else array_type(vectors)
+        if batch.dtype != "float64":
+            # 저장소는 float64로만 저장되며, float32에서의 변환은 손실이 없음
+            batch = batch.astype("float64")
+        count = len(batch)
+        if self.__count + count > self.capacity:
+            self.__reserve(max(self.__count + count, 2 * self.capacity))
+        demention = self.__demention
+        start = self.__count * demention
+        self.__view[start : start + count * demention] = batch.data
+        self.__count += count
+        _HEADER.pack_into(self.__map, 0, _MAGIC, demention, self.__count)
+
+    def __reserve(self, capacity: int) -> None:
+        """파일을 늘려 capacity개의 벡터를 저장할 수 있게 함."""
+        self.__file.truncate(_HEADER.size + capacity * self.__demention * _ITEM_SIZE)
+        self.__remap()
+
+    def flush(self) -> None:
+        """변경된 내용을 디스크에 기록함."""
+        if self.__writable:
+            self.__map.flush()
+
+    def close(self) -> None:
+        """저장소를 닫음.
+
+        반환된 벡터 배열이 아직 남아있으면 해당 배열들이 사라질 때 메모리 맵이 해제됨.
+        """
+        self.flush()
+        self.__view.release()
+        try:
+            self.__map.close()
+        except BufferError:
+            pass
+        self.__file.close()
+
+    def __enter__(self) -> VectorStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __iter__(self) -> Iterator[Vector]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __getitem__(self, index: int | slice) -> Vector | VectorArray:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__count)
+            if step == 1:
+                demention = self.__demention
+                stop = max(start, stop)
+                return self._array_type()._wrap(self.__view[start * demention : stop * demention])
+            return self.as_batch()[index]
+        return self.as_batch()[index]
+
+    def __setitem__(self, index: int, vector: Vector) -> None:
+        self.as_batch()[index] = vector
@@ -0,0 +1,279 @@
+"""메모리에 한 번에 담을 수 없는 벡터 시퀀스를 단계별로 지연 처리하기 위한 모듈
+
+Stream은 벡터들을 chunk_size개씩 벡터 배열로 묶어 각 단계를 적용하므로, transform, select 처럼
+배열 단위로 정의된 단계는 벡터 배열의 연산을 그대로 사용함. 단계는 결과를 꺼낼 때 비로소 실행되며,
+한 번에 하나의 청크만 메모리에 있으므로 입력의 길이와 관계없이 일정한 메모리만 사용함.
+
+    stream = (
+        Stream(sensor_samples)
+        .transform(methodcaller("rotate", Vector3(0.1, 0.2, 0.3)))
+        .select(lambda chunk: [n > 0.5 for n in chunk.norm()])
+        .transform(Vector3Array.normalize)
+        .map(Vector3.to_2d)
+    )
+    for chunk in stream.batches():
+        ...
+
+단계를 추가하는 메서드는 원래 스트림을 바꾸지 않고 새로운 스트림을 반환함.
+"""
+
+from __future__ import annotations
+from array import array
+from itertools import chain, compress, islice
+from typing import Any, Callable, Iterable, Iterator
+
+from Vector.batch import VectorArray, _array_type, _typecode_of
+from Vector.vector import Vector
+
+Stage = Callable[[VectorArray], "VectorArray | None"]
+
+
+def _batch_of(vectors: list[Any], dtype: str) -> VectorArray:
+    """벡터들을 첫 벡터의 종류에 맞는 벡터 배열로 묶음.
+
+    Raises:
+        TypeError: 벡터가 아닌 값이 주어졌을 때 발생하는 에러.
+    """
+    if not isinstance(vectors[0], Vector):
+        raise TypeError("Every stage of a stream must produce vectors.")
+    return _array_type(type(vectors[0]))(vectors, dtype)
+
+
+def _chunk_vectors(vectors: Iterable[Vector], chunk_size: int, dtype: str) -> Iterator[VectorArray]:
+    """벡터들을 chunk_size개씩 벡터 배열로 묶음."""
+    iterator = iter(vectors)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield _batch_of(chunk, dtype)
+
+
+def _chunk_batches(batches: Iterable[VectorArray], chunk_size: int, dtype: str) -> Iterator[VectorArray]:
+    """크기가 제각각인 벡터 배열들을 복사하여 chunk_size개씩의 벡터 배열로 다시 나눔."""
+    typecode = _typecode_of(dtype)
+    array_type: type[VectorArray] | None = None
+    buffer = array(typecode)
+    for batch in batches:
+        if array_type is None:
+            array_type = type(batch)
+        elif batch.demention != array_type._DEMENTION:
+            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+        buffer.extend(array(typecode, batch.data) if batch._typecode != typecode else batch.data)
+        size = chunk_size * array_type._DEMENTION
+        full = len(buffer) - len(buffer) % size
+        for start in range(0, full, size):
+            yield array_type._wrap(buffer[start : start + size])
+        del buffer[:full]
+    if buffer:
+        yield array_type._wrap(buffer)
+
+
+def _map_stage(function: Callable[[Vector], Vector], dtype: str) -> Stage:
+    """벡터마다 함수를 적용하는 단계를 만듦."""
+
+    def stage(chunk: VectorArray) -> VectorArray:
+        return _batch_of(list(map(function, chunk)), dtype)
+
+    return stage
+
+
+def _select_stage(function: Callable[[VectorArray], Iterable[Any]]) -> Stage:
+    """청크에 대해 함수가 반환한 마스크가 참인 벡터만 남기는 단계를 만듦."""
+
+    def stage(chunk: VectorArray) -> VectorArray:
+        dim = chunk.demention
+        values = iter(chunk.data)
+        kept = compress(zip(*[values] * dim), function(chunk))
+        return chunk._wrap(array(chunk._typecode, chain.from_iterable(kept)))
+
+    return stage
+
+
+class Stream:
+    """벡터 시퀀스에 대한 지연 처리 파이프라인을 표현하기 위한 클래스.
+
+    각 단계는 벡터 배열(청크)을 받아 새로운 벡터 배열을 반환하거나, 받은 배열을 직접 수정하고
+    None을 반환하는 함수임. 청크는 스트림이 소유한 복사본이므로 직접 수정해도 입력은 바뀌지 않음.
+    """
+
+    __slots__ = ("_source", "_stages", "_chunk_size", "_dtype")
+
+    def __init__(
+        self,
+        vectors: Iterable[Vector] | VectorArray,
+        chunk_size: int = 4096,
+        dtype: str = "float64",
+    ) -> None:
+        """벡터들을 입력으로 하는 스트림을 생성함. 입력은 결과를 꺼낼 때 조금씩 읽음.
+
+        Args:
+            vectors (Iterable[Vector] | VectorArray): 입력 벡터들. 제너레이터처럼 한 번만 읽을 수 있어도 됨.
+            chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 4096.
+            dtype (str, optional): 청크의 저장 정밀도. "float32" 또는 "float64". Defaults to "float64".
+
+        Raises:
+            ValueError: 청크의 크기가 1보다 작거나, 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+        """
+        _typecode_of(dtype)
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be positive.")
+        if isinstance(vectors, VectorArray):
+            self._source: Callable[[], Iterator[VectorArray]] = lambda: _chunk_batches((vectors,), chunk_size, dtype)
+        else:
+            self._source = lambda: _chunk_vectors(vectors, chunk_size, dtype)
+        self._stages: tuple[Stage, ...] = ()
+        self._chunk_size = chunk_size
+        self._dtype = dtype
+
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[VectorArray],
+        chunk_size: int = 4096,
+        dtype: str = "float64",
+    ) -> Stream:
+        """벡터 배열들을 입력으로 하는 스트림을 생성함. VectorReader.batches()처럼 배열 단위로 읽는 입력에 사용함.
+
+        Args:
+            batches (Iterable[VectorArray]): 같은 차원의 벡터 배열들. 크기는 서로 달라도 됨.
+            chunk_size (int, optional): 한 번에 처리할 벡터의 개수. Defaults to 4096.
+            dtype (str, optional): 청크의 저장 정밀도. "float32" 또는 "float64". Defaults to "float64".
+
+        Raises:
+            ValueError: 청크의 크기가 1보다 작거나, 지원하지 않는 정밀도가 주어졌을 때 발생하는 에러.
+
+        Returns:
+            Stream: 생성된 스트림.
+        """
+        stream = cls((), chunk_size, dtype)
+        stream._source = lambda: _chunk_batches(batches, chunk_size, dtype)
+        return stream
+
+    @property
+    def chunk_size(self) -> int:
+        """한 번에 처리할 벡터의 개수를 반환함.
+
+        Returns:
+            int: 청크의 크기.
+        """
+        return self._chunk_size
+
+    def _then(self, stage: Stage) -> Stream:
+        """단계를 하나 더한 새로운 스트림을 반환함."""
+        stream = Stream.__new__(Stream)
+        stream._source = self._source
+        stream._stages = self._stages + (stage,)
+        stream._chunk_size = self._chunk_size
+        stream._dtype = self._dtype
+        return stream
+
+    def transform(self, function: Stage) -> Stream:
+        """청크마다 벡터 배열의 연산을 적용하는 단계를 더함.
+
+        Args:
+            function (Stage): 벡터 배열을 받아 벡터 배열을 반환하거나, 받은 배열을 직접 수정하고 None을
+                반환하는 함수. (Vector3Array.normalize, methodcaller("rotate", euler) 등)
+                결과의 길이와 차원은 청크와 달라도 됨.
+
+        Returns:
+            Stream: 단계가 더해진 새로운 스트림.
+        """
+        return self._then(function)
+
+    def map(self, function: Callable[[Vector], Vector]) -> Stream:
+        """벡터마다 함수를 적용하는 단계를 더함. 배열의 연산으로 표현할 수 있다면 transform이 더 빠름.
+
+        Args:
+            function (Callable[[Vector], Vector]): 벡터를 받아 벡터를 반환하는 함수. (Vector3.to_2d 등)
+
+        Returns:
+            Stream: 단계가 더해진 새로운 스트림.
+        """
+        return self._then(_map_stage(function, self._dtype))
+
+    def select(self, function: Callable[[VectorArray], Iterable[Any]]) -> Stream:
+        """청크마다 마스크를 계산하여, 마스크가 참인 벡터만 남기는 단계를 더함.
+
+        Args:
+            function (Callable[[VectorArray], Iterable[Any]]): 벡터 배열을 받아 벡터마다 하나씩,
+                남길지의 여부를 반환하는 함수. (lambda chunk: [n < 1.0 for n in chunk.norm()] 등)
+
+        Returns:
+            Stream: 단계가 더해진 새로운 스트림.
+        """
+        return self._then(_select_stage(function))
+
+    def filter(self, predicate: Callable[[Vector], Any]) -> Stream:
+        """조건을 만족하는 벡터만 남기는 단계를 더함. 배열의 연산으로 표현할 수 있다면 select가 더 빠름.
+
+        Args:
+            predicate (Callable[[Vector], Any]): 벡터를 받아 남길지의 여부를 반환하는 함수.
+
+        Returns:
+            Stream: 단계가 더해진 새로운 스트림.
+        """
+        return self._then(_select_stage(lambda chunk: map(predicate, chunk)))
+
+    def batches(self) -> Iterator[VectorArray]:
+        """모든 단계를 거친 청크들을 순서대로 반환함. 비어 있는 청크는 건너뜀.
+
+        Yields:
+            Iterator[VectorArray]: 최대 chunk_size개(단계가 길이를 바꾸지 않는 경우)의 벡터를 가진 벡터 배열.
+        """
+        stages = self._stages
+        for chunk in self._source():
+            for stage in stages:
+                if not len(chunk):
+                    break
+                result = stage(chunk)
+                if result is not None:
+                    chunk = result
+            if len(chunk):
+                yield chunk
+
+    def __iter__(self) -> Iterator[Vector]:
+        for chunk in self.batches():
+            yield from chunk
+
+    def reduce(self, function: Callable[[Any, VectorArray], Any], initial: Any) -> Any:
+        """청크마다 누적값을 갱신하여 하나의 값으로 줄임.
+
+        Args:
+            function (Callable[[Any, VectorArray], Any]): 지금까지의 누적값과 청크를 받아 새로운 누적값을 반환하는 함수.
+                (lambda total, chunk: total + sum(chunk.norm()) 등)
+            initial (Any): 누적값의 초깃값.
+
+        Returns:
+            Any: 최종 누적값.
+        """
+        accumulator = initial
+        for chunk in self.batches():
+            accumulator = function(accumulator, chunk)
+        return accumulator
+
+    def count(self) -> int:
+        """모든 단계를 거친 벡터의 개수를 반환함.
+
+        Returns:
+            int: 벡터의 개수.
+        """
+        return self.reduce(lambda total, chunk: total + len(chunk), 0)
+
+    def collect(self) -> VectorArray:
+        """모든 단계를 거친 벡터들을 하나의 벡터 배열로 모음. 결과 전체가 메모리에 올라감.
+
+        Raises:
+            TypeError: 청크마다 차원이 다를 때 발생하는 에러.
+            ValueError: 결과가 비어 있어 차원을 알 수 없을 때 발생하는 에러.
+
+        Returns:
+            VectorArray: 결과 벡터 배열.
+        """
+        chunks = self.batches()
+        first = next(chunks, None)
+        if first is None:
+            raise ValueError("Cannot infer the demention of an empty collection of vectors.")
+        data = array(first._typecode, first.data)
+        for chunk in chunks:
+            if chunk.demention != first.demention:
+                raise TypeError("Operations cannot be performed with vectors of other dimensions.")
+            data.extend(chunk.data)
+        return first._wrap(data)
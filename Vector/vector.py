@@ -1,8 +1,9 @@
-"""2차원, 3차원 벡터를 표현하고 연산하기 위한 모듈"""
+"""2차원, 3차원, 4차원, 그리고 임의 차원의 벡터를 표현하고 연산하기 위한 모듈"""
 
 from __future__ import annotations
-from math import sqrt, cos, sin, atan2, asin, pi
-from typing import Any, Iterator
+from math import sqrt, cos, sin, atan2, asin, acos, hypot, pi
+from operator import iadd, ifloordiv, imod, imul, isub, itruediv
+from typing import Any, Callable, Iterator
 
 
 def _is_real_num(arg: Any) -> bool:
@@ -17,426 +18,618 @@ def _is_real_num(arg: Any) -> bool:
     return isinstance(arg, (float, int))
 
 
-class Vector:
-    pass
+def _import_numpy() -> Any:
+    """NumPy 모듈을 불러옴. NumPy는 선택적 의존성이므로 필요할 때만 불러옴.
 
+    Raises:
+        ImportError: NumPy가 설치되어 있지 않을 때 발생하는 에러.
 
-class Vector2(Vector):
-    """2차원 벡터를 표현하기 위한 클래스"""
+    Returns:
+        Any: numpy 모듈.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required for this operation. Install it with 'pip install numpy'."
+        ) from error
+    return numpy
+
+
+_REAL = (float, int)
+_TYPE_ERROR = "Operations cannot be performed with vectors of other dimensions."
+
+# 성분별 연산: (메서드 이름, 연산자, 요약, other의 설명)
+_ELEMENTWISE_OPERATORS: tuple[tuple[str, str, str, str], ...] = (
+    ("__add__", "+", "{noun}의 합을 계산함.", "해당 {noun}에 더해질 {noun}."),
+    ("__sub__", "-", "{noun}의 차를 계산함.", "해당 {noun}에서 빠질 {noun}."),
+    ("__truediv__", "/", "{noun}의 나눗셈을 계산함.", "{noun}의 나눗셈에서의 제수."),
+    ("__floordiv__", "//", "{noun}의 나눗셈. 소수점이 아닌, 몫을 계산.", "{noun}의 나눗셈에서의 제수."),
+    ("__mod__", "%", "{noun}의 나눗셈. 소수점이 아닌, 나머지를 계산.", "{noun}의 나눗셈에서의 제수."),
+)
+_REFLECTED_OPERATORS: tuple[tuple[str, str, str, str], ...] = (
+    ("__radd__", "+", "스칼라와 {noun}의 합을 계산함.", "해당 {noun}에 더해질 스칼라."),
+    ("__rsub__", "-", "스칼라에서 {noun}를 뺀 차를 계산함.", "해당 {noun}를 뺄 스칼라."),
+    ("__rtruediv__", "/", "스칼라를 {noun}로 나눈 나눗셈을 계산함.", "나눗셈에서의 피제수."),
+    ("__rfloordiv__", "//", "스칼라를 {noun}로 나눈 나눗셈. 소수점이 아닌, 몫을 계산.", "나눗셈에서의 피제수."),
+    ("__rmod__", "%", "스칼라를 {noun}로 나눈 나눗셈. 소수점이 아닌, 나머지를 계산.", "나눗셈에서의 피제수."),
+)
+_INPLACE_OPERATORS: tuple[tuple[str, str, str, str], ...] = (
+    ("__iadd__", "+=", "해당 {noun}에 다른 {noun}를 더함.", "해당 {noun}에 더해질 {noun}."),
+    ("__isub__", "-=", "해당 {noun}에서 다른 {noun}를 뺌.", "해당 {noun}에서 빠질 {noun}."),
+    (
+        "__imul__",
+        "*=",
+        "해당 {noun}의 각 성분에 다른 {noun}의 성분을 곱함. 내적이 아닌, 성분별 곱을 계산.",
+        "각 성분에 곱해질 {noun}.",
+    ),
+    ("__itruediv__", "/=", "해당 {noun}의 각 성분을 다른 {noun}의 성분으로 나눔.", "나눗셈에서의 제수."),
+    (
+        "__ifloordiv__",
+        "//=",
+        "해당 {noun}의 각 성분을 다른 {noun}의 성분으로 나눈 몫으로 설정함.",
+        "나눗셈에서의 제수.",
+    ),
+    (
+        "__imod__",
+        "%=",
+        "해당 {noun}의 각 성분을 다른 {noun}의 성분으로 나눈 나머지로 설정함.",
+        "나눗셈에서의 제수.",
+    ),
+)
+
+
+def _generate_methods(
+    name: str,
+    noun: str,
+    fields: tuple[str, ...],
+    params: tuple[str, ...],
+    labels: tuple[str, ...],
+    factory: str | None = None,
+) -> str:
+    """차원에 맞게 성분별로 풀어 쓴 메서드들의 소스 코드를 생성함.
+
+    모든 차원의 벡터 클래스가 같은 템플릿으로부터 만들어지므로, 연산의 수정과 최적화는 이곳에서 한 번만 하면 됨.
+    factory가 주어지면 연산 결과를 클래스 대신 해당 이름의 함수로 생성함. (Vector.pool 참고)
+    """
 
-    __DEMENTION = 2
+    def each(template: str, separator: str = ", ") -> str:
+        # {a}: 해당 벡터의 성분, {b}: 상대 벡터의 성분
+        return separator.join(template.format(a=f"self.{f}", b=f"other.{f}") for f in fields)
 
-    def __init__(
-        self, x: float | int | None = 0.0, y: float | int | None = 0.0
-    ) -> None:
-        """2차원 평면벡터를 정의함.
+    def new(template: str) -> str:
+        return f"{factory or name}({each(template)})"
 
-        Args:
-            x (float | int | None, optional): 평면벡터의 X축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            y (float | int | None, optional): 평면벡터의 Y축 성분. float 자료형으로 저장됨. Defaults to 0.0.
+    other_type = f"{name} | int | float"
+    sections = [
+        f'''
+def __init__(self, {", ".join(f"{p}: float | int | None = 0.0" for p in params)}) -> None:
+    """{noun}를 정의함.
 
-        Raises:
-            TypeError: 정수, 실수, 혹은 None이 아닌 다른 타입의 값이 인자로 주어졌을 때 발생하는 에러.
-        """
-        if not _is_real_num(x) or not _is_real_num(y):
-            raise TypeError("The component of Vector must be a float, int or None")
+    Args:
+{"".join(f"        {p} (float | int | None, optional): {noun}의 {label} 성분. float 자료형으로 저장됨. Defaults to 0.0.{chr(10)}" for p, label in zip(params, labels))}
+    Raises:
+        TypeError: 정수, 실수, 혹은 None이 아닌 다른 타입의 값이 인자로 주어졌을 때 발생하는 에러.
+    """
+    if not ({" and ".join(f"isinstance({p}, _REAL)" for p in params)}):
+        raise TypeError("The component of Vector must be a float, int or None")
+{"".join(f"    self.{f} = float({p}){chr(10)}" for f, p in zip(fields, params))}''',
+        f'''
+def norm(self) -> float:
+    """해당 {noun}의 크기를 구함.
 
-        self.__x: float = float(x) if x is not None else 0.0
-        self.__y: float = float(y) if y is not None else 0.0
-        self.__components_list: list[float] = [self.__x, self.__y]
+    Returns:
+        float: 벡터의 크기.
+    """
+    return hypot({each("{a}")})
 
-    @property
-    def x(self) -> float:
-        """해당 평면벡터의 X축 성분을 스칼라 값으로 불러옴.
+def norm_squared(self) -> float:
+    """해당 {noun}의 크기의 제곱을 구함. 제곱근을 계산하지 않으므로 크기 비교에 적합함.
 
-        Returns:
-            float: X축 성분.
-        """
-        return self.__x
+    Returns:
+        float: 벡터의 크기의 제곱.
+    """
+    return {each("{a} * {a}", " + ")}
 
-    @property
-    def y(self) -> float:
-        """해당 평면벡터의 Y축 성분을 스칼라 값으로 불러옴.
+def dot(self, other: {name}) -> float:
+    """두 {noun}의 내적을 계산함.
 
-        Returns:
-            float: Y축 성분.
-        """
-        return self.__y
+    Args:
+        other ({name}): 내적할 {noun}.
 
-    @property
-    def demention(self) -> int:
-        """해당 벡터의 차원을 반환합니다.
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Returns:
-            int: 차원
-        """
-        return self.__DEMENTION
+    Returns:
+        float: 연산 결과. (스칼라)
+    """
+    if not isinstance(other, {name}):
+        raise TypeError(_TYPE_ERROR)
+    return {each("{a} * {b}", " + ")}
 
-    @x.setter
-    def x(self, value: float | int) -> None:
-        """해당 평면벡터의 X축 성분을 설정함.
+def distance(self, other: {name}) -> float:
+    """두 {noun} 사이의 거리를 구함. 중간 벡터를 생성하지 않음.
 
-        Args:
-            value (float | int): 설정할 X축 성분, float 자료형으로 저장됨.
-        """
-        self.__x = float(value)
+    Args:
+        other ({name}): 거리를 구할 {noun}.
 
-    @y.setter
-    def y(self, value: float | int) -> None:
-        """해당 평면벡터의 Y축 성분을 설정함.
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Args:
-            value (float | int): 설정할 Y축 성분, float 자료형으로 저장됨.
-        """
-        self.__y = float(value)
+    Returns:
+        float: 두 벡터 사이의 거리.
+    """
+    if not isinstance(other, {name}):
+        raise TypeError(_TYPE_ERROR)
+    return hypot({each("{a} - {b}")})
 
-    @demention.setter
-    def demention(self) -> ValueError:
-        """해당 벡터의 차원변경을 방지합니다
+def distance_squared(self, other: {name}) -> float:
+    """두 {noun} 사이의 거리의 제곱을 구함. 제곱근을 계산하지 않으므로 거리 비교에 적합함.
 
-        Raises:
-            ValueError: 벡터의 차원을 변경하려 시도할 때 발생하는 에러.
-        """
-        raise ValueError
+    Args:
+        other ({name}): 거리를 구할 {noun}.
 
-    def norm(self) -> float:
-        """해당 평면벡터의 크기를 구함.
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Returns:
-            float: 벡터의 크기.
-        """
-        return sqrt(self.__x**2 + self.__y**2)
+    Returns:
+        float: 두 벡터 사이의 거리의 제곱.
+    """
+    if not isinstance(other, {name}):
+        raise TypeError(_TYPE_ERROR)
+{"".join(f"    d{i} = self.{f} - other.{f}{chr(10)}" for i, f in enumerate(fields))}    return {" + ".join(f"d{i} * d{i}" for i in range(len(fields)))}
+
+def normalize(self) -> None:
+    """해당 {noun}를 단위 벡터로 변환함."""
+    norm = self.norm()
+{"".join(f"    self.{f} = self.{f} / norm{chr(10)}" for f in fields)}''',
+        f'''
+def __mul__(self, other: {other_type}) -> float:
+    """{noun}의 내적을 계산함.
 
-    def normalize(self) -> None:
-        """해당 평면벡터를 단위 벡터로 변환함.
+    Args:
+        other ({other_type}): 해당 {noun}와 내적할 {noun}.
 
-        Returns:
-            Vector2: 단위벡터로 변환된 평면벡터.
-        """
-        __norm: float = self.norm()
-        self.__x = self.__x / __norm
-        self.__y = self.__y / __norm
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-    def to_3d(self) -> Vector3:
-        """해당 평면벡터를 공간벡터로 변환함. Z축 성분은 0.0으로 설정됨.
+    Returns:
+        float: 연산 결과. (스칼라) 벡터나 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
+    """
+    if isinstance(other, {name}):
+        return {each("{a} * {b}", " + ")}
+    if isinstance(other, _REAL):
+        return {each("{a} * other", " + ")}
+    if isinstance(other, Vector):
+        raise TypeError(_TYPE_ERROR)
+    return NotImplemented
 
-        Returns:
-            Vector3: 공간벡터로 변환된 평면벡터.
-        """
-        return Vector3(self.__x, self.__y, 0.0)
+def __rmul__(self, other: int | float) -> float:
+    """스칼라와 {noun}의 내적을 계산함.
 
-    def get_components(self) -> list[Vector2]:
-        """해당 평면벡터를 각각의 성분으로 나눈 후 리스트로 반환함.
+    Args:
+        other (int | float): 해당 {noun}와 내적할 스칼라.
 
-        Returns:
-            list[Vector2]: 각 축의 성분 벡터를 리스트[X, Y]의 형태로 반환함.
-        """
-        return [Vector2(self.__x, 0.0), Vector2(0.0, self.__y)]
+    Returns:
+        float: 연산 결과. (스칼라) 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
+    """
+    if isinstance(other, _REAL):
+        return {each("other * {a}", " + ")}
+    return NotImplemented
 
-    def rotate(self, degree: float) -> Vector2:
-        """해당 평면벡터를 회전시킴.
+def __neg__(self) -> {name}:
+    """해당 {noun}의 역벡터를 구함.
 
-        Args:
-            degree (float): 회전시킬 각도. [라디안]
+    Returns:
+        {name}: 해당 {noun}의 역벡터.
+    """
+    return {new("-{a}")}
 
-        Returns:
-            Vector2: 회전된 평면벡터.
-        """
-        radian = degree * (pi / 180)
-        cos_theta = cos(radian)
-        sin_theta = sin(radian)
-        x_new = self.__x * cos_theta - self.__y * sin_theta
-        y_new = self.__x * sin_theta + self.__y * cos_theta
-        return Vector2(x_new, y_new)
+def __eq__(self, other: object) -> bool:
+    """두 {noun}가 같은지 비교함.
 
-    def __add__(self, other: Vector2 | int | float) -> Vector2:
-        """평면벡터의 합을 계산함.
+    Args:
+        other (object): 비교할 {noun}. {noun}가 아닐 시 NotImplemented를 반환함.
 
-        Args:
-            other (Vector2 | int | float): 해당 평면벡터에 더해질 평면벡터.
+    Returns:
+        bool: 두 벡터가 같을 시 True를 반환함. 반대의 경우 False를 반환함.
+    """
+    if not isinstance(other, {name}):
+        return NotImplemented
+    return {each("{a} == {b}", " and ")}
+
+def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+    # 성분만 생성자 인자로 저장하여, 이름이 바뀐 슬롯 속성들의 dict를 피클링하지 않음
+    return (self.__class__, ({each("{a}")},))
+
+def __iter__(self) -> Iterator[float]:
+    return iter(({each("{a}")},))
+
+def __getitem__(self, index: int) -> float:
+    if index >= {len(fields)}:
+        raise IndexError
+    return ({each("{a}")},)[index]
+''',
+    ]
+    for method, operator, summary, description in _ELEMENTWISE_OPERATORS:
+        sections.append(f'''
+def {method}(self, other: {other_type}) -> {name}:
+    """{summary.format(noun=noun)}
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 빌생하는 에러.
+    Args:
+        other ({other_type}): {description.format(noun=noun)}
 
-        Returns:
-            Vector2: 연산 결과.
-        """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self + Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector2(self.__x + other.x, self.__y + other.y)
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-    def __sub__(self, other: Vector2 | int | float) -> Vector2:
-        """평면벡터의 차를 계산함.
+    Returns:
+        {name}: 연산 결과. 벡터나 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
+    """
+    if isinstance(other, {name}):
+        return {new("{a} " + operator + " {b}")}
+    if isinstance(other, _REAL):
+        return {new("{a} " + operator + " other")}
+    if isinstance(other, Vector):
+        raise TypeError(_TYPE_ERROR)
+    return NotImplemented
+''')
+    for method, operator, summary, description in _REFLECTED_OPERATORS:
+        sections.append(f'''
+def {method}(self, other: int | float) -> {name}:
+    """{summary.format(noun=noun)}
 
-        Args:
-            other (Vector2 | int | float): 해당 평면벡터에서 빠질 평면벡터.
+    Args:
+        other (int | float): {description.format(noun=noun)}
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    Returns:
+        {name}: 연산 결과. 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
+    """
+    if isinstance(other, _REAL):
+        return {new("other " + operator + " {a}")}
+    return NotImplemented
+''')
+    for method, operator, summary, description in _INPLACE_OPERATORS:
+        sections.append(f'''
+def {method}(self, other: {other_type}) -> {name}:
+    """{summary.format(noun=noun)} 새로운 객체를 생성하지 않음.
 
-        Returns:
-            Vector2: 연산 결과.
-        """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self - Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector2(self.__x - other.x, self.__y - other.y)
+    Args:
+        other ({other_type}): {description.format(noun=noun)} 스칼라일 시 모든 성분에 적용됨.
 
-    def __mul__(self, other: Vector2 | int | float) -> float:
-        """평면벡터의 내적을 계산함.
+    Raises:
+        TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Args:
-            other (Vector2 | int | float): 해당 평면벡터와 내적할 평면벡터.
+    Returns:
+        {name}: 변경된 해당 {noun}. 벡터나 스칼라가 아닌 자료형일 시 NotImplemented를 반환하여 일반 연산으로 넘김.
+    """
+    if isinstance(other, {name}):
+{each("        {a} " + operator + " {b}", chr(10))}
+        return self
+    if isinstance(other, _REAL):
+{each("        {a} " + operator + " other", chr(10))}
+        return self
+    if isinstance(other, Vector):
+        raise TypeError(_TYPE_ERROR)
+    return NotImplemented
+''')
+    return "from __future__ import annotations\n" + "".join(sections)
+
+
+def _axis_property(field: str, axis: str, noun: str) -> property:
+    """성분 하나를 읽고 쓰는 프로퍼티를 생성함."""
+    namespace: dict[str, Any] = {}
+    exec(
+        f'''
+def getter(self) -> float:
+    """해당 {noun}의 {axis.upper()}축 성분을 스칼라 값으로 불러옴.
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    Returns:
+        float: {axis.upper()}축 성분.
+    """
+    return self.{field}
 
-        Returns:
-            float: 연산 결과. (스칼라)
-        """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self * Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return self.__x * other.x + self.__y * other.y
+def setter(self, value: float | int) -> None:
+    """해당 {noun}의 {axis.upper()}축 성분을 설정함.
+
+    Args:
+        value (float | int): 설정할 {axis.upper()}축 성분, float 자료형으로 저장됨.
+    """
+    self.{field} = float(value)
+''',
+        namespace,
+    )
+    return property(namespace["getter"], namespace["setter"])
 
-    def __truediv__(self, other: Vector2 | int | float) -> Vector2:
-        """평면벡터의 나눗셈을 계산함.
 
-        Args:
-            other (Vector2 | int | float): 평면벡터의 나눗셈에서의 제수.
+def _compile_methods(
+    cls: type[Vector], factory: str | None = None, namespace: dict[str, Any] | None = None
+) -> dict[str, Callable[..., Any]]:
+    """_specialize로 특수화된 벡터 클래스의 메서드들을 생성하여, 클래스에 추가하지 않고 이름별로 반환함.
+
+    Args:
+        cls (type[Vector]): _specialize로 특수화된 벡터 클래스.
+        factory (str | None, optional): 연산 결과를 생성할 함수의 이름. None일 시 클래스를 호출함. Defaults to None.
+        namespace (dict[str, Any] | None, optional): 생성된 메서드의 전역 이름공간에 추가할 이름들. Defaults to None.
+
+    Returns:
+        dict[str, Callable[..., Any]]: 메서드 이름별 함수.
+    """
+    fields = cls._FIELDS
+    if cls._AXES:
+        params, labels = tuple(cls._AXES), tuple(f"{axis.upper()}축" for axis in cls._AXES)
+    else:
+        params = tuple(f"c{i}" for i in range(len(fields)))
+        labels = tuple(f"{i}번째" for i in range(len(fields)))
+    globals_: dict[str, Any] = {
+        "__name__": __name__,
+        cls.__name__: cls,
+        "_REAL": _REAL,
+        "_TYPE_ERROR": _TYPE_ERROR,
+        "Vector": Vector,
+        "hypot": hypot,
+        "Iterator": Iterator,
+        **(namespace or {}),
+    }
+    source = _generate_methods(cls.__name__, cls._NOUN, fields, params, labels, factory)
+    exec(compile(source, f"<{__name__}.{cls.__name__}>", "exec"), globals_)
+    methods = {}
+    for member in globals_.values():
+        if callable(member) and getattr(member, "__module__", None) == __name__ and member is not cls:
+            member.__qualname__ = f"{cls.__qualname__}.{member.__name__}"
+            methods[member.__name__] = member
+    return methods
+
+
+def _specialize(cls: type[Vector], noun: str, axes: str = "") -> type[Vector]:
+    """벡터 클래스에 차원에 맞게 생성된 메서드들을 추가함.
+
+    Args:
+        cls (type[Vector]): 성분마다 하나의 슬롯을 선언한 벡터 클래스.
+        noun (str): 독스트링에 쓰일 벡터의 이름. (예: "평면벡터")
+        axes (str, optional): 각 성분의 프로퍼티 이름. (예: "xy") 빈 문자열일 시 프로퍼티를 만들지 않음. Defaults to "".
+
+    Returns:
+        type[Vector]: 주어진 클래스.
+    """
+    private = "_" + cls.__name__.lstrip("_")
+    fields = tuple(private + slot if slot.startswith("__") else slot for slot in cls.__slots__)
+    cls._FIELDS = fields
+    cls._DEMENTION = len(fields)
+    cls._VECTOR_TYPE = cls
+    cls._NOUN = noun
+    cls._AXES = axes
+    for name, method in _compile_methods(cls).items():
+        setattr(cls, name, method)
+    # __eq__를 클래스 정의 후에 추가하였으므로, 가변 객체가 해시되지 않도록 직접 지움
+    cls.__hash__ = None
+    for field, axis in zip(fields, axes):
+        setattr(cls, axis, _axis_property(field, axis, noun))
+    return cls
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+
+class Vector:
+    """모든 벡터 클래스의 기본 클래스.
+
+    각 차원의 클래스는 성분마다 하나의 슬롯을 선언하고, _specialize로 성분별로 풀어 쓴 연산들을 생성함.
+    이곳에는 차원과 무관하게 같은 동작을 하는 메서드들을 정의함.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: tuple[str, ...] = ()
+    _DEMENTION: int = 0
+    _NOUN: str = "벡터"
+    _AXES: str = ""
+    _VECTOR_TYPE: type[Vector]
+    _FROZEN_TYPE: type[Vector] | None = None
+
+    @property
+    def demention(self) -> int:
+        """해당 벡터의 차원을 반환합니다.
 
         Returns:
-            Vector2: 연산 결과.
+            int: 차원
+        """
+        return self._DEMENTION
+
+    @demention.setter
+    def demention(self, value: int) -> None:
+        """해당 벡터의 차원변경을 방지합니다
+
+        Raises:
+            ValueError: 벡터의 차원을 변경하려 시도할 때 발생하는 에러.
         """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self / Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector2(self.__x / other.x, self.__y / other.y)
+        raise ValueError("The demention of a vector cannot be changed.")
 
-    def __floordiv__(self, other: Vector2 | int | float) -> Vector2:
-        """평면벡터의 나눗셈. 소수점이 아닌, 몫을 계산.
+    def angle_between(self, other: Vector) -> float:
+        """두 벡터 사이의 각도를 구함.
 
         Args:
-            other (Vector2 | int | float): 평면벡터의 나눗셈에서의 제수.
+            other (Vector): 각도를 구할 같은 차원의 벡터.
 
         Raises:
             TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+            ValueError: 크기가 0인 벡터와 각도를 구하려 할 때 발생하는 에러.
 
         Returns:
-            Vector2: 연산 결과
+            float: 두 벡터 사이의 각도. [라디안] (0 ~ pi)
         """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self // Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector2(self.__x // other.x, self.__y // other.y)
+        if not isinstance(other, self._VECTOR_TYPE):
+            raise TypeError(_TYPE_ERROR)
+        norms = sqrt(self.norm_squared() * other.norm_squared())
+        if norms == 0.0:
+            raise ValueError("The angle with a zero vector is undefined.")
+        # 부동소수점 오차로 인해 [-1, 1] 범위를 벗어나는 것을 방지
+        return acos(max(-1.0, min(1.0, self.dot(other) / norms)))
 
-    def __mod__(self, other: Vector2 | int | float) -> Vector2:
-        """평면벡터의 나눗셈. 소수점이 아닌, 나머지를 게산.
+    def get_components(self) -> list[Vector]:
+        """해당 벡터를 각각의 성분으로 나눈 후 리스트로 반환함.
 
-        Args:
-            other (Vector2 | int | float): 평면벡터의 나눗셈에서의 제수.
+        Returns:
+            list[Vector]: 각 축의 성분 벡터를 리스트[X, Y, ...]의 형태로 반환함.
+        """
+        vector_type = self._VECTOR_TYPE
+        components = tuple(self)
+        return [
+            vector_type(*(value if i == axis else 0.0 for i, value in enumerate(components)))
+            for axis in range(self._DEMENTION)
+        ]
+
+    def freeze(self) -> Vector:
+        """해당 벡터와 같은 성분을 가진 불변 벡터를 생성함. 불변 벡터는 dict의 키나 set의 원소로 사용할 수 있음.
 
         Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+            TypeError: 불변 벡터 클래스가 없는 벡터일 때 발생하는 에러.
 
         Returns:
-            Vector2: 연산 결과.
+            Vector: 불변 벡터.
         """
-        if not isinstance(other, Vector2):
-            if _is_real_num(other):
-                return self % Vector2(other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector2(self.__x % other.x, self.__y % other.y)
+        if self._FROZEN_TYPE is None:
+            raise TypeError(f"{type(self).__name__} has no immutable counterpart.")
+        return self._FROZEN_TYPE(*self)
 
     def __pow__(self, other: int | float) -> float:
-        """평면벡터의 X제곱을 계산.
+        """벡터의 크기의 X제곱을 계산.
 
         Args:
             other (int | float): 지수.
 
         Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+            TypeError: 지수가 실수가 아닐 때 발생하는 에러.
 
         Returns:
-            float: 연신 결과. (스칼라)
+            float: 연산 결과. (스칼라)
         """
-        if _is_real_num(other):
+        if not isinstance(other, _REAL):
             raise TypeError("Exponents must be float or int")
         return self.norm() ** other
 
-    def __neg__(self) -> Vector2:
-        """해당 평면벡터의 역벡터를 구함.
-
-        Returns:
-            Vector2: 해당 평면벡터의 역벡터.
-        """
-        return Vector2(-self.__x, -self.__y)
-
-    def __eq__(self, other: Vector2) -> bool:
-        """두 평면벡터가 같은지 비교함.
+    def __ne__(self, other: object) -> bool:
+        """두 벡터가 다른지를 비교함.
 
         Args:
-            other (Vector2): 비교할 평면벡터.
-
-        Raises:
-            TypeError: 평면벡터가 아닌 자료형과 비교하는 경우 발생하는 에러.
+            other (object): 비교할 벡터.
 
         Returns:
-            bool: 두 벡터가 같을 시 True를 반환함. 반대의 경우 False를 반환함.
+            bool: 두 벡터가 다를 시 True를 반환함. 반대의 경우 False를 반환함.
         """
-        if not isinstance(other, Vector2):
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return self.__x == other.x and self.__y == other.y
+        return not self == other
 
-    def __ne__(self, other: Vector2) -> bool:
-        """두 평면벡터가 다른지를 비교함.
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        """해당 벡터의 성분을 NumPy 배열로 변환함. (np.asarray 지원)
 
         Args:
-            other (Vector2): 비교할 평면벡터.
+            dtype (Any, optional): 배열의 자료형. Defaults to None. (float64)
+            copy (bool | None, optional): NumPy 2.0의 복사 여부 인자. 성분은 항상 복사됨. Defaults to None.
 
         Returns:
-            bool: 두 벡터가 다를 시 True를 반환함. 반대의 경우 False를 반환함.
+            Any: 성분을 담은 1차원 NumPy 배열.
         """
-        return not self == other
+        return _import_numpy().array(tuple(self), dtype=dtype)
 
-    def __iter__(self) -> Iterator[float]:
-        yield self.__x
-        yield self.__y
 
-    def __getitem__(self, index: int) -> float:
-        if index >= self.__DEMENTION:
-            raise IndexError
-        return self.__components_list[index]
+class VectorN(Vector):
+    """임의 차원의 벡터를 표현하기 위한 클래스. 특징 벡터처럼 2~4차원이 아닌 벡터에 사용함.
 
+    VectorN(*components)는 성분의 수에 맞는 차원의 클래스(VectorN.of(차원))의 객체를 생성함.
+    각 차원의 클래스는 처음 사용될 때 Vector2 등과 같은 템플릿으로부터 생성되며, 성분은 인덱스로 읽고 씀.
 
-class Vector3(Vector):
-    """3차원 벡터를 표현하기 위한 클래스"""
+        feature = VectorN(0.1, 0.2, 0.3, 0.4, 0.5, 0.6)
+        feature[5] = 1.0
+        VectorN.of(16)()   # 16차원 영벡터
+    """
+
+    __slots__ = ()
 
-    __DEMENTION = 3
+    def __new__(cls, *components: float | int | None, **kwargs: float | int | None) -> Any:
+        if cls is VectorN:
+            cls = VectorN.of(len(components))
+        return object.__new__(cls)
 
-    def __init__(
-        self,
-        x: float | int | None = 0.0,
-        y: float | int | None = 0.0,
-        z: float | int | None = 0.0,
-    ) -> None:
-        """3차원 공간벡터를 정의함.
+    @staticmethod
+    def of(demention: int) -> type[VectorN]:
+        """주어진 차원의 벡터 클래스를 반환함. 처음 요청된 차원이면 클래스를 생성함.
 
         Args:
-            x (float | int | None, optional): 공간벡터의 X축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            y (float | int | None, optional): 공간벡터의 Y축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            z (float | int | None, optional): 공간벡터의 Z축 성분. float 자료형으로 저장됨. Defaults to 0.0.
+            demention (int): 벡터의 차원.
 
         Raises:
-            TypeError: 정수, 실수, 혹은 None이 아닌 다른 타입의 값이 인자로 주어졌을 때 발생하는 에러.
-        """
-        if not _is_real_num(x) or not _is_real_num(y) or not _is_real_num(z):
-            raise TypeError("The component of Vector must be a float, int or None")
-
-        self.__x: float = float(x) if x is not None else 0.0
-        self.__y: float = float(y) if y is not None else 0.0
-        self.__z: float = float(z) if z is not None else 0.0
-        self.__components_list: list[float] = [self.__x, self.__y, self.__z]
-
-    @property
-    def x(self) -> float:
-        """해당 공간벡터의 X축 성분을 스칼라 값으로 불러옴
+            ValueError: 차원이 양의 정수가 아닐 때 발생하는 에러.
 
         Returns:
-            float: X축 성분
+            type[VectorN]: 해당 차원의 벡터 클래스.
         """
-        return self.__x
+        try:
+            return _VECTOR_N_TYPES[demention]
+        except KeyError:
+            pass
+        if not isinstance(demention, int) or demention < 1:
+            raise ValueError("The demention of a vector must be a positive integer.")
+        name = f"VectorN{demention}"
+        vector_type = type(
+            name,
+            (VectorN,),
+            {
+                "__slots__": tuple(f"_c{i}" for i in range(demention)),
+                "__module__": __name__,
+                "__qualname__": name,
+                "__doc__": f"{demention}차원 벡터를 표현하기 위한 클래스",
+            },
+        )
+        _VECTOR_N_TYPES[demention] = _specialize(vector_type, f"{demention}차원 벡터")
+        return vector_type
 
-    @property
-    def y(self) -> float:
-        """해당 공간벡터의 Y축 성분을 스칼라 값으로 불러옴
+    def __setitem__(self, index: int, value: float | int) -> None:
+        setattr(self, self._FIELDS[index], float(value))
 
-        Returns:
-            float: Y축 성분
-        """
-        return self.__y
 
-    @property
-    def z(self) -> float:
-        """해당 공간벡터의 Z축 성분을 스칼라 값으로 불러옴
+_VECTOR_N_TYPES: dict[int, type[VectorN]] = {}
 
-        Returns:
-            float: Z축 성분
-        """
-        return self.__z
 
-    @property
-    def demention(self) -> int:
-        """해당 벡터의 차원을 반환합니다.
+def __getattr__(name: str) -> Any:
+    # 피클링된 VectorN 클래스(VectorN6 등)를 다른 프로세스에서도 불러올 수 있도록, 처음 접근할 때 생성함
+    if name.startswith("VectorN") and name[7:].isdigit():
+        return VectorN.of(int(name[7:]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        Returns:
-            int: 차원
-        """
-        return self.__DEMENTION
 
-    @x.setter
-    def x(self, value: float | int) -> None:
-        """해당 공간벡터의 X축 성분을 설정함
+class Vector2(Vector):
+    """2차원 벡터를 표현하기 위한 클래스"""
 
-        Args:
-            value (float | int): 설정할 X축 성분, float 자료형으로 저장됨.
-        """
-        self.__x = float(value)
+    __slots__ = ("__x", "__y")
 
-    @y.setter
-    def y(self, value: float | int) -> None:
-        """해당 공간벡터의 Y축 성분을 설정함
+    def to_3d(self) -> Vector3:
+        """해당 평면벡터를 공간벡터로 변환함. Z축 성분은 0.0으로 설정됨.
 
-        Args:
-            value (float | int): 설정할 Y축 성분, float 자료형으로 저장됨.
+        Returns:
+            Vector3: 공간벡터로 변환된 평면벡터.
         """
-        self.__y = float(value)
+        return Vector3(self.__x, self.__y, 0.0)
 
-    @z.setter
-    def z(self, value: float | int) -> None:
-        """해당 공간벡터의 Z축 성분을 설정함
+    def rotate(self, degree: float) -> Vector2:
+        """해당 평면벡터를 회전시킴.
 
         Args:
-            value (float | int): 설정할 Z축 성분, float 자료형으로 저장됨.
-        """
-        self.__z = float(value)
-
-    @demention.setter
-    def demention(self) -> ValueError:
-        """해당 벡터의 차원변경을 방지합니다
+            degree (float): 회전시킬 각도. [라디안]
 
-        Raises:
-            ValueError: 벡터의 차원을 변경하려 시도할 때 발생하는 에러.
+        Returns:
+            Vector2: 회전된 평면벡터.
         """
-        raise ValueError
+        radian = degree * (pi / 180)
+        cos_theta = cos(radian)
+        sin_theta = sin(radian)
+        x_new = self.__x * cos_theta - self.__y * sin_theta
+        y_new = self.__x * sin_theta + self.__y * cos_theta
+        return Vector2(x_new, y_new)
 
-    def norm(self) -> float:
-        """해당 공간벡터의 크기를 구함.
 
-        Returns:
-            float: 벡터의 크기.
-        """
-        return sqrt(self.__x**2 + self.__y**2 + self.__z**2)
+_specialize(Vector2, "평면벡터", "xy")
 
-    def normalize(self) -> None:
-        """해당 공간벡터를 단위 벡터로 변환함.
 
-        Returns:
-            Vector2: 단위벡터로 변환된 공간벡터.
-        """
-        __norm: float = self.norm()
-        self.__x = self.__x / __norm
-        self.__y = self.__y / __norm
-        self.__z = self.__z / __norm
+class Vector3(Vector):
+    """3차원 벡터를 표현하기 위한 클래스"""
+
+    __slots__ = ("__x", "__y", "__z")
 
     def to_2d(self) -> Vector2:
         """해당 공간벡터를 평면벡터로 변환함. Z축 성분은 소실됨.
@@ -446,18 +639,6 @@ class Vector3(Vector):
         """
         return Vector2(self.__x, self.__y)
 
-    def get_components(self) -> list[Vector3]:
-        """해당 공간벡터를 각각의 성분으로 나눈 후 리스트로 반환함.
-
-        Returns:
-            list[Vector3]: 각 축의 성분 벡터를 리스트[X, Y, Z]의 형태로 반환함.
-        """
-        return [
-            Vector3(self.__x, 0.0, 0.0),
-            Vector3(0.0, self.__y, 0.0),
-            Vector3(0.0, 0.0, self.__z),
-        ]
-
     def to_euler_angles(self) -> Vector3:
         """
         3차원 벡터를 오일러각(roll, pitch, yaw)으로 변환.
@@ -517,60 +698,6 @@ class Vector3(Vector):
 
         return Vector3(x, y, z)
 
-    def __add__(self, other: Vector3 | int | float) -> Vector3:
-        """공간벡터의 합을 계산함.
-
-        Args:
-            other (Vector3 | int | float): 해당 공간벡터에 더해질 공간벡터.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 빌생하는 에러.
-
-        Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self + Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(self.__x + other.x, self.__y + other.y, self.__z + other.z)
-
-    def __sub__(self, other: Vector3 | int | float) -> Vector3:
-        """공간벡터의 차를 계산함.
-
-        Args:
-            other (Vector3 | int | float): 해당 공간벡터에서 빠질 공간벡터.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self - Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(self.__x - other.x, self.__y - other.y, self.__z - other.z)
-
-    def __mul__(self, other: Vector3 | int | float) -> float:
-        """공간벡터의 내적을 계산함.
-
-        Args:
-            other (Vector3 | int | float): 해당 공간벡터와 내적할 공간벡터.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            float: 연산 결과. (스칼라)
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self * Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return self.__x * other.x + self.__y * other.y + self.__z * other.z
-
     def __matmul__(self, other: Vector3 | int | float) -> Vector3:
         """공간벡터의 외적을 계산함
 
@@ -581,280 +708,49 @@ class Vector3(Vector):
             TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
         Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self @ Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(
-            (self.__y * other.z) - (self.__z * other.y),
-            (self.__z * other.x) - (self.__x * other.z),
-            (self.__x * other.y) - (self.__y * other.x),
-        )
-
-    def __truediv__(self, other: Vector3 | int | float) -> Vector3:
-        """공간벡터의 나눗셈을 계산함.
-
-        Args:
-            other (Vector3 | int | float): 공간벡터의 나눗셈에서의 제수.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self / Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(self.__x / other.x, self.__y / other.y, self.__z / other.z)
-
-    def __floordiv__(self, other: Vector3 | int | float) -> Vector3:
-        """공간벡터의 나눗셈. 소수점이 아닌, 몫을 계산.
-
-        Args:
-            other (Vector3 | int | float): 공간벡터의 나눗셈에서의 제수.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            Vector3: 연산 결과
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self // Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(self.__x // other.x, self.__y // other.y, self.__z // other.z)
-
-    def __mod__(self, other: Vector3 | int | float) -> Vector3:
-        """공간벡터의 나눗셈. 소수점이 아닌, 나머지를 게산.
-
-        Args:
-            other (Vector3 | int | float): 공간벡터의 나눗셈에서의 제수.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector3):
-            if _is_real_num(other):
-                return self % Vector3(other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector3(self.__x % other.x, self.__y % other.y, self.__z % other.z)
-
-    def __pow__(self, other: int | float) -> float:
-        """공간벡터의 X제곱을 계산.
-
-        Args:
-            other (int | float): 지수.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
-
-        Returns:
-            float: 연신 결과. (스칼라)
+            Vector3: 연산 결과. 벡터나 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
         """
+        if isinstance(other, Vector3):
+            return Vector3(
+                (self.__y * other.__z) - (self.__z * other.__y),
+                (self.__z * other.__x) - (self.__x * other.__z),
+                (self.__x * other.__y) - (self.__y * other.__x),
+            )
         if _is_real_num(other):
-            raise TypeError("Exponents must be float or int")
-        return self.norm() ** other
+            return Vector3(
+                (self.__y * other) - (self.__z * other),
+                (self.__z * other) - (self.__x * other),
+                (self.__x * other) - (self.__y * other),
+            )
+        if isinstance(other, Vector):
+            raise TypeError(_TYPE_ERROR)
+        return NotImplemented
 
-    def __neg__(self) -> Vector3:
-        """해당 공간벡터의 역벡터를 구함.
-
-        Returns:
-            Vector3: 해당 공간벡터의 역벡터.
-        """
-        return Vector3(-self.__x, -self.__y, -self.__z)
-
-    def __eq__(self, other: Vector3) -> bool:
-        """두 공간벡터가 같은지 비교함
+    def __rmatmul__(self, other: int | float) -> Vector3:
+        """모든 성분이 스칼라인 공간벡터와 해당 공간벡터의 외적을 계산함.
 
         Args:
-            other (Vector3): 비교할 공간벡터.
-
-        Raises:
-            TypeError: 공간벡터가 아닌 자료형과 비교하는 경우 발생하는 에러.
+            other (int | float): 외적의 좌항으로 쓰일 스칼라.
 
         Returns:
-            bool: 두 벡터가 같을 시 True를 반환함. 반대의 경우 False를 반환함.
+            Vector3: 연산 결과. 스칼라가 아닌 자료형일 시 NotImplemented를 반환함.
         """
-        if not isinstance(other, Vector3):
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return self.__x == other.x and self.__y == other.y and self.__z == other.z
-
-    def __ne__(self, other: Vector3) -> bool:
-        """두 공간벡터가 다른지를 비교함.
-
-        Args:
-            other (Vector3): 비교할 공간벡터.
-
-        Returns:
-            bool: 두 벡터가 다를 시 True를 반환함. 반대의 경우 False를 반환함.
-        """
-        return not self == other
+        if _is_real_num(other):
+            return Vector3(
+                (other * self.__z) - (other * self.__y),
+                (other * self.__x) - (other * self.__z),
+                (other * self.__y) - (other * self.__x),
+            )
+        return NotImplemented
 
-    def __iter__(self) -> Iterator[float]:
-        yield self.__x
-        yield self.__y
-        yield self.__z
 
-    def __getitem__(self, index: int) -> float:
-        if index >= self.__DEMENTION:
-            raise IndexError
-        return self.__components_list[index]
+_specialize(Vector3, "공간벡터", "xyz")
 
 
 class Vector4(Vector):
     """4차원 벡터를 표현하기 위한 클래스"""
 
-    __DEMENTION = 4
-
-    def __init__(
-        self,
-        x: float | int | None = 0.0,
-        y: float | int | None = 0.0,
-        z: float | int | None = 0.0,
-        w: float | int | None = 0.0,
-    ) -> None:
-        """4차원 벡터를 정의함.
-
-        Args:
-            x (float | int | None, optional): 4차원 벡터의 X축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            y (float | int | None, optional): 4차원 벡터의 Y축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            z (float | int | None, optional): 4차원 벡터의 Z축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-            w (float | int | None, optional): 4차원 벡터의 W축 성분. float 자료형으로 저장됨. Defaults to 0.0.
-
-        Raises:
-            TypeError: 정수, 실수, 혹은 None이 아닌 다른 타입의 값이 인자로 주어졌을 때 발생하는 에러.
-        """
-        if (
-            not _is_real_num(x)
-            or not _is_real_num(y)
-            or not _is_real_num(z)
-            or not _is_real_num(w)
-        ):
-            raise TypeError("The component of Vector must be a float, int or None")
-
-        self.__x: float = float(x) if x is not None else 0.0
-        self.__y: float = float(y) if y is not None else 0.0
-        self.__z: float = float(z) if z is not None else 0.0
-        self.__w: float = float(w) if w is not None else 0.0
-        self.__components_list: list[float] = [self.__x, self.__y, self.__x, self.__w]
-
-    @property
-    def x(self) -> float:
-        """해당 4차원 벡터의 X축 성분을 스칼라 값으로 불러옴
-
-        Returns:
-            float: X축 성분
-        """
-        return self.__x
-
-    @property
-    def y(self) -> float:
-        """해당 4차원 벡터의 Y축 성분을 스칼라 값으로 불러옴
-
-        Returns:
-            float: Y축 성분
-        """
-        return self.__y
-
-    @property
-    def z(self) -> float:
-        """해당 4차원 벡터의 Z축 성분을 스칼라 값으로 불러옴
-
-        Returns:
-            float: Z축 성분
-        """
-        return self.__z
-
-    @property
-    def w(self) -> float:
-        """해당 4차원 벡터의 W축 성분을 스칼라 값으로 불러옴
-
-        Returns:
-            float: W축 성분
-        """
-        return self.__w
-
-    @property
-    def demention(self) -> int:
-        """해당 벡터의 차원을 반환합니다.
-
-        Returns:
-            int: 차원
-        """
-        return self.__DEMENTION
-
-    @x.setter
-    def x(self, value: float | int) -> None:
-        """해당 4차원 벡터의 X축 성분을 설정함
-
-        Args:
-            value (float | int): 설정할 X축 성분, float 자료형으로 저장됨.
-        """
-        self.__x = float(value)
-
-    @y.setter
-    def y(self, value: float | int) -> None:
-        """해당 4차원 벡터의 Y축 성분을 설정함
-
-        Args:
-            value (float | int): 설정할 Y축 성분, float 자료형으로 저장됨.
-        """
-        self.__y = float(value)
-
-    @z.setter
-    def z(self, value: float | int) -> None:
-        """해당 4차원 벡터의 Z축 성분을 설정함
-
-        Args:
-            value (float | int): 설정할 Z축 성분, float 자료형으로 저장됨.
-        """
-        self.__z = float(value)
-
-    @w.setter
-    def w(self, value: float | int) -> None:
-        """해당 4차원 벡터의 W축 성분을 설정함
-
-        Args:
-            value (float | int): 설정할 W축 성분, float 자료형으로 저장됨.
-        """
-        self.__w = float(value)
-
-    @demention.setter
-    def demention(self) -> ValueError:
-        """해당 벡터의 차원변경을 방지합니다
-
-        Raises:
-            ValueError: 벡터의 차원을 변경하려 시도할 때 발생하는 에러.
-        """
-        raise ValueError
-
-    def norm(self) -> float:
-        """해당 4차원 벡터의 크기를 구함.
-
-        Returns:
-            float: 벡터의 크기.
-        """
-        return sqrt(self.__x**2 + self.__y**2 + self.__z**2 + self.__w**2)
-
-    def normalize(self) -> None:
-        """해당 4차원 벡터를 단위 벡터로 변환함.
-
-        Returns:
-            None: 4차원 벡터가 단위벡터로 변환됨.
-        """
-        __norm: float = self.norm()
-        self.__x = self.__x / __norm
-        self.__y = self.__y / __norm
-        self.__z = self.__z / __norm
-        self.__w = self.__w / __norm
+    __slots__ = ("__x", "__y", "__z", "__w")
 
     def to_2d(self) -> Vector2:
         """해당 4차원 벡터를 평면벡터로 변환함. Z축과 W축 성분은 소실됨.
@@ -872,244 +768,128 @@ class Vector4(Vector):
         """
         return Vector3(self.__x, self.__y, self.__z)
 
-    def get_components(self) -> list[Vector4]:
-        """해당 4차원 벡터를 각각의 성분으로 나눈 후 리스트로 반환함.
-
-        Returns:
-            list[Vector4]: 각 축의 성분 벡터를 리스트[X, Y, Z, W]의 형태로 반환함.
-        """
-        return [
-            Vector4(self.__x, 0.0, 0.0, 0.0),
-            Vector4(0.0, self.__y, 0.0, 0.0),
-            Vector4(0.0, 0.0, self.__z, 0.0),
-            Vector4(0.0, 0.0, 0.0, self.__w),
-        ]
-
-    def __add__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 합을 계산함.
-
-        Args:
-            other (Vector3 | int | float): 해당 4차원 벡터에 더해질 4차원 벡터.
-
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 빌생하는 에러.
-
-        Returns:
-            Vector4: 연산 결과.
-        """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self + Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector4(
-            self.__x + other.x,
-            self.__y + other.y,
-            self.__z + other.z,
-            self.__w + other.w,
-        )
-
-    def __sub__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 차를 계산함.
+    def __matmul__(self, other: Vector4 | int | float) -> Vector4:
+        """4차원 벡터의 외적을 계산함
 
         Args:
-            other (Vector4 | int | float): 해당 4차원 벡터에서 빠질 4차원 벡터.
+            other (Vector3 | int | float): 해당 4차원 벡터와 외적할 4차원 벡터
 
         Raises:
             TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
         Returns:
-            Vector4: 연산 결과.
+            Vector3: 연산 결과.
         """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self - Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector4(
-            self.__x - other.x,
-            self.__y - other.y,
-            self.__z - other.z,
-            self.__w - other.w,
-        )
+        raise NotImplementedError
 
-    def __mul__(self, other: Vector4 | int | float) -> float:
-        """4차원 벡터의 내적을 계산함.
 
-        Args:
-            other (Vector4 | int | float): 해당 4차원 벡터와 내적할 4차원 벡터.
+_specialize(Vector4, "4차원 벡터", "xyzw")
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Returns:
-            float: 연산 결과. (스칼라)
-        """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self * Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return (
-            self.__x * other.x
-            + self.__y * other.y
-            + self.__z * other.z
-            + self.__w * other.w
-        )
+class _FrozenVector:
+    """불변 벡터 클래스들의 공통 동작을 정의하는 클래스.
 
-    def __matmul__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 외적을 계산함
+    성분은 생성 시에만 설정할 수 있으며, 해시값은 생성 시 한 번만 계산됨.
+    복합 대입 연산(+=, *= 등)은 가변 벡터와 같은 연산을 수행한 새로운 불변 벡터를 반환함.
+    영벡터와 각 축의 단위벡터는 미리 만들어둔 객체를 재사용함.
+    """
 
-        Args:
-            other (Vector3 | int | float): 해당 4차원 벡터와 외적할 4차원 벡터
+    __slots__ = ()
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    def __new__(cls, *components: float | int | None, **kwargs: float | int | None) -> Any:
+        if not kwargs:
+            try:
+                interned = _FROZEN_INTERNED.get((cls, components))
+            except TypeError:
+                interned = None
+            if interned is not None:
+                return interned
+        vector = object.__new__(cls)
+        super(_FrozenVector, vector).__init__(*components, **kwargs)
+        object.__setattr__(vector, "_hash", hash(tuple(vector)))
+        return vector
 
-        Returns:
-            Vector3: 연산 결과.
-        """
-        raise NotImplementedError
+    def __init__(self, *components: float | int | None, **kwargs: float | int | None) -> None:
+        # 성분은 __new__에서 이미 설정되었음
+        pass
 
-        # if not isinstance(other, Vector3):
-        #     if _is_real_num(other):
-        #         return self @ Vector3(other, other, other)
-        #     raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        # return Vector3(
-        #     (self.__y * other.z) - (self.__z * other.y),
-        #     (self.__z * other.x) - (self.__x * other.z),
-        #     (self.__x * other.y) - (self.__y * other.x)
-        # )
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "_hash"):
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        object.__setattr__(self, name, value)
 
-    def __truediv__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 나눗셈을 계산함.
+    def __hash__(self) -> int:
+        return self._hash
 
-        Args:
-            other (Vector3 | int | float): 4차원 벡터의 나눗셈에서의 제수.
+    def __reduce__(self) -> tuple[type, tuple[float, ...]]:
+        return (type(self), tuple(self))
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    def freeze(self) -> Any:
+        """이미 불변 벡터이므로 자기 자신을 반환함."""
+        return self
 
-        Returns:
-            Vector3: 연산 결과.
+    def _inplace(self, operator: Callable[[Any, Any], Any], other: Any) -> Any:
+        """복사한 가변 벡터에 복합 대입 연산을 적용한 후 다시 불변 벡터로 만듦. (tuple과 같이 성분은 바뀌지 않음)
+
+        가변 벡터와 같은 연산(*=는 내적이 아닌 성분별 곱)을 수행하며, 결과가 벡터가 아니면 그대로 반환함.
         """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self / Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector4(
-            self.__x / other.x,
-            self.__y / other.y,
-            self.__z / other.z,
-            self.__w / other.w,
-        )
+        result = operator(self._VECTOR_TYPE(*self), other)
+        return result.freeze() if isinstance(result, Vector) else result
 
-    def __floordiv__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 나눗셈. 소수점이 아닌, 몫을 계산.
+    def __iadd__(self, other: Any) -> Any:
+        return self._inplace(iadd, other)
 
-        Args:
-            other (Vector3 | int | float): 4차원 벡터의 나눗셈에서의 제수.
+    def __isub__(self, other: Any) -> Any:
+        return self._inplace(isub, other)
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    def __imul__(self, other: Any) -> Any:
+        return self._inplace(imul, other)
 
-        Returns:
-            Vector3: 연산 결과
-        """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self // Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector4(
-            self.__x // other.x,
-            self.__y // other.y,
-            self.__z // other.z,
-            self.__w // other.w,
-        )
+    def __itruediv__(self, other: Any) -> Any:
+        return self._inplace(itruediv, other)
 
-    def __mod__(self, other: Vector4 | int | float) -> Vector4:
-        """4차원 벡터의 나눗셈. 소수점이 아닌, 나머지를 게산.
+    def __ifloordiv__(self, other: Any) -> Any:
+        return self._inplace(ifloordiv, other)
 
-        Args:
-            other (Vector3 | int | float): 4차원 벡터의 나눗셈에서의 제수.
+    def __imod__(self, other: Any) -> Any:
+        return self._inplace(imod, other)
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
 
-        Returns:
-            Vector3: 연산 결과.
-        """
-        if not isinstance(other, Vector4):
-            if _is_real_num(other):
-                return self % Vector4(other, other, other, other)
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return Vector4(
-            self.__x % other.x,
-            self.__y % other.y,
-            self.__z % other.z,
-            self.__w % other.w,
-        )
-
-    def __pow__(self, other: int | float) -> float:
-        """4차원 벡터의 X제곱을 계산.
+class FrozenVector2(_FrozenVector, Vector2):
+    """dict의 키, set의 원소로 사용할 수 있는 불변 평면벡터 클래스.
 
-        Args:
-            other (int | float): 지수.
+    연산 결과는 일반 평면벡터(Vector2)로 반환됨.
+    """
 
-        Raises:
-            TypeError: 타 차원의 벡터와 연산하는 경우 발생하는 에러.
+    __slots__ = ("_hash",)
 
-        Returns:
-            float: 연신 결과. (스칼라)
-        """
-        if _is_real_num(other):
-            raise TypeError("Exponents must be float or int")
-        return self.norm() ** other
 
-    def __neg__(self) -> Vector4:
-        """해당 4차원 벡터의 역벡터를 구함.
+class FrozenVector3(_FrozenVector, Vector3):
+    """dict의 키, set의 원소로 사용할 수 있는 불변 공간벡터 클래스.
 
-        Returns:
-            Vector3: 해당 4차원 벡터의 역벡터.
-        """
-        return Vector4(-self.__x, -self.__y, -self.__z, -self.__w)
+    연산 결과는 일반 공간벡터(Vector3)로 반환됨.
+    """
 
-    def __eq__(self, other: Vector4) -> bool:
-        """두 4차원 벡터가 같은지 비교함
+    __slots__ = ("_hash",)
 
-        Args:
-            other (Vector3): 비교할 4차원 벡터.
 
-        Raises:
-            TypeError: 4차원 벡터가 아닌 자료형과 비교하는 경우 발생하는 에러.
+class FrozenVector4(_FrozenVector, Vector4):
+    """dict의 키, set의 원소로 사용할 수 있는 불변 4차원 벡터 클래스.
 
-        Returns:
-            bool: 두 벡터가 같을 시 True를 반환함. 반대의 경우 False를 반환함.
-        """
-        if not isinstance(other, Vector4):
-            raise TypeError("Operations cannot be performed with vectors of other dimensions.")
-        return (
-            self.__x == other.x
-            and self.__y == other.y
-            and self.__z == other.z
-            and self.__w == other.w
-        )
+    연산 결과는 일반 4차원 벡터(Vector4)로 반환됨.
+    """
 
-    def __ne__(self, other: Vector4) -> bool:
-        """두 4차원 벡터가 다른지를 비교함.
+    __slots__ = ("_hash",)
 
-        Args:
-            other (Vector4): 비교할 4차원 벡터.
 
-        Returns:
-            bool: 두 벡터가 다를 시 True를 반환함. 반대의 경우 False를 반환함.
-        """
-        return not self == other
+Vector2._FROZEN_TYPE = FrozenVector2
+Vector3._FROZEN_TYPE = FrozenVector3
+Vector4._FROZEN_TYPE = FrozenVector4
 
-    def __iter__(self) -> Iterator[float]:
-        yield self.__x
-        yield self.__y
-        yield self.__z
-        yield self.__w
+_FROZEN_INTERNED: dict[tuple[type, tuple[float, ...]], Vector] = {}
 
-    def __getitem__(self, index: int) -> float:
-        if index >= self.__DEMENTION:
-            raise IndexError
-        return self.__components_list[index]
+for _frozen_type, _demention in ((FrozenVector2, 2), (FrozenVector3, 3), (FrozenVector4, 4)):
+    for _axis in range(-1, _demention):
+        _components = tuple(1.0 if i == _axis else 0.0 for i in range(_demention))
+        _FROZEN_INTERNED[(_frozen_type, _components)] = _frozen_type(*_components)
+    _FROZEN_INTERNED[(_frozen_type, ())] = _FROZEN_INTERNED[(_frozen_type, (0.0,) * _demention)]
@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
+
+import pytest
+
+from Vector import Vector3, Vector3Array
+from Vector.aio import apply, transform, transform_stream
+
+POINTS = [Vector3(i, -i / 2, i % 3 + 1) for i in range(10)]
+
+
+def _normalized(vectors):
+    expected = []
+    for point in vectors:
+        vector = Vector3(*point)
+        vector.normalize()
+        expected.append(vector)
+    return expected
+
+
+async def _source(vectors, read=None):
+    for vector in vectors:
+        if read is not None:
+            read.append(vector)
+        yield vector
+        await asyncio.sleep(0)
+
+
+async def _collect(stream):
+    return [vector for chunk in [chunk async for chunk in stream] for vector in chunk]
+
+
+def test_transform_matches_scalar_vectors():
+    batch = Vector3Array(POINTS)
+    result = asyncio.run(transform(Vector3Array.normalize, batch, chunk_size=3))
+    assert list(result) == _normalized(POINTS)
+    assert list(batch) == POINTS
+    result = asyncio.run(transform(lambda chunk: chunk + 1, POINTS, chunk_size=4))
+    assert list(result) == [p + 1 for p in POINTS]
+
+
+def test_apply_writes_into_the_batch():
+    batch = Vector3Array(POINTS)
+    with ThreadPoolExecutor(2) as executor:
+        asyncio.run(apply(methodcaller("__add__", 1), batch, chunk_size=4, executor=executor))
+    assert list(batch) == [p + 1 for p in POINTS]
+
+
+def test_other_coroutines_run_between_chunks():
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        result = await transform(Vector3Array.normalize, Vector3Array(POINTS), chunk_size=1)
+        await task
+        return result
+
+    assert list(asyncio.run(main())) == _normalized(POINTS)
+    assert ticks == list(range(5))
+
+
+def test_transform_stream_preserves_order():
+    stream = transform_stream(Vector3Array.normalize, _source(POINTS), chunk_size=3, max_pending=2)
+    assert asyncio.run(_collect(stream)) == _normalized(POINTS)
+
+
+def test_transform_stream_applies_backpressure():
+    read = []
+
+    async def main():
+        stream = transform_stream(
+            lambda chunk: chunk + 1, _source([Vector3(1, 2, 3)] * 1000, read), chunk_size=2, max_pending=1
+        )
+        first = await stream.__anext__()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await stream.aclose()
+        return first
+
+    assert list(asyncio.run(main())) == [Vector3(2, 3, 4)] * 2
+    # 쌓아둔 청크, 만들고 있는 청크, 처리 중인 청크보다 많이 읽지 않음
+    assert len(read) <= 2 * (1 + 2)
+
+
+def test_empty_inputs():
+    assert len(asyncio.run(transform(Vector3Array.normalize, Vector3Array()))) == 0
+    batch = Vector3Array()
+    asyncio.run(apply(Vector3Array.normalize, batch))
+    assert len(batch) == 0
+    assert asyncio.run(_collect(transform_stream(Vector3Array.normalize, _source([])))) == []
+
+
+def test_errors_are_propagated():
+    async def failing():
+        yield Vector3(1, 2, 3)
+        raise RuntimeError("sensor disconnected")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(transform_stream(Vector3Array.normalize, failing(), chunk_size=4)))
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(transform_stream(Vector3Array.normalize, _source(POINTS), max_pending=0)))
+    with pytest.raises(ValueError):
+        asyncio.run(transform(Vector3Array.normalize, POINTS, chunk_size=0))
@@ -0,0 +1,114 @@
+import pickle
+from operator import add, floordiv, mod, sub, truediv
+
+import pytest
+
+from Vector import Vector2, Vector3, Vector4, Vector2Array, Vector3Array, Vector4Array
+
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 5.5, 6), Vector3(7, -8, 0.25)]
+OTHERS = [Vector3(2, 1, -1), Vector3(0.5, 3, 2), Vector3(-1, 4, 8)]
+
+
+def _batch(vectors=POINTS):
+    return Vector3Array(vectors)
+
+
+@pytest.mark.parametrize("operator", [add, sub, truediv, floordiv, mod])
+def test_elementwise_matches_scalar_vectors(operator):
+    expected = [operator(a, b) for a, b in zip(POINTS, OTHERS)]
+    assert list(operator(_batch(), _batch(OTHERS))) == expected
+    assert list(operator(_batch(), OTHERS[0])) == [operator(a, OTHERS[0]) for a in POINTS]
+    assert list(operator(_batch(), 2)) == [operator(a, 2) for a in POINTS]
+
+
+@pytest.mark.parametrize("operator", [add, sub, truediv, floordiv, mod])
+def test_scalar_left_operand(operator):
+    assert list(operator(3, _batch())) == [operator(3, a) for a in POINTS]
+
+
+def test_dot_norm_and_distance_match_scalar_vectors():
+    batch, others = _batch(), _batch(OTHERS)
+    assert list(batch * others) == [a * b for a, b in zip(POINTS, OTHERS)]
+    assert list(batch.dot(OTHERS[1])) == [a * OTHERS[1] for a in POINTS]
+    assert list(batch.norm()) == [a.norm() for a in POINTS]
+    assert list(batch.norm_squared()) == [a.norm_squared() for a in POINTS]
+    assert list(batch.distance(others)) == [a.distance(b) for a, b in zip(POINTS, OTHERS)]
+    assert list(batch.distance_squared(others)) == [
+        a.distance_squared(b) for a, b in zip(POINTS, OTHERS)
+    ]
+
+
+def test_pairwise_distance():
+    rows = _batch().pairwise_distance(_batch(OTHERS))
+    assert [list(row) for row in rows] == [[a.distance(b) for b in OTHERS] for a in POINTS]
+
+
+def test_cross_product_matches_scalar_vectors():
+    assert list(_batch() @ _batch(OTHERS)) == [a @ b for a, b in zip(POINTS, OTHERS)]
+    assert list(_batch() @ OTHERS[0]) == [a @ OTHERS[0] for a in POINTS]
+
+
+def test_normalize_and_negation():
+    batch = _batch()
+    batch.normalize()
+    for vector, original in zip(batch, POINTS):
+        expected = Vector3(*original)
+        expected.normalize()
+        assert vector == expected
+    assert list(-_batch()) == [-a for a in POINTS]
+
+
+def test_indexing_and_slicing():
+    batch = _batch()
+    assert len(batch) == 3
+    assert batch[-1] == POINTS[-1]
+    assert list(batch[1:]) == POINTS[1:]
+    assert list(batch[::-1]) == POINTS[::-1]
+    batch[0] = Vector3(9, 9, 9)
+    assert batch[0] == Vector3(9, 9, 9)
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+def test_components_and_construction():
+    batch = Vector2Array.from_components([1, 2], [3, 4])
+    assert list(batch) == [Vector2(1, 3), Vector2(2, 4)]
+    assert list(batch.x) == [1.0, 2.0]
+    assert list(Vector4Array.zeros(2)) == [Vector4(), Vector4()]
+    with pytest.raises(ValueError):
+        Vector2Array.from_components([1, 2], [3])
+
+
+def test_append_and_extend():
+    batch = Vector3Array()
+    batch.append(POINTS[0])
+    batch.extend(POINTS[1:])
+    batch.extend(_batch(OTHERS))
+    assert list(batch) == POINTS + OTHERS
+    with pytest.raises(TypeError):
+        batch.append(Vector2(1, 2))
+
+
+def test_empty_batch():
+    batch = Vector3Array()
+    assert len(batch) == 0
+    assert list(batch) == []
+    assert list(batch.norm()) == []
+    assert list(batch + batch) == []
+    assert list(batch * 2) == []
+
+
+def test_mismatched_operands():
+    with pytest.raises(TypeError):
+        _batch() + Vector2(1, 2)
+    with pytest.raises(TypeError):
+        _batch() + Vector2Array([Vector2(1, 2)] * 3)
+    with pytest.raises(ValueError):
+        _batch() + _batch(POINTS[:2])
+
+
+def test_pickle_round_trip():
+    batch = _batch()
+    restored = pickle.loads(pickle.dumps(batch))
+    assert type(restored) is Vector3Array
+    assert list(restored) == POINTS
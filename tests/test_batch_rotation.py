@@ -0,0 +1,58 @@
+import pytest
+
+from Vector import Vector3, Vector3Array
+from Vector import batch as batch_module
+
+# 마지막 두 벡터는 짐벌락(|y| ≈ 1) 경우
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2), Vector3(0.3, -0.2, -5), Vector3(0, 1, 0), Vector3(0.001, -2, 0)]
+EULERS = [Vector3(0.3, -0.7, 1.2), Vector3(0, 0, 0), Vector3(-1, 2, 0.5), Vector3(3, 0.1, -2), Vector3(0.5, 0.5, 0.5)]
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch_module, "_optional_numpy", lambda: None)
+    return request.param
+
+
+def _assert_close(batch, expected):
+    assert len(batch) == len(expected)
+    for vector, reference in zip(batch, expected):
+        assert tuple(vector) == pytest.approx(tuple(reference), abs=1e-12)
+
+
+def test_to_euler_angles_matches_scalar(backend):
+    _assert_close(Vector3Array(POINTS).to_euler_angles(), [p.to_euler_angles() for p in POINTS])
+
+
+def test_rotate_with_a_single_orientation(backend):
+    for orientation in (EULERS[0], list(EULERS[2])):
+        expected = [p.rotate(orientation) for p in POINTS]
+        _assert_close(Vector3Array(POINTS).rotate(orientation), expected)
+
+
+def test_rotate_with_per_vector_orientations(backend):
+    expected = [p.rotate(e) for p, e in zip(POINTS, EULERS)]
+    _assert_close(Vector3Array(POINTS).rotate(Vector3Array(EULERS)), expected)
+    with pytest.raises(ValueError):
+        Vector3Array(POINTS).rotate(Vector3Array(EULERS[:2]))
+
+
+def test_precision_is_preserved(backend):
+    batch = Vector3Array(POINTS, dtype="float32")
+    assert batch.to_euler_angles().dtype == "float32"
+    assert batch.rotate(EULERS[0]).dtype == "float32"
+    assert batch.rotate(Vector3Array(EULERS)).dtype == "float32"
+
+
+def test_empty_batches(backend):
+    assert len(Vector3Array().to_euler_angles()) == 0
+    assert len(Vector3Array().rotate(EULERS[0])) == 0
+    assert len(Vector3Array().rotate(Vector3Array())) == 0
+
+
+def test_zero_vector_raises(backend):
+    with pytest.raises(ZeroDivisionError):
+        Vector3Array([Vector3()]).to_euler_angles()
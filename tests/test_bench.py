@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from Vector import Vector2, Vector3, VectorN, VectorNArray, bench
+from Vector.bench import SCHEMA_VERSION, bytes_per_instance, compare, construction_time, main, run_suite
+
+
+def test_bytes_per_instance_excludes_instance_dict():
+    # 슬롯 객체(헤더 + 포인터 3개)와 float 3개. __dict__가 있으면 100바이트 이상 늘어남
+    assert 0 < bytes_per_instance(Vector3, count=1_000) < 200
+    assert bytes_per_instance(Vector2, count=1_000) < bytes_per_instance(Vector3, count=1_000)
+
+
+def test_construction_time_is_positive():
+    assert construction_time(Vector2, number=100, repeat=1) > 0
+
+
+
+def test_array_cases_cover_every_vector_type():
+    batch = VectorNArray.of(5)([VectorN(1, 2, 3, 4, 5), VectorN(5, 4, 3, 2, 1)])
+    cases = bench.array_cases(VectorN.of(5))
+    assert "VectorN5Array + VectorN5Array" in cases
+    for function in cases.values():
+        function(VectorNArray.of(5)(batch), batch)
+    assert "Vector3Array.norm" in bench.array_cases(Vector3)
+
+def test_run_suite_produces_json_results():
+    results = run_suite([1, 4], operations=8, repeat=1, vector_types=(Vector2,))
+    assert results["schema"] == SCHEMA_VERSION
+    assert results["batch_sizes"] == [1, 4]
+    assert set(results["bytes_per_instance"]) == {"Vector2"}
+    assert set(results["results"]["Vector2 + Vector2"]) == {"1", "4"}
+    assert set(results["results"]["Vector2Array + Vector2Array"]) == {"1", "4"}
+    json.dumps(results)
+
+
+def test_compare_reports_regressions_beyond_tolerance():
+    baseline = {"schema": SCHEMA_VERSION, "results": {"a": {"1": 100.0}, "b": {"1": 100.0}}}
+    current = {
+        "schema": SCHEMA_VERSION,
+        "results": {"a": {"1": 105.0}, "b": {"1": 150.0}, "new": {"1": 1.0}},
+    }
+    regressions = compare(baseline, current, tolerance=0.1)
+    assert len(regressions) == 1 and regressions[0].startswith("b [batch 1]")
+    assert compare(baseline, current, tolerance=0.6) == []
+    with pytest.raises(ValueError):
+        compare({"schema": -1, "results": {}}, current)
+
+
+def test_main_writes_output_and_compares(tmp_path, monkeypatch):
+    results = {"schema": SCHEMA_VERSION, "results": {"a": {"1": 100.0}}}
+    monkeypatch.setattr(bench, "run_suite", lambda *args: results)
+    output = tmp_path / "current.json"
+    assert main(["--output", str(output)]) == 0
+    assert json.loads(output.read_text(encoding="utf-8")) == results
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"schema": SCHEMA_VERSION, "results": {"a": {"1": 50.0}}}))
+    assert main(["--output", str(output), "--compare", str(baseline)]) == 1
+    assert main(["--output", str(output), "--compare", str(baseline), "--tolerance", "1.5"]) == 0
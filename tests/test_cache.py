@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+from Vector import CachedVector2, CachedVector3, LRUCache, Vector2, Vector3, cache_stats
+from Vector.cache import ROTATION_CACHE, reset_cache_stats
+
+EULER = Vector3(0.3, -0.7, 1.2)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_cache_stats()
+    yield
+    reset_cache_stats()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("b", lambda: 2) == 2
+    assert cache.get_or_compute("a", lambda: -1) == 1
+    cache.get_or_compute("c", lambda: 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 3, "evictions": 1}
+    cache.maxsize = 0
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_cached_results_match_plain_vectors():
+    cached, plain = CachedVector3(1, 2, 3), Vector3(1, 2, 3)
+    for _ in range(2):
+        assert cached.to_euler_angles() == plain.to_euler_angles()
+        assert tuple(cached.rotate(EULER)) == pytest.approx(tuple(plain.rotate(EULER)))
+    assert cache_stats()["vector"] == {"hits": 2, "misses": 2, "evictions": 0}
+    assert tuple(CachedVector2(1, 2).rotate(30)) == pytest.approx(tuple(Vector2(1, 2).rotate(30)))
+
+
+def test_mutation_invalidates_the_cache():
+    vector = CachedVector3(1, 2, 3)
+    before = vector.to_euler_angles()
+    vector.x = -5
+    assert vector.to_euler_angles() == Vector3(-5, 2, 3).to_euler_angles() != before
+    vector += Vector3(1, 1, 1)
+    assert vector.rotate(EULER) == Vector3(-4, 3, 4).rotate(EULER)
+    vector.normalize()
+    expected = Vector3(-4, 3, 4)
+    expected.normalize()
+    assert vector.to_euler_angles() == expected.to_euler_angles()
+
+
+def test_returned_vectors_do_not_share_cached_state():
+    vector = CachedVector3(1, 2, 3)
+    result = vector.to_euler_angles()
+    result.x = 100.0
+    assert vector.to_euler_angles() == Vector3(1, 2, 3).to_euler_angles()
+
+
+def test_rotation_matrices_are_shared():
+    ROTATION_CACHE.clear()
+    CachedVector3(1, 0, 0).rotate(EULER)
+    CachedVector3(0, 1, 0).rotate(EULER)
+    assert cache_stats()["rotation"]["hits"] == 1
+
+
+def test_pickle_does_not_carry_the_cache():
+    vector = CachedVector3(1, 2, 3)
+    vector.to_euler_angles()
+    restored = pickle.loads(pickle.dumps(vector))
+    assert type(restored) is CachedVector3
+    assert restored == vector and restored._cache == {}
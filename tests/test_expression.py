@@ -0,0 +1,88 @@
+from operator import add, floordiv, mod, mul, sub, truediv
+
+import pytest
+
+from Vector import Expression, Vector2, Vector3, Vector3Array, lazy
+
+A, B, C = Vector3(1, 2, 3), Vector3(-4, 0.5, 2), Vector3(7, -8, 0.25)
+POINTS = [A, B, C]
+OTHERS = [Vector3(2, 1, -1), Vector3(0.5, 3, 2), Vector3(-1, 4, 8)]
+OPERATORS = [add, sub, mul, truediv, floordiv, mod]
+
+
+def _values(result):
+    return list(result) if isinstance(result, Vector3Array) else result
+
+
+@pytest.mark.parametrize("operator", OPERATORS)
+def test_lazy_operands_match_eager_vectors(operator):
+    expected = operator(A, B)
+    assert operator(lazy(A), lazy(B)).evaluate() == expected
+    assert operator(lazy(A), B).evaluate() == expected
+    assert operator(A, lazy(B)).evaluate() == expected
+    assert operator(lazy(A), 2).evaluate() == operator(A, 2)
+    assert operator(2, lazy(A)).evaluate() == operator(2, A)
+
+
+@pytest.mark.parametrize("operator", OPERATORS)
+def test_lazy_operands_match_eager_batches(operator):
+    batch, others = Vector3Array(POINTS), Vector3Array(OTHERS)
+    expected = _values(operator(batch, others))
+    for left, right in ((lazy(batch), lazy(others)), (lazy(batch), others), (batch, lazy(others))):
+        result = operator(left, right)
+        assert isinstance(result, Expression)
+        assert _values(result.evaluate()) == expected
+    assert _values(operator(A, lazy(others)).evaluate()) == _values(operator(A, others))
+    assert _values(operator(lazy(batch), A).evaluate()) == _values(operator(batch, A))
+
+
+def test_cross_product_on_both_sides():
+    batch, others = Vector3Array(POINTS), Vector3Array(OTHERS)
+    assert (A @ lazy(B)).evaluate() == A @ B
+    assert (lazy(A) @ B).evaluate() == A @ B
+    assert list((batch @ lazy(others)).evaluate()) == list(batch @ others)
+    assert list((lazy(batch) @ others).evaluate()) == list(batch @ others)
+    assert list((A @ lazy(others)).evaluate()) == list(A @ others)
+    with pytest.raises(TypeError):
+        lazy(Vector2(1, 2)) @ lazy(Vector2(3, 4))
+
+
+def test_cross_product_with_scalars_matches_eager_evaluation():
+    batch = Vector3Array(POINTS)
+    assert (2 @ lazy(A)).evaluate() == 2 @ A
+    assert (lazy(2) @ A).evaluate() == 2 @ A
+    assert (lazy(A) @ 2).evaluate() == A @ 2
+    assert list((2.5 @ lazy(batch)).evaluate()) == list(2.5 @ batch)
+    assert list((lazy(batch) @ 2.5).evaluate()) == list(batch @ 2.5)
+    with pytest.raises(TypeError):
+        lazy(2) @ lazy(3)
+    with pytest.raises(TypeError):
+        2 @ lazy(Vector2(1, 2))
+
+
+def test_compound_expression_matches_eager_evaluation():
+    batch, others = Vector3Array(POINTS), Vector3Array(OTHERS)
+    a, b = lazy(batch), lazy(others)
+    result = (((a + b) / 2 - A) * ((a + b) / 2 - A)).evaluate()
+    middle = (batch + others) / 2 - A
+    assert list(result) == list(middle * middle)
+    assert list((-a).norm().evaluate()) == list((-batch).norm())
+
+
+def test_precision_and_length_checks():
+    batch = Vector3Array(POINTS, dtype="float32")
+    assert (lazy(batch) + 1).evaluate().dtype == "float32"
+    with pytest.raises(TypeError):
+        (lazy(batch) + Vector3Array(POINTS)).evaluate()
+    with pytest.raises(ValueError):
+        (lazy(Vector3Array(POINTS)) + Vector3Array(OTHERS[:2])).evaluate()
+    with pytest.raises(TypeError):
+        lazy(A) + Vector2(1, 2)
+    with pytest.raises(TypeError):
+        lazy("a")
+
+
+def test_empty_batches():
+    empty = Vector3Array()
+    assert list((lazy(empty) + empty).evaluate()) == []
+    assert list((lazy(empty) * empty).evaluate()) == []
@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from Vector import FrozenVector2, FrozenVector3, FrozenVector4, Vector2, Vector3
+
+
+def test_frozen_vectors_are_hashable_and_immutable():
+    frozen = FrozenVector3(1, 2, 3)
+    assert {frozen: "a"}[FrozenVector3(1, 2, 3)] == "a"
+    assert frozen == Vector3(1, 2, 3)
+    with pytest.raises(AttributeError):
+        frozen.x = 5
+    with pytest.raises(TypeError):
+        hash(Vector3(1, 2, 3))
+
+
+def test_freeze_and_interning():
+    assert Vector2(1, 2).freeze() == FrozenVector2(1, 2)
+    assert FrozenVector4() is FrozenVector4(0.0, 0.0, 0.0, 0.0)
+    frozen = FrozenVector2(3, 4)
+    assert frozen.freeze() is frozen
+
+
+def test_binary_operators_return_mutable_vectors():
+    result = FrozenVector2(1, 2) + Vector2(1, 1)
+    assert type(result) is Vector2
+    assert result == Vector2(2, 3)
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        lambda v, o: v.__iadd__(o),
+        lambda v, o: v.__isub__(o),
+        lambda v, o: v.__imul__(o),
+        lambda v, o: v.__itruediv__(o),
+        lambda v, o: v.__ifloordiv__(o),
+        lambda v, o: v.__imod__(o),
+    ],
+)
+@pytest.mark.parametrize("other", [2, Vector2(3, 0.5)])
+def test_inplace_operators_match_mutable_vectors(operator, other):
+    frozen = FrozenVector2(1, 2)
+    result = operator(frozen, other)
+    expected = operator(Vector2(1, 2), other)
+    assert type(result) is FrozenVector2
+    assert result == expected
+    assert frozen == FrozenVector2(1, 2)
+
+
+def test_imul_scales_elementwise():
+    frozen = original = FrozenVector2(1, 2)
+    frozen *= 2
+    assert frozen == Vector2(2, 4)
+    assert isinstance(frozen, FrozenVector2)
+    assert original == Vector2(1, 2)
+    hash(frozen)
+
+
+def test_pickle_round_trip():
+    frozen = FrozenVector3(1, 2, 3)
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert type(restored) is FrozenVector3
+    assert restored == frozen and hash(restored) == hash(frozen)
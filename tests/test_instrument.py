@@ -0,0 +1,48 @@
+from Vector import Vector2, Vector3
+from Vector import instrument
+
+
+def test_measure_counts_calls_and_allocations():
+    a, b = Vector3(1, 2, 3), Vector3(4, 5, 6)
+    with instrument.measure() as result:
+        a + b
+        a * 2
+        Vector2(1, 2)
+    snapshot = result.snapshot
+    assert snapshot.calls["Vector3.__add__"] == 1
+    assert snapshot.calls["Vector3.__mul__(scalar)"] == 1
+    assert snapshot.allocations["Vector3.__add__"] == 1
+    assert snapshot.allocations["<direct>"] == 1
+    assert snapshot.constructions == {"Vector3": 1, "Vector2": 1}
+    assert snapshot.temporary_ratio("Vector3.__add__") == 0.5
+    assert set(snapshot.as_dict()) == {"calls", "time_ns", "constructions", "allocations"}
+
+
+def test_measure_restores_the_original_methods():
+    original = Vector3.__add__
+    with instrument.measure():
+        assert instrument.is_enabled()
+        assert Vector3.__add__ is not original
+    assert not instrument.is_enabled()
+    assert Vector3.__add__ is original
+
+
+def test_nothing_is_recorded_while_disabled():
+    before = instrument.snapshot()
+    Vector3(1, 2, 3) + Vector3(1, 1, 1)
+    assert (instrument.snapshot() - before).as_dict() == {
+        "calls": {},
+        "time_ns": {},
+        "constructions": {},
+        "allocations": {},
+    }
+
+
+def test_nested_measurements():
+    with instrument.measure() as outer:
+        Vector2(1, 2) + Vector2(3, 4)
+        with instrument.measure() as inner:
+            Vector2(1, 2) - Vector2(3, 4)
+        assert instrument.is_enabled()
+    assert inner.snapshot.calls == {"Vector2.__sub__": 1}
+    assert outer.snapshot.calls == {"Vector2.__add__": 1, "Vector2.__sub__": 1}
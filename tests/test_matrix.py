@@ -0,0 +1,78 @@
+import pytest
+
+from Vector import Matrix2, Matrix3, Matrix4, Quaternion, Rotation3D, Vector2, Vector3, Vector4
+from Vector import Vector3Array, Vector4Array
+
+EULER = Vector3(0.3, -0.7, 1.2)
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2)]
+ROWS = ((2, -1, 0), (1, 3, 2), (0, 1, 4))
+
+
+def _approx(vector):
+    return pytest.approx(tuple(vector))
+
+
+def test_matrix_vector_product():
+    matrix = Matrix3(ROWS)
+    vector = Vector3(1, 2, 3)
+    assert matrix @ vector == Vector3(*(sum(a * b for a, b in zip(row, vector)) for row in ROWS))
+    assert list(matrix @ Vector3Array(POINTS)) == [matrix @ point for point in POINTS]
+    assert Matrix2() @ Vector2(1, 2) == Vector2(1, 2)
+
+
+def test_matrix_product_inverse_and_determinant():
+    matrix = Matrix3(ROWS)
+    identity = matrix @ matrix.inverse()
+    for row, expected in zip(identity.rows, Matrix3.identity().rows):
+        assert row == pytest.approx(expected)
+    assert matrix.determinant() == pytest.approx(24.0)
+    assert matrix.transpose().rows == tuple(zip(*ROWS))
+    with pytest.raises(ValueError):
+        Matrix2(((1, 2), (2, 4))).inverse()
+
+
+def test_matrix_arithmetic():
+    matrix = Matrix2(((1, 2), (3, 4)))
+    assert (matrix + matrix).rows == ((2.0, 4.0), (6.0, 8.0))
+    assert (matrix - matrix).rows == ((0.0, 0.0), (0.0, 0.0))
+    assert 2 * matrix == matrix * 2 == matrix + matrix
+    assert (-matrix).rows == ((-1.0, -2.0), (-3.0, -4.0))
+    with pytest.raises(TypeError):
+        matrix + Matrix3()
+
+
+def test_indexing_with_negative_indices():
+    matrix = Matrix3(ROWS)
+    assert matrix[-1] == (0.0, 1.0, 4.0)
+    assert matrix[1, 2] == 2.0
+    assert matrix[-1, 0] == 0.0
+    assert matrix[-1, -1] == 4.0
+    assert matrix[0, -3] == 2.0
+    for index in ((3, 0), (0, 3), (-4, 0), (0, -4)):
+        with pytest.raises(IndexError):
+            matrix[index]
+
+
+def test_rotation_matrices_match_rotations():
+    for rotation in (Rotation3D(EULER), Quaternion.from_euler(EULER)):
+        matrix = Matrix3.from_rotation(rotation)
+        for point in POINTS:
+            assert tuple(matrix @ point) == _approx(point.rotate(EULER))
+
+
+def test_affine_transform_of_points_and_directions():
+    offset = Vector3(10, -5, 2)
+    matrix = Matrix4.from_rotation(Rotation3D(EULER), offset)
+    assert matrix.is_affine()
+    for point in POINTS:
+        assert tuple(matrix.transform_point(point)) == _approx(point.rotate(EULER) + offset)
+        assert tuple(matrix.transform_direction(point)) == _approx(point.rotate(EULER))
+    batch = Vector3Array(POINTS)
+    assert [tuple(p) for p in matrix.transform_point(batch)] == [
+        _approx(matrix.transform_point(p)) for p in POINTS
+    ]
+    assert [tuple(p) for p in matrix.transform_direction(batch)] == [
+        _approx(matrix.transform_direction(p)) for p in POINTS
+    ]
+    assert Matrix4.scale(2) @ Vector4(1, 2, 3, 1) == Vector4(2, 4, 6, 1)
+    assert list(Matrix4() @ Vector4Array([Vector4(1, 2, 3, 4)])) == [Vector4(1, 2, 3, 4)]
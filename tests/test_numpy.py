@@ -0,0 +1,56 @@
+import pytest
+
+from Vector import Vector2, Vector3, Vector3Array
+
+numpy = pytest.importorskip("numpy")
+
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2)]
+
+
+def test_batch_exposes_its_buffer_without_copying():
+    batch = Vector3Array(POINTS)
+    values = numpy.asarray(batch)
+    assert values.shape == (2, 3)
+    values[0, 0] = 10.0
+    assert batch[0] == Vector3(10, 2, 3)
+    assert numpy.asarray(batch, dtype=numpy.float32).dtype == numpy.float32
+
+
+def test_from_numpy_wraps_without_copying():
+    values = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    batch = Vector3Array.from_numpy(values)
+    values[1, 2] = -1.0
+    assert batch[1] == Vector3(4, 5, -1)
+    with pytest.raises(TypeError):
+        batch.append(Vector3())
+    with pytest.raises(ValueError):
+        Vector3Array.from_numpy(numpy.zeros((2, 2)))
+    with pytest.raises(TypeError):
+        Vector3Array.from_numpy(numpy.zeros((2, 3), dtype=numpy.int64))
+
+
+def test_ufuncs_return_batches():
+    batch = Vector3Array(POINTS)
+    result = numpy.add(batch, 1.0)
+    assert isinstance(result, Vector3Array)
+    assert list(result) == [point + 1 for point in POINTS]
+    assert list(batch + numpy.ones((2, 3))) == [point + 1 for point in POINTS]
+    assert list(numpy.ones((2, 3)) + batch) == [point + 1 for point in POINTS]
+    assert numpy.linalg.norm(batch, axis=1).tolist() == pytest.approx([p.norm() for p in POINTS])
+
+
+def test_vector_array_conversion():
+    assert numpy.asarray(Vector2(1, 2)).tolist() == [1.0, 2.0]
+    assert numpy.asarray(Vector3(1, 2, 3), dtype=numpy.float32).dtype == numpy.float32
+
+
+@pytest.mark.parametrize("scalar", [numpy.float64(2), numpy.float32(2), numpy.int64(2)])
+def test_numpy_scalars_behave_like_python_scalars(scalar):
+    batch = Vector3Array(POINTS)
+    dots = [point * 2 for point in POINTS]
+    assert list(batch * scalar) == list(scalar * batch) == list(2.0 * batch) == dots
+    for result in (batch + scalar, scalar + batch):
+        assert isinstance(result, Vector3Array)
+        assert list(result) == [point + 2 for point in POINTS]
+    assert list(scalar - batch) == [2 - point for point in POINTS]
+    assert list(batch / scalar) == [point / 2 for point in POINTS]
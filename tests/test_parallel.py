@@ -0,0 +1,92 @@
+from operator import methodcaller
+
+import pytest
+
+from Vector import Vector3, Vector3Array
+from Vector.parallel import (
+    BatchExecutor,
+    ProcessExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+    _PoolExecutor,
+    get_executor,
+)
+
+POINTS = [Vector3(i, -2 * i, 0.5 + i) for i in range(25)]
+ROTATE = methodcaller("rotate", Vector3(0.1, 0.2, 0.3))
+
+
+@pytest.fixture(params=["serial", "thread", "process"])
+def executor(request):
+    with get_executor(request.param, workers=2, chunk_size=4) as executor:
+        yield executor
+
+
+def test_transform_matches_the_unchunked_operation(executor):
+    batch = Vector3Array(POINTS)
+    result = executor.transform(ROTATE, batch)
+    for vector, expected in zip(result, ROTATE(batch)):
+        # NumPy의 행렬곱은 배열의 길이에 따라 합산 순서가 달라질 수 있음
+        assert tuple(vector) == pytest.approx(tuple(expected), abs=1e-12)
+    assert len(result) == len(batch)
+    assert list(batch) == POINTS
+    assert list(executor.transform(methodcaller("__neg__"), POINTS)) == [-p for p in POINTS]
+
+
+def test_apply_writes_in_place(executor):
+    batch = Vector3Array(POINTS[1:])
+    expected = Vector3Array(POINTS[1:])
+    expected.normalize()
+    executor.apply(Vector3Array.normalize, batch)
+    assert list(batch) == list(expected)
+
+
+def test_precision_is_preserved(executor):
+    batch = Vector3Array(POINTS, dtype="float32")
+    result = executor.transform(methodcaller("__neg__"), batch)
+    assert result.dtype == "float32"
+    assert list(result) == list(-batch)
+
+
+
+def test_results_of_another_precision_are_converted(executor):
+    batch = Vector3Array(POINTS)
+    result = executor.transform(methodcaller("astype", "float32"), batch)
+    assert result.dtype == "float64"
+    assert list(result) == POINTS
+    single = Vector3Array(POINTS, dtype="float32")
+    executor.apply(methodcaller("astype", "float64"), single)
+    assert single.dtype == "float32"
+    assert list(single) == POINTS
+
+
+def test_empty_batches(executor):
+    assert len(executor.transform(methodcaller("__neg__"), Vector3Array())) == 0
+    with pytest.raises(ValueError):
+        executor.transform(methodcaller("__neg__"), [])
+
+
+def test_results_of_another_length_are_rejected(executor):
+    with pytest.raises(ValueError):
+        executor.transform(methodcaller("__getitem__", slice(0, 1)), Vector3Array(POINTS))
+
+
+def test_executor_options():
+    assert get_executor().workers == 1
+    assert isinstance(get_executor("thread"), ThreadExecutor)
+    assert isinstance(get_executor("process", workers=3), ProcessExecutor)
+    assert SerialExecutor(chunk_size=10).chunk_size == 10
+    with pytest.raises(ValueError):
+        get_executor("gpu")
+    with pytest.raises(ValueError):
+        SerialExecutor(chunk_size=0)
+
+
+def test_incomplete_executors_cannot_be_created():
+    class NoPool(_PoolExecutor):
+        def _run_chunks(self, function, batch):
+            return batch.data
+
+    for executor_type in (BatchExecutor, _PoolExecutor, NoPool):
+        with pytest.raises(TypeError):
+            executor_type()
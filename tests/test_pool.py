@@ -0,0 +1,107 @@
+import pytest
+
+from Vector import Vector2, Vector3, Vector4
+from Vector import pool
+
+
+@pytest.fixture(autouse=True)
+def _disable_pooling():
+    yield
+    pool.disable()
+
+
+def test_enable_and_disable_swap_the_operators():
+    original = Vector3.__add__
+    assert not pool.is_enabled()
+    pool.enable()
+    assert pool.is_enabled()
+    assert Vector3.__add__ is not original
+    pool.disable()
+    assert not pool.is_enabled()
+    assert Vector3.__add__ is original
+    assert pool.stats() == {}
+
+
+def test_pooled_operators_match_the_originals():
+    a, b = Vector3(1, 2, 3), Vector3(-2, 0.5, 4)
+    expected = [a + b, a - b, a / 2, a // b, a % 3, -a, 2 - a, 1 + a]
+    dot = a * b
+    pool.enable()
+    results = [a + b, a - b, a / 2, a // b, a % 3, -a, 2 - a, 1 + a]
+    assert results == expected
+    assert all(type(result) is Vector3 for result in results)
+    assert a * b == dot
+    with pytest.raises(TypeError):
+        a + Vector2(1, 2)
+
+
+def test_released_vectors_are_reused():
+    pool.enable([Vector2])
+    temporary = Vector2(1, 2) + Vector2(3, 4)
+    pool.release(temporary)
+    result = Vector2(5, 6) - Vector2(1, 1)
+    assert result is temporary
+    assert result == Vector2(4, 5)
+    counts = pool.stats()["Vector2"]
+    assert counts["hits"] == 1 and counts["misses"] == 1
+    assert counts["hit_rate"] == 0.5
+
+
+def test_free_list_is_bounded():
+    pool.enable([Vector2], max_size=2)
+    vectors = [Vector2(i, i) + 1 for i in range(4)]
+    pool.release(*vectors)
+    assert pool.stats()["Vector2"]["free"] == 2
+    pool.reset_stats()
+    assert pool.stats()["Vector2"]["misses"] == 0
+    assert pool.stats()["Vector2"]["hits"] == 0
+
+
+def test_arena_reclaims_only_unreferenced_vectors():
+    pool.enable()
+    kept = []
+    with pool.arena():
+        for i in range(10):
+            temporary = Vector3(i, 0, 0) + Vector3(0, 1, 0)
+        kept.append(-temporary)
+        returned = Vector3(1, 1, 1) + 1
+    del temporary
+    assert kept[0] == Vector3(-9, -1, 0)
+    assert returned == Vector3(2, 2, 2)
+    free = pool.stats()["Vector3"]["free"]
+    assert free >= 9
+    # 회수된 벡터를 재사용해도 살아남은 벡터는 바뀌지 않음
+    with pool.arena():
+        for _ in range(free):
+            Vector3(7, 7, 7) + 0
+    assert kept[0] == Vector3(-9, -1, 0)
+    assert returned == Vector3(2, 2, 2)
+
+
+def test_nested_arenas_hand_survivors_to_the_outer_arena():
+    pool.enable()
+    with pool.arena():
+        with pool.arena():
+            survivor = Vector3(1, 2, 3) + 1
+        assert pool.stats()["Vector3"]["free"] == 0
+        del survivor
+    assert pool.stats()["Vector3"]["free"] == 1
+
+
+def test_arena_without_pooling_does_nothing():
+    with pool.arena():
+        vector = Vector3(1, 2, 3) + 1
+    assert vector == Vector3(2, 3, 4)
+    pool.release(vector)
+    assert pool.stats() == {}
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        pool.enable(max_size=0)
+    with pytest.raises(TypeError):
+        pool.enable([int])
+    pool.enable([Vector4])
+    with pytest.raises(RuntimeError):
+        with pool.arena():
+            pool.disable()
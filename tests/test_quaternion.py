@@ -0,0 +1,107 @@
+from math import pi
+
+import pytest
+
+from Vector import FrozenQuaternion, Quaternion, Rotation3D, Vector3, Vector4, Vector3Array, Vector4Array
+from Vector.quaternion import nlerp, nlerp_batch, slerp, slerp_batch
+
+EULER = Vector3(0.3, -0.7, 1.2)
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2)]
+
+
+def _approx(vector):
+    return pytest.approx(tuple(vector))
+
+
+def test_rotate_matches_euler_rotation():
+    q = Quaternion.from_euler(EULER)
+    for point in POINTS:
+        assert tuple(q.rotate(point)) == _approx(point.rotate(EULER))
+    for rotated, point in zip(q.rotate(Vector3Array(POINTS)), POINTS):
+        assert tuple(rotated) == _approx(point.rotate(EULER))
+    assert tuple(q.to_rotation().apply(POINTS[0])) == _approx(Rotation3D(EULER).apply(POINTS[0]))
+
+
+def test_hamilton_product_composes_rotations():
+    a = Quaternion.from_axis_angle(Vector3(0, 0, 1), pi / 2)
+    b = Quaternion.from_axis_angle(Vector3(1, 0, 0), pi / 2)
+    point = Vector3(1, 2, 3)
+    assert tuple((a @ b).rotate(point)) == _approx(a.rotate(b.rotate(point)))
+    assert tuple(a @ a.inverse()) == _approx(Quaternion())
+    with pytest.raises(TypeError):
+        a @ Vector4(0, 0, 0, 1)
+
+
+def test_operators_stay_quaternions():
+    a = Quaternion(0, 0, 0.6, 0.8)
+    b = Quaternion.from_axis_angle(Vector3(1, 0, 0), 0.5)
+    c = Quaternion(1, 2, 3, 4)
+    for result in (-a, a + b, a - b, a + 1, 1 + a, 1 - a, a - 1, a / 2, a // 0.5, a % 0.5, 2 / c, 2 // c, 2 % c):
+        assert type(result) is Quaternion
+    unit = (a + b) / (a + b).norm()
+    assert type(unit) is Quaternion
+    assert unit.norm() == pytest.approx(1.0)
+    assert unit.rotate(Vector3(1, 2, 3)).norm() == pytest.approx(Vector3(1, 2, 3).norm())
+    assert tuple((-a).rotate(Vector3(1, 0, 0))) == _approx(a.rotate(Vector3(1, 0, 0)))
+    total = a + b
+    total.normalize()
+    assert total.norm() == pytest.approx(1.0)
+    assert tuple(a - b) == tuple(Vector4(*a) - Vector4(*b))
+
+
+def test_slerp_and_nlerp_endpoints():
+    start = Quaternion()
+    end = Quaternion.from_axis_angle(Vector3(0, 1, 0), pi / 2)
+    assert tuple(slerp(start, end, 0.0)) == _approx(start)
+    assert tuple(slerp(start, end, 1.0)) == _approx(end)
+    halfway = Quaternion.from_axis_angle(Vector3(0, 1, 0), pi / 4)
+    assert tuple(slerp(start, end, 0.5)) == _approx(halfway)
+    assert tuple(nlerp(start, end, 0.5)) == _approx(halfway)
+
+
+def test_batch_interpolation_matches_scalar():
+    starts = [Quaternion(), Quaternion.from_axis_angle(Vector3(1, 0, 0), 1.0)]
+    end = Quaternion.from_axis_angle(Vector3(0, 0, 1), 2.0)
+    batch = Vector4Array(starts)
+    for function, batched in ((slerp, slerp_batch), (nlerp, nlerp_batch)):
+        results = batched(batch, end, 0.3)
+        assert [tuple(q) for q in results] == [_approx(function(q, end, 0.3)) for q in starts]
+    ratios = [0.0, 0.25, 1.0]
+    results = slerp_batch(starts[1], end, ratios)
+    assert [tuple(q) for q in results] == [_approx(slerp(starts[1], end, t)) for t in ratios]
+
+
+def test_batch_interpolation_keeps_the_batch_dtype():
+    starts = [Quaternion(), Quaternion.from_axis_angle(Vector3(1, 0, 0), 1.0)]
+    end = Quaternion.from_axis_angle(Vector3(0, 0, 1), 2.0)
+    single = Vector4Array(starts, dtype="float32")
+    for batched in (slerp_batch, nlerp_batch):
+        assert batched(single, end, 0.3).dtype == "float32"
+        assert batched(end, single, 0.3).dtype == "float32"
+        assert batched(Vector4Array(starts), end, 0.3).dtype == "float64"
+    assert slerp_batch(starts[1], end, [0.0, 1.0]).dtype == "float64"
+    results = slerp_batch(single, end, 0.3)
+    expected = [slerp(q, end, 0.3) for q in starts]
+    assert [tuple(q) for q in results] == [pytest.approx(tuple(q), abs=1e-6) for q in expected]
+
+def test_batch_interpolation_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        slerp_batch(Quaternion(), Quaternion(), 0.5)
+    with pytest.raises(ValueError):
+        slerp_batch(Vector4Array([Quaternion()]), Quaternion(), [0.1, 0.2])
+
+
+def test_freeze_keeps_the_quaternion_type():
+    rotation = Quaternion.from_axis_angle(Vector3(0, 0, 1), 0.5)
+    frozen = rotation.freeze()
+    assert type(frozen) is FrozenQuaternion
+    assert frozen == rotation and hash(frozen) == hash(rotation.freeze())
+    assert tuple(frozen.rotate(Vector3(1, 0, 0))) == _approx(rotation.rotate(Vector3(1, 0, 0)))
+    with pytest.raises(AttributeError):
+        frozen.x = 1.0
+    alias = frozen
+    alias /= 2
+    assert type(alias) is FrozenQuaternion
+    assert tuple(alias) == _approx(rotation / 2)
+    assert tuple(frozen) == tuple(rotation)
+    assert type(frozen + 1) is Quaternion
@@ -0,0 +1,73 @@
+from math import pi
+
+import pytest
+
+from Vector import Rotation2D, Rotation3D, Vector2, Vector3, Vector2Array, Vector3Array
+
+EULER = Vector3(0.3, -0.7, 1.2)
+POINTS_3D = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2), Vector3(0, 0, 0)]
+
+
+def test_rotation2d_matches_vector2_rotate():
+    rotation = Rotation2D(30)
+    for vector in (Vector2(1, 0), Vector2(-3, 2.5)):
+        assert tuple(rotation.apply(vector)) == pytest.approx(tuple(vector.rotate(30)))
+
+
+def test_rotation2d_batch_and_composition():
+    points = [Vector2(1, 2), Vector2(-3, 0.5)]
+    rotated = Rotation2D(45).apply(Vector2Array(points))
+    for vector, point in zip(rotated, points):
+        assert tuple(vector) == pytest.approx(tuple(point.rotate(45)))
+    composed = Rotation2D(20) @ Rotation2D(25)
+    assert tuple(composed.apply(Vector2(1, 2))) == pytest.approx(tuple(Vector2(1, 2).rotate(45)))
+    identity = Rotation2D(70) @ Rotation2D(70).inverse()
+    assert tuple(identity.apply(Vector2(1, 2))) == pytest.approx((1.0, 2.0))
+
+
+def test_rotation3d_matches_vector3_rotate():
+    rotation = Rotation3D(EULER)
+    for vector in POINTS_3D:
+        assert tuple(rotation.apply(vector)) == pytest.approx(tuple(vector.rotate(EULER)))
+    rotated = rotation.apply(Vector3Array(POINTS_3D))
+    for vector, point in zip(rotated, POINTS_3D):
+        assert tuple(vector) == pytest.approx(tuple(point.rotate(EULER)))
+
+
+def test_rotation3d_inverse_and_identity():
+    rotation = Rotation3D([0.1, 0.2, 0.3])
+    vector = Vector3(1, 2, 3)
+    assert tuple((rotation.inverse() @ rotation).apply(vector)) == pytest.approx((1.0, 2.0, 3.0))
+    assert tuple(Rotation3D().apply(vector)) == (1.0, 2.0, 3.0)
+
+
+def test_rotation3d_from_axis_angle():
+    rotated = Rotation3D.from_axis_angle(Vector3(0, 0, 2), pi / 2).apply(Vector3(1, 0, 0))
+    assert tuple(rotated) == pytest.approx((0.0, 1.0, 0.0))
+    with pytest.raises(ValueError):
+        Rotation3D.from_axis_angle(Vector3(), 1.0)
+
+
+def test_apply_rejects_other_dimensions():
+    with pytest.raises(TypeError):
+        Rotation2D(10).apply(Vector3(1, 2, 3))
+    with pytest.raises(TypeError):
+        Rotation3D().apply(Vector2(1, 2))
+
+
+class _Composable:
+    """회전의 @ 연산자가 NotImplemented를 반환할 때만 불리는 반사 연산자를 가진 객체."""
+
+    def __rmatmul__(self, other):
+        return ("rmatmul", other)
+
+
+def test_composition_with_foreign_operands():
+    for rotation in (Rotation2D(10), Rotation3D(EULER)):
+        assert rotation @ _Composable() == ("rmatmul", rotation)
+        with pytest.raises(TypeError):
+            rotation @ 2
+    with pytest.raises(TypeError):
+        Rotation2D(10) @ Rotation3D(EULER)
+    with pytest.raises(TypeError):
+        Rotation3D(EULER) @ Rotation2D(10)
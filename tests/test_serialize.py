@@ -0,0 +1,134 @@
+import io
+import pickle
+
+import pytest
+
+from Vector import Vector2, Vector3, Vector3Array, VectorN, VectorReader, VectorWriter
+from Vector.serialize import dump, dumps, load, loads
+
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 5.5, 6), Vector3(7, -8, 0.25)]
+
+
+class _Unseekable(io.BytesIO):
+    """탐색할 수 없는 스트림을 흉내 내는 버퍼."""
+
+    def seekable(self):
+        return False
+
+
+def test_vector_round_trip():
+    for vector in (Vector2(1, 2), Vector3(1, 2, 3), VectorN.of(6)(1, 2, 3, 4, 5, 6)):
+        restored = loads(dumps(vector))
+        assert type(restored) is type(vector)
+        assert restored == vector
+
+
+def test_batch_round_trip_keeps_precision():
+    batch = Vector3Array(POINTS)
+    restored = loads(dumps(batch))
+    assert type(restored) is Vector3Array
+    assert list(restored) == POINTS
+    single = loads(dumps(Vector3Array(POINTS, dtype="float32")))
+    assert single.dtype == "float32"
+    assert list(single) == POINTS
+    assert loads(dumps(batch, dtype="float32")).dtype == "float32"
+
+
+def test_file_round_trip():
+    buffer = io.BytesIO()
+    dump(Vector3Array(POINTS), buffer)
+    buffer.seek(0)
+    assert list(load(buffer)) == POINTS
+
+
+def test_empty_batch_round_trip():
+    restored = loads(dumps(Vector3Array()))
+    assert type(restored) is Vector3Array
+    assert len(restored) == 0
+
+
+def test_invalid_data():
+    with pytest.raises(TypeError):
+        dumps([1, 2, 3])
+    with pytest.raises(ValueError):
+        dumps(Vector2(1, 2), dtype="int32")
+    with pytest.raises(ValueError):
+        loads(b"VEC")
+    with pytest.raises(ValueError):
+        loads(b"XXXX" + dumps(Vector2(1, 2))[4:])
+    with pytest.raises(ValueError):
+        loads(dumps(Vector3Array(POINTS))[:-1])
+
+
+def test_writer_and_reader_stream_in_chunks():
+    buffer = io.BytesIO()
+    with VectorWriter(buffer, 3, chunk_size=2) as writer:
+        writer.write(POINTS[0])
+        writer.write_batch(POINTS[1:])
+        writer.write_batch(Vector3Array(POINTS))
+        assert len(writer) == 6
+    buffer.seek(0)
+    reader = VectorReader(buffer, chunk_size=4)
+    assert reader.demention == 3
+    assert reader.dtype == "float64"
+    assert len(reader) == 6
+    assert [len(batch) for batch in reader.batches()] == [4, 2]
+    buffer.seek(0)
+    assert list(VectorReader(buffer)) == POINTS * 2
+
+
+def test_unseekable_stream_records_unknown_count():
+    buffer = _Unseekable()
+    with VectorWriter(buffer, 3, dtype="float32") as writer:
+        writer.write_batch(POINTS)
+    buffer.seek(0)
+    reader = VectorReader(buffer, chunk_size=2)
+    with pytest.raises(TypeError):
+        len(reader)
+    assert list(reader) == POINTS
+    assert list(loads(buffer.getvalue())) == POINTS
+
+
+def test_empty_stream():
+    buffer = io.BytesIO()
+    VectorWriter(buffer, 2).close()
+    buffer.seek(0)
+    reader = VectorReader(buffer)
+    assert len(reader) == 0
+    assert list(reader.batches()) == []
+    buffer.seek(0)
+    assert len(VectorReader(buffer).read()) == 0
+
+
+def test_reader_returns_a_single_vector():
+    buffer = io.BytesIO(dumps(Vector3(1, 2, 3)))
+    assert VectorReader(buffer).read() == Vector3(1, 2, 3)
+
+
+def test_writer_rejects_other_dimensions():
+    writer = VectorWriter(io.BytesIO(), 3)
+    with pytest.raises(TypeError):
+        writer.write(Vector2(1, 2))
+    with pytest.raises(ValueError):
+        VectorWriter(io.BytesIO(), 0)
+
+
+def test_pickles_hold_components_only():
+    vector = Vector3(1, 2, 3)
+    assert vector.__reduce__() == (Vector3, (1.0, 2.0, 3.0))
+    assert b"_Vector3__x" not in pickle.dumps(vector)
+
+
+def test_batch_pickle_keeps_dtype():
+    batch = Vector3Array(POINTS, dtype="float32")
+    restored = pickle.loads(pickle.dumps(batch))
+    assert restored.dtype == "float32"
+    assert list(restored) == POINTS
+
+
+def test_numpy_backed_batch_pickles():
+    numpy = pytest.importorskip("numpy")
+    batch = Vector3Array.from_numpy(numpy.array([list(p) for p in POINTS]))
+    restored = pickle.loads(pickle.dumps(batch))
+    assert type(restored) is Vector3Array
+    assert list(restored) == POINTS
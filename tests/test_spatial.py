@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from Vector import KDTree, UniformGrid, Vector2, Vector3, Vector3Array
+
+random.seed(7)
+POINTS = [Vector3(random.uniform(-10, 10), random.uniform(-10, 10), random.uniform(-10, 10)) for _ in range(200)]
+TARGET = Vector3(0.5, -1, 2)
+
+
+def _indexes(points=POINTS):
+    return [KDTree(points), UniformGrid(2.5, points)]
+
+
+def _brute_nearest(points, target, k):
+    distances = sorted((point.distance(target), point_id) for point_id, point in points.items())
+    return [(point_id, distance) for distance, point_id in distances[:k]]
+
+
+@pytest.mark.parametrize("index", _indexes())
+def test_nearest_matches_brute_force(index):
+    points = dict(enumerate(POINTS))
+    for k in (1, 5, 200, 500):
+        result = index.nearest(TARGET, k)
+        expected = _brute_nearest(points, TARGET, k)
+        assert [point_id for point_id, _ in result] == [point_id for point_id, _ in expected]
+        assert [d for _, d in result] == pytest.approx([d for _, d in expected])
+
+
+@pytest.mark.parametrize("index", _indexes())
+def test_nearest_with_non_positive_k(index):
+    assert index.nearest(TARGET, 0) == []
+    assert index.nearest(TARGET, -1) == []
+
+
+@pytest.mark.parametrize("index", _indexes([]))
+def test_empty_index(index):
+    assert len(index) == 0
+    assert index.nearest(TARGET) == []
+    assert index.radius(TARGET, 5.0) == []
+    assert index.box(Vector3(-1, -1, -1), Vector3(1, 1, 1)) == []
+
+
+@pytest.mark.parametrize("index", _indexes())
+def test_radius_and_box_match_brute_force(index):
+    assert index.radius(TARGET, 4.0) == [
+        point_id for point_id, point in enumerate(POINTS) if point.distance(TARGET) <= 4.0
+    ]
+    lower, upper = Vector3(-3, -2, -5), Vector3(4, 6, 1)
+    assert index.box(lower, upper) == [
+        point_id
+        for point_id, point in enumerate(POINTS)
+        if all(a <= p <= b for a, p, b in zip(lower, point, upper))
+    ]
+
+
+@pytest.mark.parametrize("index", _indexes())
+def test_insert_and_remove(index):
+    point_id = index.insert(Vector3(0.5, -1, 2.01))
+    assert index.nearest(TARGET)[0][0] == point_id
+    assert index[point_id] == Vector3(0.5, -1, 2.01)
+    index.remove(point_id)
+    assert point_id not in index
+    for removed in range(150):
+        index.remove(removed)
+    remaining = {point_id: POINTS[point_id] for point_id in range(150, 200)}
+    assert [point_id for point_id, _ in index.nearest(TARGET, 3)] == [
+        point_id for point_id, _ in _brute_nearest(remaining, TARGET, 3)
+    ]
+    with pytest.raises(KeyError):
+        index.remove(0)
+
+
+def test_batches_and_dimension_checks():
+    tree = KDTree(Vector3Array(POINTS[:10]))
+    assert len(tree) == 10
+    with pytest.raises(TypeError):
+        tree.insert(Vector2(1, 2))
+    grid = UniformGrid(1.0, [Vector2(0, 0), Vector2(3, 4)])
+    assert grid.nearest(Vector2(3, 3.5)) == [(1, 0.5)]
+    with pytest.raises(ValueError):
+        UniformGrid(0)
+
+
+def test_grid_nearest_far_from_sparse_points():
+    # 빈 칸을 한 칸씩 넓혀가며 찾았다면 수백만 번 반복해야 하는 질의
+    points = [Vector2(0, 0), Vector2(1e7, 0), Vector2(0.5, 0.5)]
+    grid = UniformGrid(1.0, points)
+    result = grid.nearest(Vector2(5e6 + 10, 0), 2)
+    assert [point_id for point_id, _ in result] == [1, 2]
+    assert [distance for _, distance in result] == pytest.approx([5e6 - 10, Vector2(5e6 + 9.5, -0.5).norm()])
+    assert grid.nearest(Vector2(-3e6, -3e6))[0][0] == 0
+    assert [point_id for point_id, _ in grid.nearest(Vector2(0.6, 0.4), 3)] == [2, 0, 1]
+
+
+@pytest.mark.parametrize("target", [Vector3(100, 100, 100), Vector3(-40, 3, 0), TARGET])
+def test_grid_nearest_from_any_target_matches_brute_force(target):
+    grid = UniformGrid(0.5, POINTS)
+    for removed in range(0, 200, 3):
+        grid.remove(removed)
+    remaining = {point_id: point for point_id, point in enumerate(POINTS) if point_id % 3}
+    for k in (1, 4, 50):
+        assert [point_id for point_id, _ in grid.nearest(target, k)] == [
+            point_id for point_id, _ in _brute_nearest(remaining, target, k)
+        ]
@@ -0,0 +1,120 @@
+from math import fsum
+
+import pytest
+
+from Vector import Matrix3, Statistics, Vector2, Vector3, Vector3Array, VectorN
+
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 5.5, 6), Vector3(7, -8, 0.25), Vector3(2, 2, -1), Vector3(0.5, 3, 9)]
+
+
+def _mean(vectors):
+    return [fsum(column) / len(vectors) for column in zip(*vectors)]
+
+
+def _covariance(vectors, ddof=1):
+    mean = _mean(vectors)
+    return [
+        [fsum((v[i] - mean[i]) * (v[j] - mean[j]) for v in vectors) / (len(vectors) - ddof) for j in range(3)]
+        for i in range(3)
+    ]
+
+
+def _covariance_2d_trace(points):
+    mean = _mean(points)
+    return fsum((p[0] - mean[0]) ** 2 + (p[1] - mean[1]) ** 2 for p in points) / (len(points) - 1)
+
+
+def test_matches_direct_computation():
+    stats = Statistics(Vector3Array(POINTS))
+    assert stats.count == len(POINTS)
+    assert stats.demention == 3
+    assert tuple(stats.sum()) == tuple(fsum(column) for column in zip(*POINTS))
+    assert tuple(stats.mean()) == pytest.approx(_mean(POINTS))
+    assert stats.min() == Vector3(-4, -8, -1)
+    assert stats.max() == Vector3(7, 5.5, 9)
+    assert stats.bounds() == (stats.min(), stats.max())
+    covariance = stats.covariance()
+    assert type(covariance) is Matrix3
+    for ddof in (0, 1):
+        expected = _covariance(POINTS, ddof)
+        actual = stats.covariance(ddof)
+        assert [[actual[i, j] for j in range(3)] for i in range(3)] == [pytest.approx(row) for row in expected]
+
+
+def test_chunked_updates_match_a_single_update():
+    whole = Statistics(POINTS)
+    chunked = Statistics.from_batches(Vector3Array(POINTS[i : i + 2]) for i in range(0, len(POINTS), 2))
+    assert chunked.count == whole.count
+    assert tuple(chunked.sum()) == tuple(whole.sum())
+    assert tuple(chunked.mean()) == pytest.approx(tuple(whole.mean()))
+    assert chunked.bounds() == whole.bounds()
+    for i in range(3):
+        for j in range(3):
+            assert chunked.covariance()[i, j] == pytest.approx(whole.covariance()[i, j])
+
+
+def test_merge_of_separate_accumulators():
+    left, right = Statistics(POINTS[:2]), Statistics(POINTS[2:])
+    merged = Statistics().merge(left).merge(right)
+    assert tuple(merged.mean()) == pytest.approx(_mean(POINTS))
+    assert left.count == 2
+
+
+def test_sums_are_compensated_across_chunks():
+    vectors = [Vector2(1e16, 1.0), Vector2(1.0, 1.0), Vector2(-1e16, 1.0)]
+    stats = Statistics.from_batches([vectors[i : i + 1] for i in range(3)])
+    assert tuple(stats.sum()) == (1.0, 3.0)
+
+
+def test_covariance_keeps_precision_far_from_the_origin():
+    offset = Vector3(1e9, -1e9, 1e9)
+    stats = Statistics.from_batches([[p + offset for p in POINTS[:3]], [p + offset for p in POINTS[3:]]])
+    expected = _covariance(POINTS)
+    assert [[stats.covariance()[i, j] for j in range(3)] for i in range(3)] == [
+        pytest.approx(row, rel=1e-6) for row in expected
+    ]
+
+
+def test_weighted_mean():
+    stats = Statistics([Vector2(0, 0), Vector2(4, 8)], weights=[3, 1])
+    assert stats.weighted_mean() == Vector2(1, 2)
+    stats.update([Vector2(2, 2)])
+    assert tuple(stats.weighted_mean()) == pytest.approx((6 / 5, 10 / 5))
+    assert tuple(stats.mean()) == pytest.approx((2, 10 / 3))
+    with pytest.raises(ValueError):
+        Statistics([Vector2(1, 1)], weights=[1, 2])
+    with pytest.raises(ValueError):
+        Statistics([Vector2(1, 1)], weights=[0]).weighted_mean()
+
+
+def test_principal_axes():
+    points = [Vector2(t, 0.5 * t) for t in range(-5, 6)]
+    (variance, axis), (minor, _) = Statistics(points).principal_axes()
+    assert variance == pytest.approx(_covariance_2d_trace(points))
+    assert tuple(axis) == pytest.approx((2 / 5**0.5, 1 / 5**0.5))
+    assert minor == pytest.approx(0.0, abs=1e-12)
+
+
+def test_other_dimensions():
+    vectors = [VectorN(1, 2, 3, 4, 5), VectorN(5, 4, 3, 2, 1)]
+    covariance = Statistics(vectors).covariance()
+    assert type(covariance) is tuple
+    assert covariance[0] == pytest.approx((8.0, 4.0, 0.0, -4.0, -8.0))
+    with pytest.raises(TypeError):
+        Statistics(POINTS).update([Vector2(1, 2)])
+
+
+def test_empty_input():
+    stats = Statistics()
+    assert stats.count == 0
+    assert stats.demention == 0
+    stats.update([])
+    stats.update(Vector3Array())
+    stats.merge(Statistics())
+    assert stats.count == 0
+    for method in (stats.sum, stats.mean, stats.weighted_mean, stats.min, stats.bounds, stats.covariance):
+        with pytest.raises(ValueError):
+            method()
+    with pytest.raises(ValueError):
+        Statistics([Vector3(1, 2, 3)]).covariance()
+    assert Statistics([Vector3(1, 2, 3)]).covariance(ddof=0)[0, 0] == 0.0
@@ -0,0 +1,91 @@
+import pytest
+
+from Vector import Vector2, Vector3, Vector3Array, VectorStore
+
+POINTS = [Vector3(1, 2, 3), Vector3(-4, 0.5, 2), Vector3(7, -8, 0.25)]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "points.vec"
+
+
+def test_round_trip_through_the_file(path):
+    with VectorStore.create(path, 3) as store:
+        store.append(POINTS[0])
+        store.extend(POINTS[1:])
+        assert len(store) == 3
+    with VectorStore(path) as store:
+        assert store.demention == 3
+        assert list(store) == POINTS
+        assert store[-1] == POINTS[-1]
+        assert list(store[1:]) == POINTS[1:]
+        assert list(store[::2]) == POINTS[::2]
+        assert list(store.as_batch()) == POINTS
+
+
+def test_extend_grows_the_file(path):
+    with VectorStore.create(path, 2, capacity=1) as store:
+        store.extend(Vector2(i, -i) for i in range(100))
+        assert store.capacity >= 100
+        assert list(store) == [Vector2(i, -i) for i in range(100)]
+    with VectorStore(path) as store:
+        assert len(store) == 100
+
+
+def test_float32_batches_are_stored_as_float64(path):
+    with VectorStore.create(path, 3) as store:
+        store.extend(Vector3Array(POINTS, dtype="float32"))
+        assert list(store) == POINTS
+
+
+def test_chunked_transform_and_normalize(path):
+    with VectorStore.create(path, 3) as store:
+        store.extend(POINTS)
+        assert [len(chunk) for chunk in store.chunks(2)] == [2, 1]
+        store.transform(lambda chunk: chunk + 1, chunk_size=2)
+        assert list(store) == [point + 1 for point in POINTS]
+        store.normalize(chunk_size=2)
+        for vector in store:
+            assert vector.norm() == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            store.transform(lambda chunk: chunk[:0])
+
+
+def test_setitem_writes_through(path):
+    with VectorStore.create(path, 3) as store:
+        store.extend(POINTS)
+        store[1] = Vector3(9, 9, 9)
+    with VectorStore(path) as store:
+        assert store[1] == Vector3(9, 9, 9)
+
+
+def test_read_only_store_rejects_writes(path):
+    with VectorStore.create(path, 3) as store:
+        store.extend(POINTS)
+    with VectorStore(path) as store:
+        with pytest.raises(TypeError):
+            store[0] = Vector3()
+        with pytest.raises(TypeError):
+            store.normalize()
+        assert list(store) == POINTS
+
+
+def test_empty_store(path):
+    with VectorStore.create(path, 4) as store:
+        assert len(store) == 0
+        assert list(store) == []
+        assert list(store.chunks()) == []
+        assert len(store.as_batch()) == 0
+
+
+def test_invalid_files(path, tmp_path):
+    with pytest.raises(ValueError):
+        VectorStore.create(path, 5)
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"not a vector store")
+    with pytest.raises(ValueError):
+        VectorStore(other)
+    other.write_bytes(b"")
+    with pytest.raises(ValueError):
+        VectorStore(other)
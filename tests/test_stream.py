@@ -0,0 +1,95 @@
+from operator import methodcaller
+
+import pytest
+
+from Vector import Stream, Vector2, Vector3, Vector3Array
+from Vector.batch import Vector2Array
+
+POINTS = [Vector3(i, -i / 2, i % 3) for i in range(1, 11)]
+
+
+def test_stages_match_scalar_vectors():
+    stream = (
+        Stream(POINTS, chunk_size=3)
+        .transform(lambda chunk: chunk + 1)
+        .select(lambda chunk: [n > 3 for n in chunk.norm()])
+        .map(Vector3.to_2d)
+    )
+    expected = [(p + 1).to_2d() for p in POINTS if (p + 1).norm() > 3]
+    assert list(stream) == expected
+    assert type(stream.collect()) is Vector2Array
+    assert list(stream.collect()) == expected
+    assert stream.count() == len(expected)
+
+
+def test_chunks_are_bounded_and_lazy():
+    consumed = []
+
+    def source():
+        for point in POINTS:
+            consumed.append(point)
+            yield point
+
+    stream = Stream(source(), chunk_size=4).transform(methodcaller("normalize"))
+    assert consumed == []
+    chunks = stream.batches()
+    assert len(next(chunks)) == 4
+    assert len(consumed) == 4
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+
+
+def test_in_place_stages_do_not_touch_the_input():
+    batch = Vector3Array(POINTS)
+    result = Stream(batch, chunk_size=3).transform(Vector3Array.normalize).collect()
+    assert list(batch) == POINTS
+    for vector, original in zip(result, POINTS):
+        expected = Vector3(*original)
+        expected.normalize()
+        assert vector == expected
+
+
+def test_adding_a_stage_returns_a_new_stream():
+    stream = Stream(POINTS)
+    filtered = stream.filter(lambda vector: vector.x > 4)
+    assert filtered is not stream
+    assert stream.count() == len(POINTS)
+    assert list(filtered) == [p for p in POINTS if p.x > 4]
+
+
+def test_from_batches_rechunks_and_converts_dtype():
+    batches = [Vector3Array(POINTS[:3]), Vector3Array(POINTS[3:4]), Vector3Array(POINTS[4:])]
+    stream = Stream.from_batches(batches, chunk_size=4, dtype="float32")
+    assert [len(chunk) for chunk in stream.batches()] == [4, 4, 2]
+    assert all(chunk.dtype == "float32" for chunk in stream.batches())
+    assert list(stream) == POINTS
+    with pytest.raises(TypeError):
+        Stream.from_batches([Vector3Array(POINTS), Vector2Array([Vector2(1, 2)])]).collect()
+
+
+def test_reduce():
+    total = Stream(POINTS, chunk_size=3).reduce(lambda acc, chunk: acc + sum(chunk.norm()), 0.0)
+    assert total == pytest.approx(sum(p.norm() for p in POINTS))
+
+
+def test_empty_streams():
+    assert list(Stream([])) == []
+    assert Stream([]).count() == 0
+    assert Stream(Vector3Array()).count() == 0
+    assert Stream.from_batches([]).reduce(lambda acc, chunk: acc + 1, 0) == 0
+    with pytest.raises(ValueError):
+        Stream([]).collect()
+    emptied = Stream(POINTS, chunk_size=3).filter(lambda vector: False)
+    assert list(emptied.batches()) == []
+    with pytest.raises(ValueError):
+        emptied.collect()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Stream(POINTS, chunk_size=0)
+    with pytest.raises(ValueError):
+        Stream(POINTS, dtype="int32")
+    with pytest.raises(TypeError):
+        Stream([1, 2, 3]).count()
+    with pytest.raises(TypeError):
+        Stream(POINTS).map(lambda vector: vector.norm()).count()
@@ -0,0 +1,152 @@
+import pickle
+from math import pi
+
+import pytest
+
+from Vector import Vector2, Vector3, Vector4, Vector3Array
+
+
+@pytest.mark.parametrize("vector", [Vector2(1, 2), Vector3(1, 2, 3), Vector4(1, 2, 3, 4)])
+def test_vectors_have_no_instance_dict(vector):
+    assert not hasattr(vector, "__dict__")
+    with pytest.raises(AttributeError):
+        vector.extra = 1.0
+
+
+def test_indexing_and_iteration():
+    vector = Vector4(1, 2, 3, 4)
+    assert tuple(vector) == (1.0, 2.0, 3.0, 4.0)
+    assert [vector[i] for i in range(4)] == [1.0, 2.0, 3.0, 4.0]
+    with pytest.raises(IndexError):
+        vector[4]
+
+
+def test_components_are_stored_as_float():
+    vector = Vector3(1, 2, 3)
+    vector.x = 5
+    assert type(vector.x) is float
+    assert vector == Vector3(5.0, 2.0, 3.0)
+    with pytest.raises(TypeError):
+        Vector2("1", 2)
+
+
+def test_arithmetic():
+    a, b = Vector3(1, 2, 3), Vector3(4, 5, 6)
+    assert a + b == Vector3(5, 7, 9)
+    assert a - b == Vector3(-3, -3, -3)
+    assert a * b == 32.0
+    assert a @ b == Vector3(-3, 6, -3)
+    assert -a == Vector3(-1, -2, -3)
+    assert Vector2(3, 4).norm() == 5.0
+    with pytest.raises(TypeError):
+        a + Vector2(1, 2)
+
+
+def test_pickle_round_trip():
+    for vector in (Vector2(1, 2), Vector3(1, 2, 3), Vector4(1, 2, 3, 4)):
+        restored = pickle.loads(pickle.dumps(vector))
+        assert type(restored) is type(vector)
+        assert restored == vector
+
+
+class _Reflected:
+    """좌항의 연산자가 NotImplemented를 반환할 때만 불리는 반사 연산자를 가진 객체."""
+
+    def __radd__(self, other):
+        return ("radd", other)
+
+    def __rsub__(self, other):
+        return ("rsub", other)
+
+    def __rmul__(self, other):
+        return ("rmul", other)
+
+    def __rmatmul__(self, other):
+        return ("rmatmul", other)
+
+    def __rtruediv__(self, other):
+        return ("rtruediv", other)
+
+
+def test_scalar_operands_on_both_sides():
+    vector = Vector3(1, 2, 4)
+    assert vector + 1 == 1 + vector == Vector3(2, 3, 5)
+    assert 8 - vector == Vector3(7, 6, 4)
+    assert 8 / vector == Vector3(8, 4, 2)
+    assert 2 * vector == vector * 2 == 14.0
+    assert 2 @ vector == -(vector @ 2)
+
+
+def test_foreign_operands_fall_back_to_reflected_operators():
+    vector, other = Vector2(1, 2), _Reflected()
+    assert vector + other == ("radd", vector)
+    assert vector - other == ("rsub", vector)
+    assert vector * other == ("rmul", vector)
+    assert vector / other == ("rtruediv", vector)
+    assert Vector3(1, 2, 3) @ other == ("rmatmul", Vector3(1, 2, 3))
+    vector += other
+    assert vector == ("radd", Vector2(1, 2))
+
+
+def test_unsupported_operands_raise_type_error():
+    with pytest.raises(TypeError):
+        Vector2(1, 2) + "a"
+    with pytest.raises(TypeError):
+        "a" + Vector2(1, 2)
+    with pytest.raises(TypeError):
+        Vector3(1, 2, 3) @ Vector2(1, 2)
+    with pytest.raises(TypeError):
+        Vector2(1, 2) * Vector3(1, 2, 3)
+
+
+def test_vector_and_batch_in_both_orders():
+    vector = Vector3(1, 2, 3)
+    points = [Vector3(4, 5, 6), Vector3(-1, 0.5, 2)]
+    batch = Vector3Array(points)
+    assert list(vector + batch) == [vector + p for p in points]
+    assert list(batch + vector) == [p + vector for p in points]
+    assert list(vector - batch) == [vector - p for p in points]
+    assert list(vector / batch) == [vector / p for p in points]
+    assert list(vector @ batch) == [vector @ p for p in points]
+    assert list(batch @ vector) == [p @ vector for p in points]
+    assert list(vector * batch) == [vector * p for p in points]
+    assert list(2 @ batch) == [2 @ p for p in points]
+    with pytest.raises(TypeError):
+        Vector2(1, 2) + batch
+
+
+def test_vector_and_numpy_array_in_both_orders():
+    numpy = pytest.importorskip("numpy")
+    vector = Vector3(1, 2, 3)
+    assert (vector + numpy.ones(3)).tolist() == [2.0, 3.0, 4.0]
+    assert (numpy.ones(3) + vector).tolist() == [2.0, 3.0, 4.0]
+
+
+def test_inplace_operators_mutate_the_same_object():
+    vector = Vector3(2, 4, 8)
+    alias = vector
+    vector += Vector3(1, 1, 1)
+    vector -= 1
+    vector *= Vector3(2, 1, 0.5)
+    vector /= 2
+    assert vector is alias
+    assert vector == Vector3(2, 2, 2)
+    vector //= Vector3(0.5, 1, 3)
+    vector %= 3
+    assert vector == Vector3(1, 2, 0)
+    with pytest.raises(TypeError):
+        vector += Vector2(1, 2)
+
+
+def test_distance_dot_and_angle_kernels():
+    a, b = Vector3(1, 2, 3), Vector3(-2, 0.5, 4)
+    assert a.dot(b) == a * b
+    assert a.norm_squared() == a * a
+    assert a.distance(b) == pytest.approx((a - b).norm())
+    assert a.distance_squared(b) == pytest.approx((a - b).norm_squared())
+    assert Vector2(1, 0).angle_between(Vector2(0, 2)) == pytest.approx(pi / 2)
+    assert Vector2(1, 1).angle_between(Vector2(2, 2)) == 0.0
+    with pytest.raises(ValueError):
+        a.angle_between(Vector3())
+    with pytest.raises(TypeError):
+        a.distance(Vector2(1, 2))
@@ -0,0 +1,94 @@
+import pickle
+import subprocess
+import sys
+from math import sqrt
+
+import pytest
+
+from Vector import Vector3, VectorN, VectorNArray
+
+A = (1, 2, 3, 4, 5, 6)
+B = (-2, 0.5, 4, 1, -3, 2)
+
+
+def test_constructor_picks_the_class_of_its_dimension():
+    vector = VectorN(*A)
+    assert type(vector) is VectorN.of(6)
+    assert type(vector).__name__ == "VectorN6"
+    assert VectorN.of(6) is VectorN.of(6)
+    assert vector.demention == 6
+    assert tuple(VectorN.of(16)()) == (0.0,) * 16
+    assert not hasattr(vector, "__dict__")
+    with pytest.raises(ValueError):
+        VectorN.of(0)
+
+
+def test_generated_methods_match_hand_computation():
+    a, b = VectorN(*A), VectorN(*B)
+    assert tuple(a + b) == tuple(x + y for x, y in zip(A, B))
+    assert tuple(a - b) == tuple(x - y for x, y in zip(A, B))
+    assert tuple(a / 2) == tuple(x / 2 for x in A)
+    assert tuple(2 - a) == tuple(2 - x for x in A)
+    assert a * b == sum(x * y for x, y in zip(A, B))
+    assert a.norm() == pytest.approx(sqrt(sum(x * x for x in A)))
+    assert a.distance(b) == pytest.approx(sqrt(sum((x - y) ** 2 for x, y in zip(A, B))))
+    assert tuple(-a) == tuple(-x for x in A)
+    assert a == VectorN(*A) and a != b
+
+
+def test_indexing_and_item_assignment():
+    vector = VectorN(*A)
+    vector[5] = 10
+    assert vector[5] == 10.0
+    assert tuple(vector) == (1, 2, 3, 4, 5, 10)
+    with pytest.raises(IndexError):
+        vector[6]
+
+
+def test_other_dimensions_are_rejected():
+    with pytest.raises(TypeError):
+        VectorN(*A) + VectorN(1, 2, 3, 4, 5)
+    with pytest.raises(TypeError):
+        VectorN(1, 2, 3) + Vector3(1, 2, 3)
+
+
+def test_pickle_round_trip():
+    vector = VectorN(*A)
+    restored = pickle.loads(pickle.dumps(vector))
+    assert type(restored) is VectorN.of(6)
+    assert restored == vector
+
+
+def test_pickle_loads_in_a_fresh_process():
+    # 새 프로세스에는 VectorN7 클래스가 아직 생성되어 있지 않음
+    data = pickle.dumps([VectorN(*A, 7), VectorNArray.of(7)([VectorN(*A, 7)])])
+    script = "import pickle, sys; v, b = pickle.loads(sys.stdin.buffer.read()); print(tuple(v), len(b))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], input=data, capture_output=True, check=True
+    ).stdout
+    assert output.decode().strip() == f"{tuple(float(x) for x in (*A, 7))} 1"
+
+
+def test_batch_matches_scalar_vectors():
+    batch_type = VectorNArray.of(6)
+    assert batch_type is VectorNArray.of(6)
+    assert batch_type.__name__ == "VectorN6Array"
+    points, others = [VectorN(*A), VectorN(*B)], [VectorN(*B), VectorN(*A)]
+    batch, other = batch_type(points), batch_type(others)
+    assert list(batch + other) == [a + b for a, b in zip(points, others)]
+    assert list(batch * other) == [a * b for a, b in zip(points, others)]
+    assert list(batch.norm()) == [a.norm() for a in points]
+    assert list(3 - batch) == [3 - a for a in points]
+    restored = pickle.loads(pickle.dumps(batch))
+    assert type(restored) is batch_type
+    assert list(restored) == points
+
+
+def test_batch_requires_a_dimension():
+    with pytest.raises(TypeError):
+        VectorNArray([VectorN(*A)])
+    with pytest.raises(ValueError):
+        VectorNArray.of(-1)
+    assert len(VectorNArray.of(6)()) == 0
+    with pytest.raises(TypeError):
+        VectorNArray.of(6)([VectorN(1, 2, 3)])